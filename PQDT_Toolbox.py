@@ -7,21 +7,91 @@
 
 import os
 import re
+import sys
+import json
+import subprocess
+
+# ==============================================================================
+# HELPER PRIVILEGIADO - LAÇO DO PROCESSO ELEVADO (ANTES DOS IMPORTS DA GUI)
+# ==============================================================================
+# Executado como root via sudo/pkexec: sai aqui, sem carregar ttkbootstrap/PIL nem abrir os arquivos de log.
+SERVICE_HELPER_FLAG = "--service-helper"
+SYSTEMD_UNIT_NAME_REGEX = re.compile(r"^[A-Za-z0-9][A-Za-z0-9:_.@\-]*\.service$")
+# Operações aceitas pelo helper -> argumentos fixos do systemctl (as unidades vão depois de '--')
+SERVICE_HELPER_OPERATIONS = {
+    "start": ["start"],
+    "stop": ["stop"],
+    "is-active": ["is-active"],
+    "show": ["show", "-p", "Id,LoadState,ActiveState,SubState,MainPID"],
+    "list-units": ["list-units", "--type=service", "--all", "--no-legend", "--no-pager"],
+}
+
+
+def run_service_helper():
+    """
+    Laço do helper (executado como root via sudo/pkexec com SERVICE_HELPER_FLAG).
+    Lê pedidos JSON por linha no stdin ({"id", "op", "units"}) e responde no stdout
+    ({"id", "returncode", "stdout", "stderr"} ou {"id", "error"}). Só executa as operações da lista branca,
+    com nomes de unidade validados e sem shell.
+    """
+    protocol_out = sys.stdout
+    sys.stdout = sys.stderr  # nada além das respostas pode ir para o canal do protocolo
+    for line in sys.stdin:
+        try:
+            request = json.loads(line)
+            request_id, op, units = request.get("id"), request.get("op"), request.get("units") or []
+        except (ValueError, AttributeError):
+            continue
+        if op == "ping":
+            response = {"id": request_id, "returncode": 0, "stdout": str(os.geteuid()), "stderr": ""}
+        elif op not in SERVICE_HELPER_OPERATIONS:
+            response = {"id": request_id, "error": f"operação não permitida: {op!r}"}
+        elif bool(units) != (op != "list-units") or not all(
+                isinstance(unit, str) and SYSTEMD_UNIT_NAME_REGEX.match(unit) for unit in units):
+            response = {"id": request_id, "error": f"unidades inválidas para '{op}': {units!r}"}
+        else:
+            try:
+                cmd = ['systemctl'] + SERVICE_HELPER_OPERATIONS[op] + (['--'] + units if units else [])
+                result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+                response = {"id": request_id, "returncode": result.returncode, "stdout": result.stdout,
+                            "stderr": result.stderr}
+            except (subprocess.TimeoutExpired, OSError) as e:
+                response = {"id": request_id, "error": str(e)}
+        protocol_out.write(json.dumps(response) + "\n")
+        protocol_out.flush()
+    return 0
+
+
+if __name__ == '__main__' and SERVICE_HELPER_FLAG in sys.argv:
+    sys.exit(run_service_helper())
+
 import time
 import threading
 import random
-import json
-import subprocess
+import csv
+import shlex
+import signal
 import sqlite3
 import logging
 import platform
 import tkinter as tk
 from tkinter import simpledialog, messagebox
-import sys
 import webbrowser
-from datetime import datetime
+from datetime import datetime, timedelta
 import shutil
+import multiprocessing
+import heapq
+import bisect
+import queue
+import asyncio
+import socket
+import struct
+import zlib
+import urllib.request
+import urllib.error
 from collections import deque
+from array import array
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
 
 # --- Tratamento de Dependências Opcionais ---
 try:
@@ -48,6 +118,21 @@ try:
 except ImportError:
     PYWIN32_AVAILABLE = False
 
+try:
+    import win32service
+
+    WIN32SERVICE_AVAILABLE = True
+except ImportError:
+    WIN32SERVICE_AVAILABLE = False
+
+try:
+    from jeepney import DBusAddress, HeaderFields, MatchRule, Properties, new_method_call, message_bus
+    from jeepney.io.blocking import open_dbus_connection
+
+    JEEPNEY_AVAILABLE = True
+except ImportError:
+    JEEPNEY_AVAILABLE = False
+
 SYSTEMCTL_AVAILABLE = platform.system() == "Linux" and shutil.which('systemctl') is not None
 
 # --- Módulos Tkinter ---
@@ -101,6 +186,49 @@ BACKGROUND_ALPHA_MULTIPLIER = 0.15
 ICON_PATH = resource_path(ICON_FILENAME)
 BACKGROUND_IMAGE_PATH = resource_path(BACKGROUND_IMAGE_FILENAME)
 
+# Pastas de sessão criadas pelo servidor a cada inicialização (ex.: logs_2024-05-01_20-00-00)
+LOG_SESSION_FOLDER_REGEX = re.compile(r"^logs_\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2}$")
+
+# ActiveState do systemd -> status interno usado pelas abas
+SYSTEMD_ACTIVE_STATE_STATUS = {"active": "RUNNING", "reloading": "RUNNING", "activating": "START_PENDING",
+                               "deactivating": "STOP_PENDING", "failed": "FAILED", "inactive": "STOPPED"}
+
+# Máximo de linhas exibidas de uma vez no diálogo de seleção de serviço (o filtro estreita o resto)
+SERVICE_DIALOG_MAX_ROWS = 300
+
+# Colunas (nome, tipo) das tabelas do banco de jogadores aceitas na exportação/importação em massa.
+PLAYER_DB_TABLE_COLUMNS = {
+    "players": (("Player_Nickname", str), ("Bohemia_ID", str)),
+    "identities": (("Bohemia_ID", str), ("Last_Nickname", str), ("First_Seen", float), ("Last_Seen", float),
+                   ("Total_Seconds", float), ("Session_Count", int)),
+    "sessions": (("Bohemia_ID", str), ("Player_Nickname", str), ("Source", str), ("Join_TS", float),
+                 ("Leave_TS", float), ("Duration_S", float)),
+}
+# Índices não únicos removidos durante importações grandes e recriados no final.
+# Os índices únicos ficam, pois são eles que resolvem os conflitos (INSERT OR IGNORE / ON CONFLICT).
+PLAYER_DB_SECONDARY_INDEXES = {
+    "players": {"idx_players_bohemia_id": "CREATE INDEX IF NOT EXISTS idx_players_bohemia_id ON players (Bohemia_ID)"},
+    "identities": {
+        "idx_identities_total": "CREATE INDEX IF NOT EXISTS idx_identities_total ON identities (Total_Seconds)"},
+    "sessions": {"idx_sessions_leave": "CREATE INDEX IF NOT EXISTS idx_sessions_leave ON sessions (Leave_TS)"},
+}
+PLAYERS_FTS_TRIGGERS_SQL = """
+    CREATE TRIGGER IF NOT EXISTS players_fts_ai AFTER INSERT ON players BEGIN
+        INSERT INTO players_fts (rowid, Player_Nickname) VALUES (new.rowid, new.Player_Nickname);
+    END;
+    CREATE TRIGGER IF NOT EXISTS players_fts_ad AFTER DELETE ON players BEGIN
+        INSERT INTO players_fts (players_fts, rowid, Player_Nickname)
+        VALUES ('delete', old.rowid, old.Player_Nickname);
+    END;
+    CREATE TRIGGER IF NOT EXISTS players_fts_au AFTER UPDATE ON players BEGIN
+        INSERT INTO players_fts (players_fts, rowid, Player_Nickname)
+        VALUES ('delete', old.rowid, old.Player_Nickname);
+        INSERT INTO players_fts (rowid, Player_Nickname) VALUES (new.rowid, new.Player_Nickname);
+    END;
+"""
+# Arquivos a partir deste tamanho são importados sem os índices secundários (recriados ao final).
+PLAYER_DB_IMPORT_REBUILD_BYTES = 16 * 1024 * 1024
+
 
 # ==============================================================================
 # SISTEMA DE TRADUÇÃO (I18N)
@@ -201,9 +329,9 @@ class I18N:
                 "btn_next": "Próximo", "btn_previous": "Anterior", "btn_close_search": "X",
                 "chk_auto_scroll": "Rolar Auto.",
                 "chk_system_log_auto_scroll": "Rolar Auto.", "lbl_stop_delay": "Delay Parar Serviço (s):",
-                "tooltip_stop_delay_win": "Tempo (s) para aguardar após comando de parada do serviço.",
+                "tooltip_stop_delay_win": "Tempo máximo (s) de espera pela parada do serviço; o início ocorre assim que a parada é confirmada.",
                 "lbl_start_delay": "Delay Iniciar Serviço (s):",
-                "tooltip_start_delay_win": "Tempo (s) para aguardar o serviço iniciar completamente.",
+                "tooltip_start_delay_win": "Tempo máximo (s) de espera pelo padrão de 'servidor pronto' no log (ou espera fixa, se não houver padrão).",
                 "dialog_select_folder_title": "Selecione a pasta de logs para '{server}'",
                 "dialog_unsupported_os_title": "Não Suportado",
                 "dialog_unsupported_os_msg": "Gerenciamento de serviços não suportado em {os}.",
@@ -259,13 +387,13 @@ class I18N:
                 "restarter_lbl_restart_delay": "Delay para Reiniciar após Gatilho (s):",
                 "tooltip_restarter_restart_delay": "Tempo (s) para aguardar ANTES de iniciar o processo de reinício, após o gatilho ser detectado.",
                 "restarter_scheduled_predefined": "Horários Pré-definidos (HH:00)",
-                "restarter_scheduled_custom": "Horários Personalizados (HH:MM)",
-                "restarter_scheduled_new": "Novo (HH:MM):",
-                "tooltip_restarter_custom_time": "Digite o horário no formato HH:MM (ex: 08:30, 22:15)",
+                "restarter_scheduled_custom": "Agendamentos Personalizados (HH:MM, cron ou data)",
+                "restarter_scheduled_new": "Novo:",
+                "tooltip_restarter_custom_time": "HH:MM (todo dia, ex: 08:30), cron de 5 campos 'min hora dia mês dia-semana' (ex: '0 */6 * * mon-fri', '0 5 * * mon,thu') ou data única 'AAAA-MM-DD HH:MM'",
                 "restarter_btn_add": "+ Adicionar", "restarter_btn_remove": "- Remover Selecionado",
                 "tooltip_restarter_btn_remove": "Remove o horário personalizado selecionado na lista.",
                 "dialog_invalid_time_format_title": "Formato Inválido",
-                "dialog_invalid_time_format_msg": "Horário '{time}' inválido. Use o formato HH:MM.",
+                "dialog_invalid_time_format_msg": "Agendamento '{time}' inválido. Use HH:MM, uma expressão cron de 5 campos ou AAAA-MM-DD HH:MM.",
                 "dialog_duplicate_time_title": "Horário Duplicado",
                 "dialog_duplicate_time_msg": "O horário '{time}' já está na lista.",
                 "dialog_no_selection_title": "Nenhuma Seleção",
@@ -340,6 +468,147 @@ class I18N:
                 "col_type": "Tipo",
                 "col_title": "Título",
                 "col_message": "Mensagem",
+                # Backfill de jogadores
+                "menu_player_backfill": "Importar Jogadores dos Logs Antigos...",
+                "backfill_title": "Backfill de Jogadores",
+                "backfill_already_running": "Um backfill já está em andamento.",
+                "backfill_no_folders": "Nenhuma pasta de logs válida configurada nas abas.",
+                "backfill_scanning": "Procurando pastas de sessão...",
+                "backfill_progress": "Pastas: {done}/{total} | Jogadores novos: {new}",
+                "backfill_done": "Backfill concluído: {done}/{total} pasta(s), {new} jogador(es) novo(s).",
+                "backfill_cancelled": "Backfill cancelado: {done}/{total} pasta(s), {new} jogador(es) novo(s). Execute novamente para continuar.",
+                # Busca de jogadores
+                "menu_player_search": "Buscar Jogadores...",
+                "player_search_title": "Busca de Jogadores",
+                "player_search_prompt": "Nickname ou Bohemia ID:",
+                "player_search_top_week": "Top 7 dias",
+                "player_search_loading": "Buscando...",
+                "player_search_status": "{count} resultado(s) carregado(s) ({ms} ms). Role até o fim para carregar mais.",
+                "player_search_top_week_status": "Top {count} jogador(es) por tempo de jogo nos últimos 7 dias.",
+                "player_col_nickname": "Nickname",
+                "player_col_bohemia_id": "Bohemia ID",
+                "player_col_last_seen": "Último acesso",
+                "player_col_playtime": "Tempo de jogo",
+                # Importação/exportação do banco de jogadores
+                "menu_player_db_transfer": "Banco de Jogadores",
+                "menu_player_export_players": "Exportar Jogadores (CSV/JSONL)...",
+                "menu_player_export_identities": "Exportar Identidades (CSV/JSONL)...",
+                "menu_player_export_sessions": "Exportar Sessões (CSV/JSONL)...",
+                "menu_player_import": "Importar/Mesclar Arquivos (CSV/JSONL)...",
+                "player_transfer_title": "Banco de Jogadores - Importar/Exportar",
+                "player_transfer_running": "Uma importação/exportação já está em andamento.",
+                "player_transfer_progress": "Linhas processadas: {rows}",
+                "player_transfer_cancelled": "Operação cancelada. Na importação, os lotes já gravados são mantidos (importar de novo é seguro).",
+                "player_transfer_error": "Falha na importação/exportação: {error}",
+                "player_export_done": "Exportação concluída: {rows} linha(s) de '{table}' em {file}.",
+                "player_import_done": "Importação concluída: {files} arquivo(s), {rows} linha(s) lida(s), {skipped} ignorada(s).",
+                # Lista de observação (banidos/observados)
+                "menu_player_watchlist_reload": "Recarregar Lista de Observação",
+                "watchlist_title": "Lista de Observação",
+                "watchlist_hit_title": "Jogador da Lista de Observação!",
+                "watchlist_hit_msg": "{nickname} ({bohemia_id}) entrou em '{server}'. Motivo: {reason}",
+                "watchlist_reloaded": "Lista de observação recarregada: {count} ID(s).",
+                "watchlist_not_found": "Arquivo da lista de observação não encontrado: {file}",
+                # Prontidão do servidor pelo log
+                "lbl_ready_pattern": "Padrão de 'Servidor Pronto' no Log (Regex):",
+                "tooltip_ready_pattern": "Após iniciar o serviço, o log da nova sessão é lido até esta linha aparecer. O Delay Iniciar passa a ser apenas o tempo máximo de espera. Deixe vazio para usar só o delay fixo.",
+                "log_waiting_ready": "Aguardando o servidor ficar pronto (máx. {timeout}s)...",
+                "log_server_ready": "Servidor pronto em {elapsed}s.",
+                "log_ready_timeout": "Padrão de prontidão não encontrado em {timeout}s; continuando.",
+                # Confirmação de parada do serviço
+                "log_waiting_stop": "Aguardando a parada do serviço (máx. {timeout}s)...",
+                "log_stop_confirmed": "Parada confirmada em {elapsed}s.",
+                "log_stop_timeout": "A parada não foi confirmada em {timeout}s; iniciando mesmo assim.",
+                "log_restart_cancelled": "Reinício cancelado.",
+                # Fila de reinícios
+                "restart_type_manual": "manual",
+                "log_restart_queued": "Reinício enfileirado (posição {position} na fila de reinícios).",
+                "menu_restart_current_server": "Reiniciar Servidor Atual",
+                "warn_no_service_to_restart": "Selecione um serviço nesta aba antes de reiniciar.",
+                "menu_restart_queue": "Fila de Reinícios...",
+                "restart_queue_title": "Fila de Reinícios",
+                "restart_queue_limits": "Até {max} reinício(s) simultâneo(s), com {stagger}s entre inícios e cooldown de {cooldown}s por serviço.",
+                "restart_queue_col_server": "Servidor",
+                "restart_queue_col_service": "Serviço",
+                "restart_queue_col_kind": "Tipo",
+                "restart_queue_col_state": "Estado",
+                "restart_queue_col_time": "Tempo",
+                "restart_queue_running": "Em execução",
+                "restart_queue_waiting": "Na fila",
+                "restart_queue_col_collapsed": "Agrupados",
+                "log_restart_collapsed_in_flight": "Reinício já em andamento para este serviço; pedido ignorado ({count} agrupado(s) no total).",
+                "log_restart_collapsed_cooldown": "Serviço reiniciado há pouco (cooldown); pedido ignorado ({count} agrupado(s) no total).",
+                # Backend de processo filho
+                "lbl_process_command": "Comando do Servidor como Processo Filho (opcional):",
+                "tooltip_process_command": "Preencha para a ferramenta iniciar o servidor diretamente (sem systemd/sc), como o serviço 'process:<aba>'. A saída é lida do processo em tempo real e a parada envia SIGTERM e, após o Delay Parar, SIGKILL. Deixe vazio para usar um serviço do sistema.",
+                "log_executing_process_start": "Iniciando processo filho '{service}'...",
+                "log_executing_process_stop": "Parando processo filho '{service}' (SIGTERM, depois SIGKILL)...",
+                # Filtro do diálogo de serviços
+                "dialog_service_filter_count": "Mostrando {shown} de {matches} resultado(s) ({total} serviços). Digite para filtrar.",
+                # Estatísticas dos backends de serviço
+                "menu_service_backend_stats": "Estatísticas dos Backends de Serviço",
+                "service_stats_title": "Backends de Serviço",
+                "service_stats_backend": "Backend '{backend}':",
+                "service_stats_line": "  {op}: {calls} chamada(s), média {avg} ms, máx {max} ms (total {total} ms)",
+                "service_stats_empty": "  nenhuma operação ainda",
+                # Amostragem de recursos (/proc)
+                "lbl_rss_limit": "Reiniciar se a memória (RSS) passar de (GB, 0 = desativado):",
+                "tooltip_rss_limit": "O processo principal do serviço é amostrado via /proc (Linux). Se a memória residente ficar acima deste valor pelo tempo indicado, o servidor é reiniciado pela fila de reinícios.",
+                "lbl_rss_limit_minutes": "por (min):",
+                "resource_summary": "CPU {cpu}% {cpu_spark}   RSS {rss} GB {rss_spark}",
+                "resource_io": "   E/S: leitura {read} MB/s, escrita {write} MB/s",
+                "log_rss_limit_restart": "Memória do servidor em {rss} GB, acima de {limit} GB por {minutes} min. Solicitando reinício.",
+                # Sondagem A2S (UDP)
+                "lbl_a2s_address": "Sondagem A2S (host:porta de consulta):",
+                "tooltip_a2s_address": "Endereço da porta de consulta Steam (A2S) do servidor, ex.: 127.0.0.1:17777. Vazio desativa a sondagem. Todos os servidores são sondados em paralelo por UDP.",
+                "lbl_a2s_max_missed": "Reiniciar após falhas seguidas (0 = nunca):",
+                "probe_summary": "A2S: {latency} ms, {players}/{max_players} jogadores, mapa {map}",
+                "probe_no_response": "A2S: sem resposta ({missed} seguidas)",
+                "log_a2s_unresponsive_restart": "Servidor não respondeu a {missed} sondagens A2S seguidas (possível travamento). Solicitando reinício.",
+                # Watchdog de silêncio do log
+                "lbl_log_silence": "Log em silêncio por (min, 0 = desativado):",
+                "tooltip_log_silence": "Se o servidor (com o serviço ativo) não escrever nenhuma linha de log por este tempo, provavelmente travou. A ação escolhida ao lado é executada.",
+                "log_silence_action_notify": "Apenas avisar",
+                "log_silence_action_restart": "Reiniciar o servidor",
+                "dialog_log_silence_title": "Log em silêncio: {server}",
+                "dialog_log_silence_msg": "Nenhuma linha de log há {minutes} min. O servidor pode estar travado.",
+                "log_silence_restart": "Nenhuma linha de log há {minutes} min (possível travamento). Solicitando reinício.",
+                # Histórico de reinícios
+                "restart_stats_summary": "Reinícios: {count} | indisponibilidade p50 {p50}s, p95 {p95}s",
+                "restart_stats_empty": "Reinícios: sem histórico ainda",
+                "menu_restart_history_export": "Exportar Histórico de Reinícios (CSV)...",
+                "restart_history_export_done": "{rows} reinício(s) exportado(s) para '{file}'.",
+                "restart_history_export_error": "Falha ao exportar o histórico de reinícios: {error}",
+                # Prévia dos agendamentos
+                "restarter_scheduled_preview": "Próximos reinícios:",
+                "restarter_scheduled_preview_none": "Próximos reinícios: nenhum agendado",
+                # Horários perdidos
+                "restarter_scheduled_missed": "Horários Perdidos (host suspenso, relógio ajustado ou ferramenta fechada)",
+                "schedule_missed_run_late": "Executar uma vez com atraso",
+                "schedule_missed_skip": "Pular",
+                "tooltip_schedule_missed_policy": "O que fazer com um reinício agendado que não pôde ser disparado no horário. Várias ocorrências perdidas contam como uma; fora da tolerância, ela é sempre pulada.",
+                "lbl_schedule_grace": "Tolerância (min):",
+                "log_scheduled_restart_late": "Reinício agendado das {time} perdido há {minutes} min; executando agora.",
+                "log_scheduled_restart_skipped": "Reinício agendado das {time} perdido há {minutes} min; pulado.",
+                # Avisos RCon antes do reinício
+                "lbl_rcon_address": "RCon BattlEye (host:porta):",
+                "tooltip_rcon_address": "Endereço RCon do servidor (ex.: 127.0.0.1:19999). Com endereço e senha, os reinícios agendados, por gatilho e após a votação de mapa avisam os jogadores antes.",
+                "lbl_rcon_password": "Senha:",
+                "lbl_restart_warning_stages": "Avisar antes do reinício:",
+                "tooltip_restart_warning_stages": "Antecedências separadas por vírgula, em segundos ou com sufixo m/s (ex.: 5m,1m,10s). Reinícios agendados começam a avisar antes do horário; os por gatilho não são adiados e só enviam os estágios que cabem no atraso do gatilho; o da votação de mapa ocorre após o maior estágio.",
+                "lbl_restart_warning_message": "Mensagem ({time}):",
+                "log_rcon_warning_sent": "Aviso RCon enviado: {message}",
+                "log_rcon_warning_failed": "Falha ao enviar aviso RCon: {error}",
+                # Webhook de notificações
+                "menu_webhook": "Webhook de Notificações...",
+                "dialog_webhook_url_prompt": "URL do webhook (compatível com Discord) para reinícios, vencedores do votemap e falhas. Deixe vazio para desativar:",
+                "dialog_webhook_url_invalid": "A URL do webhook deve começar com http:// ou https://.",
+                "webhook_test_message": "Webhook de notificações configurado.",
+                # Falha antes do envio do reinício
+                "log_restart_request_error": "Erro ao preparar o reinício (reserva desfeita): {error}",
+                # Backend simulado (testes)
+                "log_executing_fake_start": "Iniciando serviço simulado '{service}'...",
+                "log_executing_fake_stop": "Parando serviço simulado '{service}'...",
             },
             'en-us': {
                 # Main App & Menus
@@ -403,9 +672,9 @@ class I18N:
                 "btn_next": "Next", "btn_previous": "Previous", "btn_close_search": "X",
                 "chk_auto_scroll": "Auto-scroll",
                 "chk_system_log_auto_scroll": "Auto-scroll", "lbl_stop_delay": "Stop Service Delay (s):",
-                "tooltip_stop_delay_win": "Time (s) to wait after the service stop command.",
+                "tooltip_stop_delay_win": "Maximum time (s) to wait for the service to stop; it starts again as soon as the stop is confirmed.",
                 "lbl_start_delay": "Start Service Delay (s):",
-                "tooltip_start_delay_win": "Time (s) to wait for the service to fully start.",
+                "tooltip_start_delay_win": "Maximum time (s) to wait for the 'server ready' log pattern (or a fixed wait if no pattern is set).",
                 "dialog_select_folder_title": "Select the logs folder for '{server}'",
                 "dialog_unsupported_os_title": "Unsupported",
                 "dialog_unsupported_os_msg": "Service management is not supported on {os}.",
@@ -459,13 +728,13 @@ class I18N:
                 "restarter_lbl_restart_delay": "Delay to Restart After Trigger (s):",
                 "tooltip_restarter_restart_delay": "Time (s) to wait BEFORE starting the restart process, after the trigger is detected.",
                 "restarter_scheduled_predefined": "Predefined Times (HH:00)",
-                "restarter_scheduled_custom": "Custom Times (HH:MM)",
-                "restarter_scheduled_new": "New (HH:MM):",
-                "tooltip_restarter_custom_time": "Enter the time in HH:MM format (e.g., 08:30, 22:15)",
+                "restarter_scheduled_custom": "Custom Schedules (HH:MM, cron or date)",
+                "restarter_scheduled_new": "New:",
+                "tooltip_restarter_custom_time": "HH:MM (daily, e.g. 08:30), a 5-field cron 'min hour day month weekday' (e.g. '0 */6 * * mon-fri', '0 5 * * mon,thu') or a one-off date 'YYYY-MM-DD HH:MM'",
                 "restarter_btn_add": "+ Add", "restarter_btn_remove": "- Remove Selected",
                 "tooltip_restarter_btn_remove": "Removes the selected custom time from the list.",
                 "dialog_invalid_time_format_title": "Invalid Format",
-                "dialog_invalid_time_format_msg": "Time '{time}' is invalid. Use HH:MM format.",
+                "dialog_invalid_time_format_msg": "Schedule '{time}' is invalid. Use HH:MM, a 5-field cron expression or YYYY-MM-DD HH:MM.",
                 "dialog_duplicate_time_title": "Duplicate Time",
                 "dialog_duplicate_time_msg": "The time '{time}' is already in the list.",
                 "dialog_no_selection_title": "No Selection", "dialog_no_selection_msg": "Select a time to remove.",
@@ -538,9 +807,281 @@ class I18N:
                 "col_type": "Type",
                 "col_title": "Title",
                 "col_message": "Message",
+                # Player backfill
+                "menu_player_backfill": "Backfill Players from Old Logs...",
+                "backfill_title": "Player Backfill",
+                "backfill_already_running": "A backfill is already running.",
+                "backfill_no_folders": "No valid log folder is configured in the tabs.",
+                "backfill_scanning": "Looking for session folders...",
+                "backfill_progress": "Folders: {done}/{total} | New players: {new}",
+                "backfill_done": "Backfill finished: {done}/{total} folder(s), {new} new player(s).",
+                "backfill_cancelled": "Backfill cancelled: {done}/{total} folder(s), {new} new player(s). Run it again to resume.",
+                # Player search
+                "menu_player_search": "Search Players...",
+                "player_search_title": "Player Search",
+                "player_search_prompt": "Nickname or Bohemia ID:",
+                "player_search_top_week": "Top 7 days",
+                "player_search_loading": "Searching...",
+                "player_search_status": "{count} result(s) loaded ({ms} ms). Scroll to the end to load more.",
+                "player_search_top_week_status": "Top {count} player(s) by playtime in the last 7 days.",
+                "player_col_nickname": "Nickname",
+                "player_col_bohemia_id": "Bohemia ID",
+                "player_col_last_seen": "Last seen",
+                "player_col_playtime": "Playtime",
+                # Player database import/export
+                "menu_player_db_transfer": "Player Database",
+                "menu_player_export_players": "Export Players (CSV/JSONL)...",
+                "menu_player_export_identities": "Export Identities (CSV/JSONL)...",
+                "menu_player_export_sessions": "Export Sessions (CSV/JSONL)...",
+                "menu_player_import": "Import/Merge Files (CSV/JSONL)...",
+                "player_transfer_title": "Player Database - Import/Export",
+                "player_transfer_running": "An import/export is already running.",
+                "player_transfer_progress": "Rows processed: {rows}",
+                "player_transfer_cancelled": "Operation cancelled. On import, batches already committed are kept (importing again is safe).",
+                "player_transfer_error": "Import/export failed: {error}",
+                "player_export_done": "Export finished: {rows} row(s) of '{table}' to {file}.",
+                "player_import_done": "Import finished: {files} file(s), {rows} row(s) read, {skipped} skipped.",
+                # Watch list (banned/flagged)
+                "menu_player_watchlist_reload": "Reload Watch List",
+                "watchlist_title": "Watch List",
+                "watchlist_hit_title": "Watch List Player Joined!",
+                "watchlist_hit_msg": "{nickname} ({bohemia_id}) joined '{server}'. Reason: {reason}",
+                "watchlist_reloaded": "Watch list reloaded: {count} ID(s).",
+                "watchlist_not_found": "Watch list file not found: {file}",
+                # Server readiness from the log
+                "lbl_ready_pattern": "'Server Ready' Log Pattern (Regex):",
+                "tooltip_ready_pattern": "After starting the service, the new session log is read until this line appears. The Start Delay becomes only the maximum wait. Leave empty to use just the fixed delay.",
+                "log_waiting_ready": "Waiting for the server to be ready (max {timeout}s)...",
+                "log_server_ready": "Server ready in {elapsed}s.",
+                "log_ready_timeout": "Ready pattern not found within {timeout}s; continuing.",
+                # Service stop confirmation
+                "log_waiting_stop": "Waiting for the service to stop (max {timeout}s)...",
+                "log_stop_confirmed": "Stop confirmed in {elapsed}s.",
+                "log_stop_timeout": "Stop was not confirmed within {timeout}s; starting anyway.",
+                "log_restart_cancelled": "Restart cancelled.",
+                # Restart queue
+                "restart_type_manual": "manual",
+                "log_restart_queued": "Restart queued (position {position} in the restart queue).",
+                "menu_restart_current_server": "Restart Current Server",
+                "warn_no_service_to_restart": "Select a service in this tab before restarting.",
+                "menu_restart_queue": "Restart Queue...",
+                "restart_queue_title": "Restart Queue",
+                "restart_queue_limits": "Up to {max} concurrent restart(s), {stagger}s apart, with a {cooldown}s cooldown per service.",
+                "restart_queue_col_server": "Server",
+                "restart_queue_col_service": "Service",
+                "restart_queue_col_kind": "Type",
+                "restart_queue_col_state": "State",
+                "restart_queue_col_time": "Time",
+                "restart_queue_running": "Running",
+                "restart_queue_waiting": "Queued",
+                "restart_queue_col_collapsed": "Collapsed",
+                "log_restart_collapsed_in_flight": "A restart is already in progress for this service; request ignored ({count} collapsed in total).",
+                "log_restart_collapsed_cooldown": "Service was restarted recently (cooldown); request ignored ({count} collapsed in total).",
+                # Child-process backend
+                "lbl_process_command": "Server Command as Child Process (optional):",
+                "tooltip_process_command": "Fill in to have the tool launch the server directly (no systemd/sc) as the 'process:<tab>' service. Output is read from the process in real time, and stopping sends SIGTERM, then SIGKILL after the Stop Delay. Leave empty to use a system service.",
+                "log_executing_process_start": "Starting child process '{service}'...",
+                "log_executing_process_stop": "Stopping child process '{service}' (SIGTERM, then SIGKILL)...",
+                # Service dialog filter
+                "dialog_service_filter_count": "Showing {shown} of {matches} match(es) ({total} services). Type to filter.",
+                # Service backend statistics
+                "menu_service_backend_stats": "Service Backend Statistics",
+                "service_stats_title": "Service Backends",
+                "service_stats_backend": "Backend '{backend}':",
+                "service_stats_line": "  {op}: {calls} call(s), avg {avg} ms, max {max} ms (total {total} ms)",
+                "service_stats_empty": "  no operations yet",
+                # Resource sampling (/proc)
+                "lbl_rss_limit": "Restart if memory (RSS) exceeds (GB, 0 = off):",
+                "tooltip_rss_limit": "The service's main process is sampled via /proc (Linux). If its resident memory stays above this value for the given time, the server is restarted through the restart queue.",
+                "lbl_rss_limit_minutes": "for (min):",
+                "resource_summary": "CPU {cpu}% {cpu_spark}   RSS {rss} GB {rss_spark}",
+                "resource_io": "   I/O: read {read} MB/s, write {write} MB/s",
+                "log_rss_limit_restart": "Server memory at {rss} GB, above {limit} GB for {minutes} min. Requesting restart.",
+                # A2S probing (UDP)
+                "lbl_a2s_address": "A2S probe (query host:port):",
+                "tooltip_a2s_address": "Address of the server's Steam query (A2S) port, e.g. 127.0.0.1:17777. Empty disables probing. All servers are probed concurrently over UDP.",
+                "lbl_a2s_max_missed": "Restart after consecutive misses (0 = never):",
+                "probe_summary": "A2S: {latency} ms, {players}/{max_players} players, map {map}",
+                "probe_no_response": "A2S: no response ({missed} in a row)",
+                "log_a2s_unresponsive_restart": "Server missed {missed} consecutive A2S probes (possible hang). Requesting restart.",
+                # Log-silence watchdog
+                "lbl_log_silence": "Log silent for (min, 0 = off):",
+                "tooltip_log_silence": "If the server (with its service running) writes no log line for this long, it is probably hung. The action chosen alongside is taken.",
+                "log_silence_action_notify": "Notify only",
+                "log_silence_action_restart": "Restart the server",
+                "dialog_log_silence_title": "Log silent: {server}",
+                "dialog_log_silence_msg": "No log line for {minutes} min. The server may be hung.",
+                "log_silence_restart": "No log line for {minutes} min (possible hang). Requesting restart.",
+                # Restart history
+                "restart_stats_summary": "Restarts: {count} | downtime p50 {p50}s, p95 {p95}s",
+                "restart_stats_empty": "Restarts: no history yet",
+                "menu_restart_history_export": "Export Restart History (CSV)...",
+                "restart_history_export_done": "Exported {rows} restart(s) to '{file}'.",
+                "restart_history_export_error": "Failed to export restart history: {error}",
+                # Schedule preview
+                "restarter_scheduled_preview": "Next restarts:",
+                "restarter_scheduled_preview_none": "Next restarts: none scheduled",
+                # Missed schedules
+                "restarter_scheduled_missed": "Missed Schedules (host suspended, clock adjusted or toolbox closed)",
+                "schedule_missed_run_late": "Run once, late",
+                "schedule_missed_skip": "Skip",
+                "tooltip_schedule_missed_policy": "What to do with a scheduled restart that could not fire on time. Several missed occurrences count as one; beyond the grace window it is always skipped.",
+                "lbl_schedule_grace": "Grace window (min):",
+                "log_scheduled_restart_late": "Scheduled restart for {time} missed {minutes} min ago; running it now.",
+                "log_scheduled_restart_skipped": "Scheduled restart for {time} missed {minutes} min ago; skipped.",
+                # RCon restart warnings
+                "lbl_rcon_address": "BattlEye RCon (host:port):",
+                "tooltip_rcon_address": "Server RCon address (e.g. 127.0.0.1:19999). With an address and password, scheduled, triggered and map-vote restarts warn players beforehand.",
+                "lbl_rcon_password": "Password:",
+                "lbl_restart_warning_stages": "Warn before restart:",
+                "tooltip_restart_warning_stages": "Comma-separated lead times, in seconds or with an m/s suffix (e.g. 5m,1m,10s). Scheduled restarts start warning ahead of their time; triggered ones are not delayed and only send the stages that fit in the trigger delay; the map-vote restart happens after the longest stage.",
+                "lbl_restart_warning_message": "Message ({time}):",
+                "log_rcon_warning_sent": "RCon warning sent: {message}",
+                "log_rcon_warning_failed": "Failed to send RCon warning: {error}",
+                # Notification webhook
+                "menu_webhook": "Notification Webhook...",
+                "dialog_webhook_url_prompt": "Webhook URL (Discord-compatible) for restarts, votemap winners and failures. Leave empty to disable:",
+                "dialog_webhook_url_invalid": "The webhook URL must start with http:// or https://.",
+                "webhook_test_message": "Notification webhook configured.",
+                # Failure before the restart is submitted
+                "log_restart_request_error": "Error while preparing the restart (reservation released): {error}",
+                # Simulated backend (tests)
+                "log_executing_fake_start": "Starting simulated service '{service}'...",
+                "log_executing_fake_stop": "Stopping simulated service '{service}'...",
             }
         }
 
+# ==============================================================================
+# CLASSE RestartHistoryDB - HISTÓRICO ESTRUTURADO DOS REINÍCIOS (SQLite)
+# ==============================================================================
+def percentile(sorted_values, q):
+    """ Percentil 'q' (0-100) com interpolação linear; 'sorted_values' já ordenado e não vazio. """
+    pos = (len(sorted_values) - 1) * q / 100.0
+    low = int(pos)
+    high = min(low + 1, len(sorted_values) - 1)
+    return sorted_values[low] + (sorted_values[high] - sorted_values[low]) * (pos - low)
+
+
+class RestartTimeline:
+    """ Instantes (epoch) das fases de um reinício em andamento; gravado no RestartHistoryDB ao final. """
+    PHASES = ("stop_issued", "stopped", "start_issued", "running", "ready")
+
+    def __init__(self, server, service, kind):
+        self.server = server
+        self.service = service
+        self.kind = kind
+        self.phases = {}
+
+    def mark(self, phase):
+        self.phases[phase] = time.time()
+
+    def downtime(self):
+        """ Do pedido de parada (ou de início, se já estava parado) até pronto (ou ativo, sem sonda). """
+        begin = self.phases.get("stop_issued", self.phases.get("start_issued"))
+        end = self.phases.get("ready", self.phases.get("running"))
+        return end - begin if begin is not None and end is not None else None
+
+
+class RestartHistoryDB:
+    """ Grava cada reinício (agendado, gatilho, manual ou votemap) com os instantes de cada fase. Thread-safe. """
+    KIND_BY_PRIORITY = {0: "manual", 1: "trigger", 2: "scheduled"}
+    KIND_VOTEMAP = "votemap"
+    KIND_A2S = "a2s"
+    KIND_RSS = "rss"
+    KIND_LOG_SILENCE = "log_silence"
+    COLUMNS = ["Id", "Server", "Service", "Kind", "Outcome", "Stop_Issued_TS", "Stopped_TS", "Start_Issued_TS",
+               "Running_TS", "Ready_TS", "Finished_TS", "Downtime_S"]
+    STATS_WINDOW = 200  # reinícios mais recentes considerados nos percentis
+
+    def __init__(self, db_path="restart_history.db"):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self._create_table()
+        app_logger.info(f"Histórico de reinícios inicializado. Arquivo: '{db_path}'")
+
+    def _create_table(self):
+        with self.lock:
+            try:
+                conn = sqlite3.connect(self.db_path)
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS restarts (
+                        Id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        Server TEXT NOT NULL,
+                        Service TEXT,
+                        Kind TEXT NOT NULL,
+                        Outcome TEXT NOT NULL,
+                        Stop_Issued_TS REAL,
+                        Stopped_TS REAL,
+                        Start_Issued_TS REAL,
+                        Running_TS REAL,
+                        Ready_TS REAL,
+                        Finished_TS REAL NOT NULL,
+                        Downtime_S REAL
+                    )
+                """)
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_restarts_server ON restarts (Server, Finished_TS)")
+                conn.commit()
+                conn.close()
+            except sqlite3.Error as e:
+                app_logger.error(f"Erro ao criar tabela do histórico de reinícios: {e}", exc_info=True)
+
+    def record(self, timeline, success):
+        """ Grava o reinício concluído; a duração só conta para as estatísticas quando bem-sucedido. """
+        phases = timeline.phases
+        downtime = timeline.downtime() if success else None
+        with self.lock:
+            try:
+                conn = sqlite3.connect(self.db_path)
+                conn.execute(
+                    "INSERT INTO restarts (Server, Service, Kind, Outcome, Stop_Issued_TS, Stopped_TS, "
+                    "Start_Issued_TS, Running_TS, Ready_TS, Finished_TS, Downtime_S) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (timeline.server, timeline.service, timeline.kind, "ok" if success else "failed",
+                     *(phases.get(phase) for phase in RestartTimeline.PHASES), time.time(), downtime))
+                conn.commit()
+                conn.close()
+            except sqlite3.Error as e:
+                app_logger.error(f"Erro ao gravar reinício de '{timeline.server}' no histórico: {e}", exc_info=True)
+
+    def downtime_stats(self, server):
+        """ (quantidade, p50, p95) da indisponibilidade em segundos dos últimos reinícios bem-sucedidos. """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                rows = conn.execute(
+                    "SELECT Downtime_S FROM restarts WHERE Server = ? AND Downtime_S IS NOT NULL "
+                    "ORDER BY Finished_TS DESC LIMIT ?", (server, self.STATS_WINDOW)).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            app_logger.error(f"Erro ao consultar histórico de reinícios de '{server}': {e}", exc_info=True)
+            return 0, None, None
+        values = sorted(row[0] for row in rows)
+        if not values:
+            return 0, None, None
+        return len(values), percentile(values, 50), percentile(values, 95)
+
+    def export_csv(self, path):
+        """ Exporta todo o histórico para CSV (datas em ISO local). Retorna o número de linhas. """
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = conn.execute(f"SELECT {', '.join(self.COLUMNS)} FROM restarts ORDER BY Id").fetchall()
+        finally:
+            conn.close()
+        ts_columns = {i for i, name in enumerate(self.COLUMNS) if name.endswith("_TS")}
+        tmp_path = path + ".part"
+        with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.COLUMNS)
+            for row in rows:
+                writer.writerow([datetime.fromtimestamp(v).isoformat(sep=" ", timespec="milliseconds")
+                                 if i in ts_columns and v is not None else v for i, v in enumerate(row)])
+        os.replace(tmp_path, path)
+        app_logger.info(f"Exportados {len(rows)} reinício(s) para '{path}'.")
+        return len(rows)
+
+
 # ==============================================================================
 # CLASSE PlayerDBManager - NOVO GERENCIADOR DE BANCO DE DADOS DE JOGADORES
 # ==============================================================================
@@ -549,15 +1090,19 @@ class PlayerDBManager:
     def __init__(self, db_path="players_info.db"):
         self.db_path = db_path
         self.lock = threading.Lock()
+        self.fts_available = False
         self._create_table()
+        self._create_search_index()
         app_logger.info(f"Gerenciador de banco de dados de jogadores inicializado. Arquivo: '{db_path}'")
 
     def _create_table(self):
-        """ Cria a tabela 'players' se ela não existir. """
+        """ Cria as tabelas 'players', 'identities' e 'sessions' (e seus índices) se não existirem. """
         with self.lock:
             try:
                 conn = sqlite3.connect(self.db_path)
                 cursor = conn.cursor()
+                # WAL permite que a busca leia enquanto o coletor/backfill grava.
+                cursor.execute("PRAGMA journal_mode=WAL")
                 # Player_Nickname é a CHAVE PRIMÁRIA para garantir que seja único.
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS players (
@@ -565,11 +1110,111 @@ class PlayerDBManager:
                         Bohemia_ID TEXT NOT NULL
                     )
                 """)
+                # Totais agregados por identidade, atualizados incrementalmente a cada lote de sessões.
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS identities (
+                        Bohemia_ID TEXT PRIMARY KEY,
+                        Last_Nickname TEXT,
+                        First_Seen REAL,
+                        Last_Seen REAL,
+                        Total_Seconds REAL NOT NULL DEFAULT 0,
+                        Session_Count INTEGER NOT NULL DEFAULT 0
+                    )
+                """)
+                # Sessões concluídas (timestamps em epoch). Join_TS/Leave_TS permitem consultas por período.
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS sessions (
+                        Bohemia_ID TEXT NOT NULL,
+                        Player_Nickname TEXT,
+                        Source TEXT,
+                        Join_TS REAL NOT NULL,
+                        Leave_TS REAL NOT NULL,
+                        Duration_S REAL NOT NULL
+                    )
+                """)
+                cursor.execute(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS idx_sessions_identity_join ON sessions (Bohemia_ID, Join_TS)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_sessions_leave ON sessions (Leave_TS)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_identities_total ON identities (Total_Seconds)")
+                # Pastas de sessão já processadas pelo backfill (permite retomar de onde parou).
+                cursor.execute("""
+                    CREATE TABLE IF NOT EXISTS backfill_folders (
+                        Folder TEXT PRIMARY KEY,
+                        Completed_At REAL NOT NULL,
+                        Players_Found INTEGER NOT NULL DEFAULT 0
+                    )
+                """)
                 conn.commit()
                 conn.close()
             except sqlite3.Error as e:
                 app_logger.error(f"Erro ao criar tabela no banco de dados de jogadores: {e}", exc_info=True)
 
+    def _create_search_index(self):
+        """
+        Cria o índice exato por Bohemia_ID e um índice FTS5 'trigram' sobre os nicknames, mantido por triggers.
+        Se o SQLite não suportar FTS5/trigram, a busca usa LIKE como alternativa.
+        """
+        with self.lock:
+            try:
+                conn = sqlite3.connect(self.db_path)
+                cursor = conn.cursor()
+                cursor.execute(PLAYER_DB_SECONDARY_INDEXES["players"]["idx_players_bohemia_id"])
+                conn.commit()
+                fts_exists = cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type='table' AND name='players_fts'").fetchone() is not None
+                try:
+                    cursor.execute("""
+                        CREATE VIRTUAL TABLE IF NOT EXISTS players_fts
+                        USING fts5(Player_Nickname, content='players', tokenize='trigram')
+                    """)
+                    cursor.executescript(PLAYERS_FTS_TRIGGERS_SQL)
+                    if not fts_exists:
+                        # Banco já existente: indexa os jogadores gravados antes do índice existir.
+                        cursor.execute("INSERT INTO players_fts (players_fts) VALUES ('rebuild')")
+                    conn.commit()
+                    self.fts_available = True
+                except sqlite3.OperationalError as e:
+                    app_logger.warning(f"FTS5/trigram indisponível no SQLite {sqlite3.sqlite_version}: {e}. "
+                                       f"A busca de jogadores usará LIKE.")
+                conn.close()
+            except sqlite3.Error as e:
+                app_logger.error(f"Erro ao criar índices de busca de jogadores: {e}", exc_info=True)
+
+    def search_players(self, query, after_rowid=0, limit=200):
+        """
+        Busca paginada (keyset por rowid) de jogadores.
+        Retorna [(rowid, nickname, bohemia_id, last_seen, total_seconds)].
+        - Bohemia ID completo: busca exata pelo índice de Bohemia_ID.
+        - 3+ caracteres: FTS5 trigram (substring, sem diferenciar maiúsculas).
+        - 1-2 caracteres ou sem FTS5: LIKE por substring.
+        """
+        query = (query or "").strip()
+        select = ("SELECT p.rowid, p.Player_Nickname, p.Bohemia_ID, i.Last_Seen, i.Total_Seconds FROM players p "
+                  "LEFT JOIN identities i ON i.Bohemia_ID = p.Bohemia_ID ")
+        if not query:
+            sql, params = select + "WHERE p.rowid > ? ORDER BY p.rowid LIMIT ?", (after_rowid, limit)
+        elif re.fullmatch(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}", query):
+            sql = select + "WHERE p.Bohemia_ID IN (?, ?) AND p.rowid > ? ORDER BY p.rowid LIMIT ?"
+            params = (query, query.lower(), after_rowid, limit)
+        elif self.fts_available and len(query) >= 3:
+            sql = ("SELECT p.rowid, p.Player_Nickname, p.Bohemia_ID, i.Last_Seen, i.Total_Seconds FROM players_fts f "
+                   "JOIN players p ON p.rowid = f.rowid LEFT JOIN identities i ON i.Bohemia_ID = p.Bohemia_ID "
+                   "WHERE players_fts MATCH ? AND f.rowid > ? ORDER BY f.rowid LIMIT ?")
+            params = ('"' + query.replace('"', '""') + '"', after_rowid, limit)
+        else:
+            escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            sql = select + "WHERE p.rowid > ? AND p.Player_Nickname LIKE ? ESCAPE '\\' ORDER BY p.rowid LIMIT ?"
+            params = (after_rowid, f"%{escaped}%", limit)
+        with self.lock:
+            try:
+                conn = sqlite3.connect(self.db_path)
+                rows = conn.execute(sql, params).fetchall()
+                conn.close()
+                return rows
+            except sqlite3.Error as e:
+                app_logger.error(f"Erro na busca de jogadores por '{query}': {e}", exc_info=True)
+                return []
+
     def add_player(self, nickname, bohemia_id):
         """
         Adiciona um novo jogador ao banco de dados.
@@ -593,6 +1238,787 @@ class PlayerDBManager:
                 app_logger.error(f"Erro ao adicionar jogador '{nickname}' ao banco de dados: {e}", exc_info=True)
                 return False
 
+    def add_players_bulk(self, players, completed_folder=None):
+        """
+        Insere vários (nickname, bohemia_id) em uma única transação com 'executemany'.
+        Se 'completed_folder' for informado, marca a pasta como concluída na mesma transação.
+        Retorna o número de jogadores novos, ou -1 em caso de erro.
+        """
+        with self.lock:
+            try:
+                conn = sqlite3.connect(self.db_path)
+                cursor = conn.cursor()
+                cursor.executemany(
+                    "INSERT OR IGNORE INTO players (Player_Nickname, Bohemia_ID) VALUES (?, ?)", players)
+                # Em executemany o rowcount é a soma das linhas inseridas (sem contar as dos triggers do FTS).
+                inserted = max(0, cursor.rowcount)
+                if completed_folder:
+                    cursor.execute(
+                        "INSERT OR REPLACE INTO backfill_folders (Folder, Completed_At, Players_Found) VALUES (?, ?, ?)",
+                        (completed_folder, time.time(), len(players)))
+                conn.commit()
+                conn.close()
+                return inserted
+            except sqlite3.Error as e:
+                app_logger.error(f"Erro na inserção em massa de {len(players)} jogadores: {e}", exc_info=True)
+                return -1
+
+    def get_backfilled_folders(self):
+        """ Retorna o conjunto de pastas de sessão já processadas pelo backfill. """
+        with self.lock:
+            try:
+                conn = sqlite3.connect(self.db_path)
+                rows = conn.execute("SELECT Folder FROM backfill_folders").fetchall()
+                conn.close()
+                return {row[0] for row in rows}
+            except sqlite3.Error as e:
+                app_logger.error(f"Erro ao ler pastas do backfill: {e}", exc_info=True)
+                return set()
+
+    def add_sessions(self, sessions):
+        """
+        Grava um lote de sessões concluídas em uma única transação e atualiza os totais de 'identities'.
+        Cada sessão é uma tupla (bohemia_id, nickname, source, join_ts, leave_ts).
+        Sessões repetidas (mesmo Bohemia_ID e Join_TS) são ignoradas. Retorna o número de sessões gravadas.
+        """
+        if not sessions:
+            return 0
+        with self.lock:
+            try:
+                conn = sqlite3.connect(self.db_path)
+                cursor = conn.cursor()
+                totals = {}
+                inserted = 0
+                for bohemia_id, nickname, source, join_ts, leave_ts in sessions:
+                    duration = max(0.0, leave_ts - join_ts)
+                    cursor.execute(
+                        "INSERT OR IGNORE INTO sessions (Bohemia_ID, Player_Nickname, Source, Join_TS, Leave_TS, "
+                        "Duration_S) VALUES (?, ?, ?, ?, ?, ?)",
+                        (bohemia_id, nickname, source, join_ts, leave_ts, duration)
+                    )
+                    if cursor.rowcount <= 0:
+                        continue
+                    inserted += 1
+                    # [nickname mais recente, primeiro join, último leave, segundos, contagem]
+                    agg = totals.setdefault(bohemia_id, [nickname, join_ts, leave_ts, 0.0, 0])
+                    if leave_ts >= agg[2]:
+                        agg[0], agg[2] = nickname, leave_ts
+                    agg[1] = min(agg[1], join_ts)
+                    agg[3] += duration
+                    agg[4] += 1
+                cursor.executemany("""
+                    INSERT INTO identities (Bohemia_ID, Last_Nickname, First_Seen, Last_Seen, Total_Seconds,
+                                            Session_Count)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(Bohemia_ID) DO UPDATE SET
+                        Last_Nickname = CASE WHEN excluded.Last_Seen >= COALESCE(identities.Last_Seen, 0)
+                                             THEN excluded.Last_Nickname ELSE identities.Last_Nickname END,
+                        First_Seen = MIN(COALESCE(identities.First_Seen, excluded.First_Seen), excluded.First_Seen),
+                        Last_Seen = MAX(COALESCE(identities.Last_Seen, excluded.Last_Seen), excluded.Last_Seen),
+                        Total_Seconds = identities.Total_Seconds + excluded.Total_Seconds,
+                        Session_Count = identities.Session_Count + excluded.Session_Count
+                """, [(bid, *agg) for bid, agg in totals.items()])
+                conn.commit()
+                conn.close()
+                return inserted
+            except sqlite3.Error as e:
+                app_logger.error(f"Erro ao gravar lote de {len(sessions)} sessões: {e}", exc_info=True)
+                return 0
+
+    def get_top_players(self, since_ts=None, limit=10):
+        """
+        Retorna [(bohemia_id, nickname, segundos)] ordenado por tempo de jogo.
+        Sem 'since_ts' usa os totais acumulados; com 'since_ts' soma apenas a parte das sessões após esse instante.
+        """
+        with self.lock:
+            try:
+                conn = sqlite3.connect(self.db_path)
+                cursor = conn.cursor()
+                if since_ts is None:
+                    cursor.execute(
+                        "SELECT Bohemia_ID, Last_Nickname, Total_Seconds FROM identities "
+                        "ORDER BY Total_Seconds DESC LIMIT ?", (limit,))
+                else:
+                    # Apelido atual vem de identities (MAX() daria o último em ordem alfabética)
+                    cursor.execute("""
+                        SELECT s.Bohemia_ID, COALESCE(i.Last_Nickname, MAX(s.Player_Nickname)),
+                               SUM(s.Leave_TS - MAX(s.Join_TS, ?)) AS secs
+                        FROM sessions s LEFT JOIN identities i ON i.Bohemia_ID = s.Bohemia_ID
+                        WHERE s.Leave_TS >= ?
+                        GROUP BY s.Bohemia_ID ORDER BY secs DESC LIMIT ?
+                    """, (since_ts, since_ts, limit))
+                rows = cursor.fetchall()
+                conn.close()
+                return rows
+            except sqlite3.Error as e:
+                app_logger.error(f"Erro ao consultar ranking de jogadores: {e}", exc_info=True)
+                return []
+
+    def get_sessions_at(self, ts):
+        """ Retorna [(bohemia_id, nickname, source, join_ts, leave_ts)] das sessões gravadas que cobrem 'ts'. """
+        with self.lock:
+            try:
+                conn = sqlite3.connect(self.db_path)
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT Bohemia_ID, Player_Nickname, Source, Join_TS, Leave_TS FROM sessions "
+                    "WHERE Leave_TS >= ? AND Join_TS <= ? ORDER BY Join_TS", (ts, ts))
+                rows = cursor.fetchall()
+                conn.close()
+                return rows
+            except sqlite3.Error as e:
+                app_logger.error(f"Erro ao consultar sessões em {ts}: {e}", exc_info=True)
+                return []
+
+    # --- Exportação/importação em massa (CSV/JSONL) ---
+
+    @staticmethod
+    def _transfer_format(path):
+        """ Deduz o formato ('csv' ou 'jsonl') pela extensão do arquivo. """
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".csv":
+            return "csv"
+        if ext in (".jsonl", ".ndjson", ".json"):
+            return "jsonl"
+        raise ValueError(f"Extensão não suportada: '{ext}' (use .csv ou .jsonl)")
+
+    def export_table(self, table, path, chunk_size=5000, progress_callback=None, cancel_event=None):
+        """
+        Exporta uma tabela para CSV/JSONL em streaming (fetchmany), com memória constante.
+        Grava em '<path>.part' e renomeia ao final. Retorna o número de linhas exportadas, ou None se cancelado.
+        Não segura o lock: com WAL a leitura enxerga um snapshot consistente sem bloquear as gravações.
+        """
+        if table not in PLAYER_DB_TABLE_COLUMNS:
+            raise ValueError(f"Tabela desconhecida: '{table}'")
+        fmt = self._transfer_format(path)
+        columns = [name for name, _type in PLAYER_DB_TABLE_COLUMNS[table]]
+        tmp_path = path + ".part"
+        exported = 0
+        conn = sqlite3.connect(self.db_path)
+        try:
+            cursor = conn.execute(f"SELECT {', '.join(columns)} FROM {table} ORDER BY rowid")
+            with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f) if fmt == "csv" else None
+                if writer: writer.writerow(columns)
+                while True:
+                    if cancel_event and cancel_event.is_set():
+                        break
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    if writer:
+                        writer.writerows(rows)
+                    else:
+                        f.writelines(json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n" for row in rows)
+                    exported += len(rows)
+                    if progress_callback: progress_callback(exported)
+        finally:
+            conn.close()
+        if cancel_event and cancel_event.is_set():
+            os.remove(tmp_path)
+            app_logger.info(f"Exportação de '{table}' para '{path}' cancelada após {exported} linha(s).")
+            return None
+        os.replace(tmp_path, path)
+        app_logger.info(f"Exportadas {exported} linha(s) de '{table}' para '{path}'.")
+        return exported
+
+    def _iter_import_records(self, path, fmt):
+        """
+        Lê o arquivo linha a linha e gera dicionários coluna -> valor (texto ou JSON).
+        Linhas JSONL malformadas geram None (contadas como ignoradas) em vez de abortar a importação no meio.
+        """
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            if fmt == "csv":
+                yield from csv.DictReader(f)
+            else:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        yield None
+
+    def detect_import_table(self, path):
+        """ Identifica a tabela de destino pelas colunas do cabeçalho (CSV) ou do primeiro registro (JSONL). """
+        fmt = self._transfer_format(path)
+        first = next((r for r in self._iter_import_records(path, fmt) if isinstance(r, dict)), None)
+        keys = set(first or ())
+        # 'sessions' e 'identities' contêm as colunas de 'players'; verifica do mais específico ao mais genérico.
+        for table, required in (("sessions", ("Bohemia_ID", "Join_TS", "Leave_TS")),
+                                ("identities", ("Bohemia_ID", "Total_Seconds")),
+                                ("players", ("Player_Nickname", "Bohemia_ID"))):
+            if keys.issuperset(required):
+                return table
+        raise ValueError(f"Colunas não reconhecidas em '{os.path.basename(path)}': {sorted(keys)}")
+
+    @staticmethod
+    def _convert_import_record(table, record):
+        """ Converte um registro lido para a tupla de valores da tabela. Retorna None se o registro for inválido. """
+        values = []
+        try:
+            for name, col_type in PLAYER_DB_TABLE_COLUMNS[table]:
+                value = record.get(name)
+                if value in (None, ""):
+                    value = None
+                elif col_type is int:
+                    value = int(float(value))
+                elif col_type is float:
+                    value = float(value)
+                else:
+                    value = str(value)
+                values.append(value)
+        except (TypeError, ValueError):
+            return None
+        if not all(values[:2 if table == "players" else 1]):
+            return None
+        if table == "identities":
+            values[4] = values[4] or 0.0
+            values[5] = values[5] or 0
+        elif table == "sessions":
+            if values[3] is None or values[4] is None:
+                return None
+            if values[5] is None:
+                values[5] = max(0.0, values[4] - values[3])
+        return tuple(values)
+
+    def _set_bulk_load_indexes(self, table, enabled):
+        """ Remove (enabled=False) ou recria (enabled=True) os índices secundários e os triggers do FTS de 'table'. """
+        with self.lock:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                for index_name, create_sql in PLAYER_DB_SECONDARY_INDEXES[table].items():
+                    conn.execute(create_sql if enabled else f"DROP INDEX IF EXISTS {index_name}")
+                if table == "players" and self.fts_available:
+                    if enabled:
+                        conn.executescript(PLAYERS_FTS_TRIGGERS_SQL)
+                        conn.execute("INSERT INTO players_fts (players_fts) VALUES ('rebuild')")
+                    else:
+                        for trigger in ("players_fts_ai", "players_fts_ad", "players_fts_au"):
+                            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+                conn.commit()
+            finally:
+                conn.close()
+
+    def import_file(self, path, table=None, chunk_size=5000, rows_per_transaction=250000, rebuild_indexes=None,
+                    progress_callback=None, cancel_event=None):
+        """
+        Importa um arquivo CSV/JSONL em streaming, em lotes de 'executemany' dentro de transações grandes.
+        O lock é liberado entre transações para que o coletor ao vivo não fique parado durante importações longas.
+        Conflitos:
+        - players: o nickname já existente é mantido (mesma regra de add_player);
+        - identities: menor First_Seen, maior Last_Seen, nickname do registro mais recente e maiores totais;
+        - sessions: duplicatas (mesmo Bohemia_ID e Join_TS) são ignoradas pelo índice único e, ao final,
+          os totais de 'identities' são recalculados a partir das sessões.
+        Retorna (tabela, linhas_lidas, linhas_ignoradas, cancelado).
+        """
+        fmt = self._transfer_format(path)
+        table = table or self.detect_import_table(path)
+        if rebuild_indexes is None:
+            rebuild_indexes = os.path.getsize(path) >= PLAYER_DB_IMPORT_REBUILD_BYTES
+        columns = [name for name, _type in PLAYER_DB_TABLE_COLUMNS[table]]
+        placeholders = ", ".join("?" * len(columns))
+        if table == "players":
+            sql = f"INSERT OR IGNORE INTO players ({', '.join(columns)}) VALUES ({placeholders})"
+        elif table == "sessions":
+            sql = f"INSERT OR IGNORE INTO sessions ({', '.join(columns)}) VALUES ({placeholders})"
+        else:
+            sql = f"""
+                INSERT INTO identities ({', '.join(columns)}) VALUES ({placeholders})
+                ON CONFLICT(Bohemia_ID) DO UPDATE SET
+                    Last_Nickname = CASE WHEN COALESCE(excluded.Last_Seen, 0) >= COALESCE(identities.Last_Seen, 0)
+                                         THEN COALESCE(excluded.Last_Nickname, identities.Last_Nickname)
+                                         ELSE identities.Last_Nickname END,
+                    First_Seen = MIN(COALESCE(identities.First_Seen, excluded.First_Seen),
+                                     COALESCE(excluded.First_Seen, identities.First_Seen)),
+                    Last_Seen = MAX(COALESCE(identities.Last_Seen, excluded.Last_Seen),
+                                    COALESCE(excluded.Last_Seen, identities.Last_Seen)),
+                    Total_Seconds = MAX(identities.Total_Seconds, COALESCE(excluded.Total_Seconds, 0)),
+                    Session_Count = MAX(identities.Session_Count, COALESCE(excluded.Session_Count, 0))
+            """
+        read = skipped = 0
+        cancelled = False
+        records = self._iter_import_records(path, fmt)
+        app_logger.info(f"Importando '{path}' para '{table}' (índices recriados ao final: {rebuild_indexes}).")
+        if rebuild_indexes:
+            self._set_bulk_load_indexes(table, enabled=False)
+        try:
+            exhausted = False
+            while not exhausted and not cancelled:
+                with self.lock:
+                    conn = sqlite3.connect(self.db_path)
+                    try:
+                        in_transaction = 0
+                        while in_transaction < rows_per_transaction:
+                            if cancel_event and cancel_event.is_set():
+                                cancelled = True
+                                break
+                            chunk = []
+                            for record in records:
+                                values = self._convert_import_record(table, record) if isinstance(record, dict) else None
+                                read += 1
+                                if values is None:
+                                    skipped += 1
+                                    continue
+                                chunk.append(values)
+                                if len(chunk) >= chunk_size:
+                                    break
+                            else:
+                                exhausted = True
+                            if chunk:
+                                conn.executemany(sql, chunk)
+                                in_transaction += len(chunk)
+                            if exhausted:
+                                break
+                        conn.commit()
+                    except (sqlite3.Error, ValueError):
+                        conn.rollback()
+                        raise
+                    finally:
+                        conn.close()
+                if progress_callback: progress_callback(read)
+        finally:
+            if rebuild_indexes:
+                self._set_bulk_load_indexes(table, enabled=True)
+        if table == "sessions":
+            self._recompute_identities_from_sessions()
+        app_logger.info(f"Importação de '{path}' ({table}): {read} linha(s) lida(s), {skipped} ignorada(s)"
+                        f"{', cancelada' if cancelled else ''}.")
+        return table, read, skipped, cancelled
+
+    def _recompute_identities_from_sessions(self):
+        """ Recalcula os totais de 'identities' a partir de 'sessions' (após importar sessões de outros hosts). """
+        with self.lock:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                conn.execute("""
+                    INSERT INTO identities (Bohemia_ID, Last_Nickname, First_Seen, Last_Seen, Total_Seconds,
+                                            Session_Count)
+                    SELECT s.Bohemia_ID,
+                           (SELECT s2.Player_Nickname FROM sessions s2 WHERE s2.Bohemia_ID = s.Bohemia_ID
+                            ORDER BY s2.Leave_TS DESC LIMIT 1),
+                           MIN(s.Join_TS), MAX(s.Leave_TS), SUM(s.Duration_S), COUNT(*)
+                    FROM sessions s WHERE true GROUP BY s.Bohemia_ID
+                    ON CONFLICT(Bohemia_ID) DO UPDATE SET
+                        Last_Nickname = CASE WHEN excluded.Last_Seen >= COALESCE(identities.Last_Seen, 0)
+                                             THEN excluded.Last_Nickname ELSE identities.Last_Nickname END,
+                        First_Seen = MIN(COALESCE(identities.First_Seen, excluded.First_Seen), excluded.First_Seen),
+                        Last_Seen = MAX(COALESCE(identities.Last_Seen, excluded.Last_Seen), excluded.Last_Seen),
+                        Total_Seconds = excluded.Total_Seconds,
+                        Session_Count = excluded.Session_Count
+                """)
+                conn.commit()
+            finally:
+                conn.close()
+
+
+# ==============================================================================
+# CLASSE PlayerSessionTracker - SESSÕES DE JOGADORES (ENTRADA/SAÍDA)
+# ==============================================================================
+class PlayerSessionTracker:
+    """
+    Mantém em memória as sessões abertas (por fonte de log e nickname) e grava as sessões concluídas
+    em lotes no PlayerDBManager, a partir de uma thread própria.
+    """
+
+    def __init__(self, db_manager, batch_size=200, flush_interval=30.0):
+        self.db_manager = db_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.lock = threading.Lock()
+        self.open_sessions = {}  # (source, nickname) -> (bohemia_id, nickname, join_ts)
+        self.pending_sessions = []
+        self._flush_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._flush_thread = threading.Thread(target=self._flush_worker, daemon=True, name="PlayerSessionFlush")
+        self._flush_thread.start()
+
+    def player_joined(self, source, nickname, bohemia_id, ts=None):
+        """ Abre uma sessão. Linhas repetidas do mesmo jogador na mesma fonte mantêm o horário de entrada. """
+        key = (source, nickname)
+        with self.lock:
+            current = self.open_sessions.get(key)
+            if current is None or current[0] != bohemia_id:
+                if current is not None:
+                    self._close_locked(key, ts)
+                self.open_sessions[key] = (bohemia_id, nickname, ts if ts is not None else time.time())
+
+    def player_left(self, source, nickname, ts=None):
+        with self.lock:
+            self._close_locked((source, nickname), ts)
+
+    def source_reset(self, source, ts=None):
+        """ Encerra todas as sessões abertas de uma fonte (ex.: novo arquivo de log após reinício). """
+        with self.lock:
+            for key in [k for k in self.open_sessions if k[0] == source]:
+                self._close_locked(key, ts)
+
+    def _close_locked(self, key, ts=None):
+        session = self.open_sessions.pop(key, None)
+        if session is None:
+            return
+        bohemia_id, nickname, join_ts = session
+        self.pending_sessions.append((bohemia_id, nickname, key[0], join_ts, ts if ts is not None else time.time()))
+        if len(self.pending_sessions) >= self.batch_size:
+            self._flush_event.set()
+
+    def flush(self):
+        with self.lock:
+            batch, self.pending_sessions = self.pending_sessions, []
+        if batch:
+            written = self.db_manager.add_sessions(batch)
+            app_logger.debug(f"Sessões de jogadores gravadas: {written}/{len(batch)}.")
+
+    def _flush_worker(self):
+        while not self._stop_event.is_set():
+            self._flush_event.wait(self.flush_interval)
+            self._flush_event.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                app_logger.error(f"Erro ao gravar sessões de jogadores: {e}", exc_info=True)
+
+    def shutdown(self):
+        """ Fecha as sessões abertas no instante atual, grava tudo e encerra a thread de gravação. """
+        now = time.time()
+        with self.lock:
+            for key in list(self.open_sessions):
+                self._close_locked(key, now)
+        self._stop_event.set()
+        self._flush_event.set()
+        if self._flush_thread.is_alive() and self._flush_thread != threading.current_thread():
+            self._flush_thread.join(timeout=2.0)
+        self.flush()
+
+    def get_online_at(self, ts):
+        """ Jogadores online em 'ts': sessões gravadas, pendentes e ainda abertas. """
+        seen = {}
+        for bohemia_id, nickname, source, join_ts, leave_ts in self.db_manager.get_sessions_at(ts):
+            seen[(bohemia_id, join_ts)] = (bohemia_id, nickname, source, join_ts, leave_ts)
+        with self.lock:
+            for bohemia_id, nickname, source, join_ts, leave_ts in self.pending_sessions:
+                if join_ts <= ts <= leave_ts:
+                    seen[(bohemia_id, join_ts)] = (bohemia_id, nickname, source, join_ts, leave_ts)
+            for (source, _nick), (bohemia_id, nickname, join_ts) in self.open_sessions.items():
+                if join_ts <= ts:
+                    seen[(bohemia_id, join_ts)] = (bohemia_id, nickname, source, join_ts, None)
+        return sorted(seen.values(), key=lambda s: s[3])
+
+    def get_top_players(self, since_ts=None, limit=10):
+        """ Ranking por tempo de jogo; grava as sessões pendentes antes para o resultado ficar atualizado. """
+        self.flush()
+        return self.db_manager.get_top_players(since_ts, limit)
+
+
+# ==============================================================================
+# CLASSE PlayerWatchList - LISTA DE BANIDOS/OBSERVADOS (VERIFICADA NA ENTRADA)
+# ==============================================================================
+class PlayerWatchList:
+    """
+    Lista de Bohemia IDs banidos/observados carregada de um arquivo texto (um ID por linha, seguido
+    opcionalmente de um motivo; linhas iniciadas por '#' são comentários).
+    Os IDs ficam em um dicionário (hash) trocado por inteiro a cada recarga, então a consulta na linha de
+    entrada do jogador não usa lock. Uma thread própria recarrega o arquivo quando ele é modificado.
+    """
+    ID_REGEX = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+
+    def __init__(self, file_path, check_interval=5.0):
+        self.file_path = file_path
+        self.check_interval = check_interval
+        self.entries = {}  # bohemia_id (minúsculo) -> motivo
+        self._loaded_mtime = None
+        self._stop_event = threading.Event()
+        self.reload()
+        self._watch_thread = threading.Thread(target=self._watch_worker, daemon=True, name="PlayerWatchListReload")
+        self._watch_thread.start()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def match(self, bohemia_id):
+        """ Retorna o motivo (ou "") se o ID estiver na lista, senão None. """
+        return self.entries.get(bohemia_id.lower())
+
+    def reload(self):
+        """ Relê o arquivo. Retorna o número de IDs carregados, ou None se o arquivo não existir/falhar. """
+        try:
+            mtime = os.path.getmtime(self.file_path)
+            entries = {}
+            with open(self.file_path, "r", encoding="utf-8-sig") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    match = self.ID_REGEX.match(line)
+                    if match:
+                        entries[match.group(0).lower()] = line[match.end():].strip(" \t,;-")
+        except FileNotFoundError:
+            if self.entries:
+                app_logger.warning(f"Lista de observação '{self.file_path}' não encontrada; lista esvaziada.")
+            self.entries, self._loaded_mtime = {}, None
+            return None
+        except OSError as e:
+            app_logger.error(f"Erro ao ler a lista de observação '{self.file_path}': {e}", exc_info=True)
+            return None
+        self.entries, self._loaded_mtime = entries, mtime
+        app_logger.info(f"Lista de observação carregada de '{self.file_path}': {len(entries)} ID(s).")
+        return len(entries)
+
+    def _watch_worker(self):
+        while not self._stop_event.wait(self.check_interval):
+            try:
+                mtime = os.path.getmtime(self.file_path)
+            except OSError:
+                mtime = None
+            if mtime != self._loaded_mtime:
+                self.reload()
+
+    def shutdown(self):
+        self._stop_event.set()
+
+
+# ==============================================================================
+# BACKFILL DO BANCO DE JOGADORES A PARTIR DAS PASTAS logs_* EXISTENTES
+# ==============================================================================
+def _backfill_scan_session_folder(folder, log_filename, player_pattern):
+    """
+    Executado em um processo do pool: lê o log de uma pasta de sessão e retorna (folder, [(nickname, id)])
+    já sem duplicatas. Precisa ficar no nível do módulo para ser serializável pelo ProcessPoolExecutor.
+    """
+    regex = re.compile(player_pattern)
+    found = {}
+    log_path = os.path.join(folder, log_filename)
+    try:
+        with open(log_path, 'r', encoding='latin-1', errors='replace') as f:
+            for line in f:
+                if "IdentityId=" not in line:
+                    continue
+                match = regex.search(line)
+                if match:
+                    found.setdefault(match.group(1).strip(), match.group(2).strip())
+    except FileNotFoundError:
+        pass
+    return folder, list(found.items())
+
+
+class PlayerBackfillJob:
+    """
+    Percorre todas as pastas de sessão (logs_*) das pastas raiz configuradas e importa os jogadores
+    encontrados, lendo os logs em paralelo com um ProcessPoolExecutor. Roda em uma thread própria;
+    o progresso é informado por 'progress_callback(concluidas, total, novos_jogadores)'.
+    """
+
+    def __init__(self, db_manager, log_roots, player_pattern, progress_callback=None, done_callback=None,
+                 max_workers=None):
+        self.db_manager = db_manager
+        self.log_roots = log_roots  # [(pasta_raiz, log_filename)]
+        self.player_pattern = player_pattern
+        self.progress_callback = progress_callback
+        self.done_callback = done_callback
+        self.max_workers = max_workers or max(1, (os.cpu_count() or 2) - 1)
+        self._cancel_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self._run, daemon=True, name="PlayerBackfill")
+        self.thread.start()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def _enumerate_folders(self):
+        """ Retorna [(pasta, log_filename, is_latest)], sem pastas já concluídas em execuções anteriores. """
+        done = self.db_manager.get_backfilled_folders()
+        folders, seen = [], set()
+        for root, log_filename in self.log_roots:
+            try:
+                entries = [e for e in os.scandir(root) if e.is_dir() and LOG_SESSION_FOLDER_REGEX.match(e.name)]
+            except OSError as e:
+                app_logger.warning(f"Backfill: não foi possível listar '{root}': {e}")
+                continue
+            # O nome da pasta contém a data, então a ordem alfabética é cronológica.
+            entries.sort(key=lambda e: e.name)
+            for index, entry in enumerate(entries):
+                path = os.path.normpath(entry.path)
+                if path in done or path in seen:
+                    continue
+                seen.add(path)
+                folders.append((path, log_filename, index == len(entries) - 1))
+        return folders
+
+    def _run(self):
+        total_new, processed, cancelled = 0, 0, False
+        folders = []
+        try:
+            folders = self._enumerate_folders()
+            latest = {path for path, _name, is_latest in folders if is_latest}
+            self._report(0, len(folders), 0)
+            app_logger.info(f"Backfill de jogadores: {len(folders)} pasta(s) de sessão pendente(s).")
+            if folders:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = [executor.submit(_backfill_scan_session_folder, path, name, self.player_pattern)
+                               for path, name, _is_latest in folders]
+                    for future in as_completed(futures):
+                        if self._cancel_event.is_set():
+                            cancelled = True
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            break
+                        try:
+                            folder, players = future.result()
+                        except Exception as e:
+                            app_logger.error(f"Backfill: falha ao ler uma pasta de sessão: {e}", exc_info=True)
+                            processed += 1
+                            continue
+                        # A pasta mais recente pode ainda estar sendo escrita: importa, mas não marca como concluída.
+                        inserted = self.db_manager.add_players_bulk(
+                            players, completed_folder=None if folder in latest else folder)
+                        total_new += max(0, inserted)
+                        processed += 1
+                        self._report(processed, len(folders), total_new)
+        except Exception as e:
+            app_logger.error(f"Erro no backfill de jogadores: {e}", exc_info=True)
+        app_logger.info(f"Backfill de jogadores {'cancelado' if cancelled else 'concluído'}: "
+                        f"{processed}/{len(folders)} pasta(s), {total_new} jogador(es) novo(s).")
+        if self.done_callback:
+            self.done_callback(processed, len(folders), total_new, cancelled)
+
+    def _report(self, processed, total, new_players):
+        if self.progress_callback:
+            self.progress_callback(processed, total, new_players)
+
+
+# ==============================================================================
+# CLASSE PlayerSearchWindow - BUSCA NO BANCO DE JOGADORES
+# ==============================================================================
+class PlayerSearchWindow(ttk.Toplevel):
+    """
+    Janela de busca de jogadores. As consultas rodam em threads e são paginadas: a Treeview recebe
+    uma página por vez e a próxima só é buscada quando a rolagem chega ao fim da lista.
+    """
+    PAGE_SIZE = 200
+
+    def __init__(self, master_app):
+        super().__init__(master_app.root)
+        self.app = master_app
+        self.db_manager = master_app.player_db_manager
+        _ = self.app.translator.get
+        self.title(_("player_search_title"))
+        self.geometry("820x520")
+        self.transient(self.app.root)
+
+        self.search_var = tk.StringVar()
+        self.status_var = tk.StringVar()
+        self._generation = 0
+        self._last_rowid = 0
+        self._exhausted = True
+        self._loading = False
+        self._debounce_id = None
+
+        top_frame = ttk.Frame(self, padding=(10, 5))
+        top_frame.pack(fill='x')
+        ttk.Label(top_frame, text=_("player_search_prompt")).pack(side='left', padx=(0, 5))
+        search_entry = ttk.Entry(top_frame, textvariable=self.search_var)
+        search_entry.pack(side='left', fill='x', expand=True, padx=5)
+        search_entry.focus_set()
+        ttk.Button(top_frame, text=_("player_search_top_week"), command=self._show_top_week,
+                   bootstyle=INFO).pack(side='left', padx=5)
+
+        tree_frame = ttk.Frame(self, padding=(10, 0))
+        tree_frame.pack(fill='both', expand=True)
+        cols = ('nickname', 'bohemia_id', 'last_seen', 'playtime')
+        self.tree = ttk.Treeview(tree_frame, columns=cols, show='headings', selectmode='browse')
+        col_widths = {'nickname': 220, 'bohemia_id': 290, 'last_seen': 140, 'playtime': 90}
+        for col, width in col_widths.items():
+            self.tree.heading(col, text=_(f"player_col_{col}"))
+            self.tree.column(col, width=width, anchor='w')
+        scrollbar = ttk.Scrollbar(tree_frame, orient='vertical', command=self.tree.yview)
+        self.tree.configure(yscrollcommand=lambda first, last: (scrollbar.set(first, last),
+                                                                self._on_scroll(float(last))))
+        self.tree.pack(side='left', fill='both', expand=True)
+        scrollbar.pack(side='right', fill='y')
+        self.tree.bind("<Control-c>", self._copy_selected_id)
+
+        ttk.Label(self, textvariable=self.status_var, anchor='w', padding=(10, 5)).pack(fill='x')
+
+        self.search_var.trace_add("write", lambda *args: self._schedule_search())
+        self._start_search()
+
+    def _schedule_search(self):
+        if self._debounce_id: self.after_cancel(self._debounce_id)
+        self._debounce_id = self.after(250, self._start_search)
+
+    def _start_search(self):
+        self._debounce_id = None
+        self._generation += 1
+        self._last_rowid = 0
+        self._exhausted = False
+        self.tree.delete(*self.tree.get_children())
+        self._fetch_next_page()
+
+    def _on_scroll(self, last_fraction):
+        if last_fraction >= 0.95 and not self._exhausted and not self._loading:
+            self._fetch_next_page()
+
+    def _fetch_next_page(self):
+        self._loading = True
+        generation, query, after_rowid = self._generation, self.search_var.get(), self._last_rowid
+        self.status_var.set(self.app.translator.get("player_search_loading"))
+
+        def worker():
+            started = time.perf_counter()
+            rows = self.db_manager.search_players(query, after_rowid, self.PAGE_SIZE)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if not self.app._shutting_down:
+                self.app.root.after(0, self._apply_page, generation, rows, elapsed_ms)
+
+        threading.Thread(target=worker, daemon=True, name="PlayerSearch").start()
+
+    def _apply_page(self, generation, rows, elapsed_ms):
+        if generation != self._generation or not self.winfo_exists():
+            return  # Resultado de uma busca antiga (o usuário continuou digitando).
+        self._loading = False
+        for rowid, nickname, bohemia_id, last_seen, total_seconds in rows:
+            self.tree.insert('', 'end', values=(nickname, bohemia_id, self._format_ts(last_seen),
+                                                self._format_hours(total_seconds)))
+        if rows: self._last_rowid = rows[-1][0]
+        self._exhausted = len(rows) < self.PAGE_SIZE
+        self.status_var.set(self.app.translator.get("player_search_status", count=len(self.tree.get_children()),
+                                                    ms=f"{elapsed_ms:.1f}"))
+
+    def _show_top_week(self):
+        self._generation += 1
+        self._exhausted = True
+        generation = self._generation
+        self.tree.delete(*self.tree.get_children())
+
+        def worker():
+            rows = self.app.player_session_tracker.get_top_players(time.time() - 7 * 86400, limit=100)
+            if not self.app._shutting_down:
+                self.app.root.after(0, apply, rows)
+
+        def apply(rows):
+            if generation != self._generation or not self.winfo_exists(): return
+            for bohemia_id, nickname, seconds in rows:
+                self.tree.insert('', 'end', values=(nickname, bohemia_id, '', self._format_hours(seconds)))
+            self.status_var.set(self.app.translator.get("player_search_top_week_status", count=len(rows)))
+
+        threading.Thread(target=worker, daemon=True, name="PlayerTopWeek").start()
+
+    def _copy_selected_id(self, event=None):
+        selection = self.tree.selection()
+        if selection:
+            self.clipboard_clear()
+            self.clipboard_append(self.tree.item(selection[0], "values")[1])
+
+    @staticmethod
+    def _format_ts(ts):
+        return datetime.fromtimestamp(ts).strftime('%d/%m/%Y %H:%M') if ts else ''
+
+    @staticmethod
+    def _format_hours(seconds):
+        return f"{seconds / 3600:.1f} h" if seconds else ''
+
 
 # ==============================================================================
 # CLASSE NotificationToast - NOVA CLASSE PARA NOTIFICAÇÕES
@@ -615,46 +2041,2909 @@ class NotificationToast(ttk.Toplevel):
         self.container = ttk.Frame(self, bootstyle=f'{style_color}', padding=1)
         self.container.pack(expand=True, fill='both')
 
-        inner_frame = ttk.Frame(self.container, padding=(10, 5))
-        inner_frame.pack(expand=True, fill='both')
+        inner_frame = ttk.Frame(self.container, padding=(10, 5))
+        inner_frame.pack(expand=True, fill='both')
+
+        # Título da Notificação
+        title_label = ttk.Label(inner_frame, text=title, font=("-weight bold",))
+        title_label.pack(side='top', fill='x')
+
+        ttk.Separator(inner_frame).pack(side='top', fill='x', pady=5)
+
+        # Mensagem da Notificação
+        msg_label = ttk.Label(inner_frame, text=message, wraplength=380)
+        msg_label.pack(side='top', fill='x', pady=(0, 5))
+
+        # Label para a contagem regressiva
+        self.countdown_label_var = tk.StringVar()
+        countdown_label = ttk.Label(inner_frame, textvariable=self.countdown_label_var, font=("-size 7",))
+        countdown_label.pack(side='bottom', fill='x', anchor='e')
+
+        self.update_idletasks()
+        self.countdown(self.duration)
+
+    def countdown(self, seconds_left):
+        _ = self.app.translator.get
+        if seconds_left > 0:
+            self.countdown_label_var.set(_('closing_in', s=seconds_left))
+            self.after_id = self.after(1000, lambda: self.countdown(seconds_left - 1))
+        else:
+            self.close_toast()
+
+    def close_toast(self):
+        if hasattr(self, 'after_id'):
+            self.after_cancel(self.after_id)
+        self.app.on_toast_closed(self)
+        self.destroy()
+
+
+# ==============================================================================
+# CLASSE PrivilegedServiceHelper - UM ÚNICO PROCESSO ELEVADO PARA OS COMANDOS systemctl
+# ==============================================================================
+class PrivilegedServiceHelper:
+    """
+    Cliente do helper privilegiado: inicia o processo elevado uma única vez (sudo -n ou, se não houver regra
+    NOPASSWD, pkexec com a janela de senha do polkit) e reutiliza o pipe para todos os comandos.
+    Se o helper não puder ser iniciado, 'run' devolve None e o chamador usa o 'sudo systemctl' tradicional.
+    A inicialização (que pode aguardar a senha do polkit) não segura o lock dos pedidos: enquanto ela
+    acontece, os demais chamadores recebem None na hora em vez de ficarem parados.
+    """
+
+    RETRY_AFTER = 60.0
+    LAUNCH_TIMEOUT = 120.0  # pkexec pode aguardar a senha do usuário
+
+    def __init__(self, timeout=35.0):
+        self.timeout = timeout
+        self.process = None
+        self._lock = threading.Lock()  # serializa os pedidos no pipe do helper em execução
+        self._start_lock = threading.Lock()  # uma inicialização por vez
+        self._responses = queue.Queue()
+        self._next_id = 0
+        self._failed_at = None
+
+    @staticmethod
+    def is_needed():
+        return platform.system() == "Linux" and SYSTEMCTL_AVAILABLE and os.geteuid() != 0
+
+    def _helper_command(self):
+        if getattr(sys, "frozen", False):
+            return [sys.executable, SERVICE_HELPER_FLAG]
+        return [sys.executable, os.path.abspath(__file__), SERVICE_HELPER_FLAG]
+
+    def _is_running(self):
+        return self.process is not None and self.process.poll() is None
+
+    def _ensure_started(self):
+        """ Inicia o helper se preciso. Retorna False se indisponível ou se outra thread já o estiver iniciando. """
+        if self._is_running():
+            return True
+        if not self._start_lock.acquire(blocking=False):
+            return False
+        try:
+            if self._is_running():
+                return True
+            if self._failed_at is not None and time.monotonic() - self._failed_at < self.RETRY_AFTER:
+                return False
+            launchers = [["sudo", "-n"]] + ([["pkexec"]] if shutil.which("pkexec") else [])
+            for launcher in launchers:
+                try:
+                    process = subprocess.Popen(launcher + self._helper_command(), stdin=subprocess.PIPE,
+                                               stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+                                               bufsize=1)
+                except OSError as e:
+                    app_logger.warning(f"Helper de serviços: falha ao executar {launcher[0]}: {e}")
+                    continue
+                responses = queue.Queue()
+                threading.Thread(target=self._reader, args=(process, responses), daemon=True,
+                                 name="ServiceHelperReader").start()
+                reply = self._exchange(process, responses, 0, "ping", [], self.LAUNCH_TIMEOUT)
+                if reply and reply.get("stdout") == "0":
+                    app_logger.info(f"Helper de serviços privilegiado iniciado via {launcher[0]} (PID {process.pid}).")
+                    with self._lock:
+                        self.process, self._responses = process, responses
+                    self._failed_at = None
+                    return True
+                self._stop_process(process)
+            app_logger.warning("Helper de serviços privilegiado indisponível; usando 'sudo systemctl' por comando.")
+            self._failed_at = time.monotonic()
+            return False
+        finally:
+            self._start_lock.release()
+
+    @staticmethod
+    def _reader(process, responses):
+        for line in process.stdout:
+            try:
+                responses.put(json.loads(line))
+            except ValueError:
+                continue
+        responses.put(None)  # helper encerrado
+
+    @staticmethod
+    def _exchange(process, responses, request_id, op, units, timeout):
+        """ Envia um pedido e aguarda a resposta de mesmo id. Retorna None se o helper não responder a tempo. """
+        try:
+            process.stdin.write(json.dumps({"id": request_id, "op": op, "units": units}) + "\n")
+            process.stdin.flush()
+        except (OSError, ValueError):
+            return None
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                reply = responses.get(timeout=max(0.0, deadline - time.monotonic()))
+            except queue.Empty:
+                app_logger.error(f"Helper de serviços não respondeu a '{op}' em {timeout}s.")
+                return None
+            if reply is None or reply.get("id") == request_id:
+                return reply
+
+    def _request_locked(self, op, units):
+        self._next_id += 1
+        reply = self._exchange(self.process, self._responses, self._next_id, op, units, self.timeout)
+        if reply is None:
+            self._stop_process_locked()
+        return reply
+
+    def run(self, op, units=()):
+        """ Executa uma operação no helper. Retorna CompletedProcess, ou None se o helper estiver indisponível. """
+        units = list(units)
+        if not self._ensure_started():
+            return None
+        with self._lock:
+            if not self._is_running():
+                return None
+            reply = self._request_locked(op, units)
+        if reply is None:
+            return None
+        if "error" in reply:
+            raise ValueError(f"Helper de serviços recusou '{op}': {reply['error']}")
+        return subprocess.CompletedProcess(['systemctl', op] + units, reply["returncode"], reply["stdout"],
+                                           reply["stderr"])
+
+    @staticmethod
+    def _stop_process(process):
+        try:
+            process.stdin.close()
+            process.wait(timeout=2)
+        except Exception:
+            pass  # o helper roda como root; sem stdin ele termina sozinho
+
+    def _stop_process_locked(self):
+        if self.process:
+            self._stop_process(self.process)
+        self.process = None
+
+    def close(self):
+        with self._lock:
+            self._stop_process_locked()
+
+
+# ==============================================================================
+# BACKENDS DE SERVIÇO - systemd / SCM DO WINDOWS / PROCESSO FILHO
+# ==============================================================================
+class ServiceBackend:
+    """
+    Interface comum dos backends usados pelo ServiceManager. O backend do SO é escolhido uma única vez
+    (ServiceBackend.for_platform); cada consulta de status custa uma única chamada nativa. Toda operação
+    é cronometrada e os contadores ficam disponíveis em stats().
+    """
+    name = "base"
+    available = False
+    log_key = None  # sufixo das chaves de log 'log_executing_<log_key>_<ação>' (None = SO não suportado)
+
+    def __init__(self, logger=app_logger):
+        self.logger = logger
+        self._stats_lock = threading.Lock()
+        self._stats = {}  # operação -> [chamadas, segundos totais, maior duração]
+
+    @staticmethod
+    def for_platform(os_type=None, logger=app_logger):
+        os_type = os_type or platform.system()
+        if os_type == "Linux" and SYSTEMCTL_AVAILABLE:
+            return SystemdServiceBackend(logger)
+        if os_type == "Windows" and PYWIN32_AVAILABLE:
+            return WindowsSCMServiceBackend(logger)
+        return ServiceBackend(logger)
+
+    def _timed(self, op, func, *args):
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._stats_lock:
+                entry = self._stats.setdefault(op, [0, 0.0, 0.0])
+                entry[0] += 1
+                entry[1] += elapsed
+                entry[2] = max(entry[2], elapsed)
+
+    def stats(self):
+        """ {operação: {"calls", "total_ms", "avg_ms", "max_ms"}} desde o início da aplicação. """
+        with self._stats_lock:
+            return {op: {"calls": calls, "total_ms": total * 1000, "avg_ms": total * 1000 / calls,
+                         "max_ms": longest * 1000}
+                    for op, (calls, total, longest) in self._stats.items()}
+
+    def unit_name(self, service_name):
+        """ Nome exibido nos logs de comando (ex.: a unidade '.service' no systemd). """
+        return service_name
+
+    # --- Operações (públicas = cronometradas) ---
+
+    def query_status(self, service_name):
+        return self._timed("status", self._query_status, service_name)
+
+    def query_status_many(self, service_names):
+        """ Retorna ({nome: status}, {nome: PID principal ou None}). """
+        return self._timed("status_many", self._query_status_many, list(service_names))
+
+    def control(self, action, service_name):
+        """ 'start' ou 'stop'. Levanta exceção se o comando falhar; retorna False se o backend não controla serviços. """
+        return self._timed(action, self._control, action, service_name)
+
+    def list_services(self):
+        return self._timed("list", self._list_services)
+
+    # --- Implementação (sobrescrita pelos backends) ---
+
+    def _query_status(self, service_name):
+        return "UNSUPPORTED"
+
+    def _query_status_many(self, service_names):
+        return {name: self._query_status(name) for name in service_names}, {}
+
+    def _control(self, action, service_name):
+        return False  # SO não suportado (mesmo resultado de log_key None no ServiceManager)
+
+    def _list_services(self):
+        return []
+
+
+class SystemdServiceBackend(ServiceBackend):
+    """ Linux: 'systemctl' (comandos que exigem root vão pelo PrivilegedServiceHelper, se houver). """
+    name = "systemd"
+    available = True
+    log_key = "sysd"
+
+    def __init__(self, logger=app_logger):
+        super().__init__(logger)
+        self.privileged_helper = None
+
+    def unit_name(self, service_name):
+        return ServiceManager.systemd_unit(service_name)
+
+    def _query_status(self, service_name):
+        try:
+            result = subprocess.run(['systemctl', 'is-active', self.unit_name(service_name)],
+                                    capture_output=True, text=True, timeout=5)
+            status = result.stdout.strip()
+            if result.returncode == 4: return "NOT_FOUND"
+            return SYSTEMD_ACTIVE_STATE_STATUS.get(status, "UNKNOWN")
+        except Exception:
+            return "ERROR"
+
+    def _query_status_many(self, service_names):
+        result = subprocess.run(
+            ['systemctl', 'show', '-p', 'Id,LoadState,ActiveState,SubState,MainPID', '--']
+            + [self.unit_name(name) for name in service_names],
+            capture_output=True, text=True, timeout=15)
+        return self.parse_show_output(result.stdout, service_names)
+
+    def parse_show_output(self, output, service_names):
+        """ Interpreta os blocos 'Chave=Valor' (um por unidade, separados por linha em branco, na ordem pedida). """
+        blocks = [dict(line.split("=", 1) for line in block.splitlines() if "=" in line)
+                  for block in output.strip().split("\n\n") if block.strip()]
+        by_id = {block.get("Id"): block for block in blocks}
+        statuses, pids = {}, {}
+        for index, name in enumerate(service_names):
+            props = by_id.get(self.unit_name(name))
+            if props is None and len(blocks) == len(service_names):
+                props = blocks[index]  # unidade chamada por um alias: o Id é o nome canônico
+            # Sem bloco ou unidade inexistente: o PID antigo não vale mais (pode ter sido reutilizado).
+            pids[name] = None
+            if props is None:
+                statuses[name] = "UNKNOWN"
+                continue
+            if props.get("LoadState") == "not-found":
+                statuses[name] = "NOT_FOUND"
+                continue
+            statuses[name] = SYSTEMD_ACTIVE_STATE_STATUS.get(props.get("ActiveState"), "UNKNOWN")
+            main_pid = props.get("MainPID", "0")
+            pids[name] = int(main_pid) if main_pid.isdigit() and main_pid != "0" else None
+        return statuses, pids
+
+    def run_privileged(self, op, units=()):
+        """ Executa uma operação do systemctl que exige root: pelo helper privilegiado, se houver, ou com sudo. """
+        if self.privileged_helper:
+            result = self.privileged_helper.run(op, units)
+            if result is not None:
+                return result
+        cmd_prefix = ['sudo'] if os.geteuid() != 0 else []
+        return subprocess.run(cmd_prefix + ['systemctl'] + SERVICE_HELPER_OPERATIONS[op] + list(units),
+                              capture_output=True, text=True, timeout=30)
+
+    def _control(self, action, service_name):
+        self.run_privileged(action, [self.unit_name(service_name)]).check_returncode()
+
+    def _list_services(self):
+        """ Nomes (sem '.service') de todas as unidades de serviço do systemd. """
+        result = self.run_privileged("list-units")
+        result.check_returncode()
+        services_raw = [line.split()[0] for line in result.stdout.strip().split('\n') if line.split()]
+        return sorted(set(s.replace('.service', '') for s in services_raw))
+
+
+class WindowsSCMServiceBackend(ServiceBackend):
+    """
+    Windows: consulta o Service Control Manager direto pelo pywin32 (win32service), uma chamada por
+    serviço e sem abrir processos; sem o módulo, recorre ao 'sc query' / 'sc queryex'.
+    """
+    name = "windows-scm"
+    available = True
+    log_key = "sc"
+    SCM_STATES = {1: "STOPPED", 2: "START_PENDING", 3: "STOP_PENDING", 4: "RUNNING"}
+
+    @staticmethod
+    def _startupinfo():
+        startupinfo = subprocess.STARTUPINFO()
+        startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+        startupinfo.wShowWindow = subprocess.SW_HIDE
+        return startupinfo
+
+    def _query_native(self, service_name):
+        """ (status, PID) via QueryServiceStatusEx. """
+        scm = win32service.OpenSCManager(None, None, win32service.SC_MANAGER_CONNECT)
+        try:
+            handle = win32service.OpenService(scm, service_name, win32service.SERVICE_QUERY_STATUS)
+            try:
+                info = win32service.QueryServiceStatusEx(handle)
+            finally:
+                win32service.CloseServiceHandle(handle)
+        except win32service.error as e:
+            if e.winerror == 1060:  # ERROR_SERVICE_DOES_NOT_EXIST
+                return "NOT_FOUND", None
+            raise
+        finally:
+            win32service.CloseServiceHandle(scm)
+        return self.SCM_STATES.get(info["CurrentState"], "UNKNOWN"), info["ProcessId"] or None
+
+    def _query_status(self, service_name):
+        try:
+            if WIN32SERVICE_AVAILABLE:
+                return self._query_native(service_name)[0]
+            result = subprocess.run(['sc', 'query', service_name], capture_output=True, text=False,
+                                    check=False, startupinfo=self._startupinfo(), timeout=10)
+            output_lower = (result.stdout + result.stderr).decode('latin-1', errors='replace').lower()
+            if any(err in output_lower for err in
+                   ["failed 1060", "falha 1060", "does not exist as an installed service"]): return "NOT_FOUND"
+            if "state" not in output_lower and "estado" not in output_lower: return "ERROR"
+            if "start_pending" in output_lower: return "START_PENDING"
+            if "stop_pending" in output_lower: return "STOP_PENDING"
+            if "running" in output_lower or "em execução" in output_lower: return "RUNNING"
+            if "stopped" in output_lower or "parado" in output_lower: return "STOPPED"
+            return "UNKNOWN"
+        except Exception:
+            return "ERROR"
+
+    def _query_status_many(self, service_names):
+        if WIN32SERVICE_AVAILABLE:
+            statuses, pids = {}, {}
+            for name in service_names:
+                try:
+                    statuses[name], pids[name] = self._query_native(name)
+                except win32service.error as e:  # ex.: acesso negado a um serviço; os demais seguem válidos
+                    self.logger.warning(f"SCM: falha ao consultar '{name}': {e}")
+                    statuses[name], pids[name] = "ERROR", None
+            return statuses, pids
+        result = subprocess.run(['sc', 'queryex', 'type=', 'service', 'state=', 'all'], capture_output=True,
+                                text=False, check=False, startupinfo=self._startupinfo(), timeout=15)
+        return self.parse_queryex_output(result.stdout.decode('latin-1', errors='replace'), service_names)
+
+    @staticmethod
+    def parse_queryex_output(output, service_names):
+        """ Interpreta a listagem de 'sc queryex' (blocos SERVICE_NAME / STATE / PID). """
+        wanted = {name.lower(): name for name in service_names}
+        statuses, pids = {name: "NOT_FOUND" for name in service_names}, dict.fromkeys(service_names)
+        current = None
+        for line in output.splitlines():
+            key, _sep, value = line.strip().partition(":")
+            key, value = key.strip().upper(), value.strip()
+            if key in ("SERVICE_NAME", "NOME_DO_SERVIÇO"):
+                current = wanted.get(value.lower())
+            elif current and key in ("STATE", "ESTADO"):
+                state = value.split()[-1].upper() if value.split() else ""
+                statuses[current] = {"RUNNING": "RUNNING", "STOPPED": "STOPPED", "START_PENDING": "START_PENDING",
+                                     "STOP_PENDING": "STOP_PENDING"}.get(state, "UNKNOWN")
+            elif current and key == "PID":
+                pids[current] = int(value) if value.isdigit() and value != "0" else None
+        return statuses, pids
+
+    def _control(self, action, service_name):
+        subprocess.run(["sc", action, service_name], check=True, startupinfo=self._startupinfo(), timeout=30)
+
+    def _list_services(self):
+        pythoncom.CoInitialize()
+        try:
+            wmi = win32com.client.GetObject('winmgmts:')
+            return sorted([s.Name for s in wmi.InstancesOf('Win32_Service') if s.Name and s.AcceptStop])
+        finally:
+            pythoncom.CoUninitialize()
+
+
+# ==============================================================================
+# CLASSE ChildProcessBackend - SERVIDOR COMO PROCESSO FILHO (SEM systemd / sc)
+# ==============================================================================
+# Serviços com este prefixo são processos filhos supervisionados pela própria ferramenta
+PROCESS_SERVICE_PREFIX = "process:"
+
+
+class ChildProcessBackend(ServiceBackend):
+    """
+    Executa o comando do servidor como processo filho. A saída (stdout + stderr) é lida direto do pipe e
+    entregue linha a linha aos ouvintes registrados, sem polling de arquivo; a saída do processo é detectada
+    imediatamente pela thread leitora (EOF + wait()). A parada envia SIGTERM (CTRL_BREAK no Windows) e,
+    se o processo não sair dentro do prazo, SIGKILL.
+    """
+    name = "process"
+    available = True
+    log_key = "process"
+
+    def __init__(self, logger=app_logger, on_exit=None):
+        super().__init__(logger)
+        self.on_exit = on_exit  # callback(nome, status) chamado quando um processo termina
+        self._lock = threading.Lock()
+        self._specs = {}  # nome -> {"command", "cwd", "stop_grace"}
+        self._procs = {}  # nome -> subprocess.Popen
+        self._stop_requested = set()
+        self._listeners = {}  # nome -> set de callbacks(linha)
+
+    def register(self, name, command, cwd=None, stop_grace=10.0):
+        """ Registra (ou atualiza) o comando de um serviço. Não afeta um processo já em execução. """
+        with self._lock:
+            self._specs[name] = {"command": command, "cwd": cwd or None, "stop_grace": max(1.0, float(stop_grace))}
+
+    def unregister(self, name):
+        with self._lock:
+            self._specs.pop(name, None)
+
+    def is_registered(self, name):
+        with self._lock:
+            return name in self._specs
+
+    def add_line_listener(self, name, callback):
+        with self._lock:
+            self._listeners.setdefault(name, set()).add(callback)
+
+    def remove_line_listener(self, name, callback):
+        with self._lock:
+            self._listeners.get(name, set()).discard(callback)
+
+    def status(self, name):
+        with self._lock:
+            if name not in self._specs and name not in self._procs:
+                return "NOT_FOUND"
+            proc = self._procs.get(name)
+            if proc is None:
+                return "STOPPED"
+            if proc.poll() is None:
+                return "STOP_PENDING" if name in self._stop_requested else "RUNNING"
+            return "STOPPED" if proc.returncode == 0 or name in self._stop_requested else "FAILED"
+
+    def pid(self, name):
+        with self._lock:
+            proc = self._procs.get(name)
+            return proc.pid if proc is not None and proc.poll() is None else None
+
+    def _query_status(self, service_name):
+        return self.status(service_name)
+
+    def _query_status_many(self, service_names):
+        return ({name: self.status(name) for name in service_names},
+                {name: self.pid(name) for name in service_names})
+
+    def _control(self, action, service_name):
+        if action == "start":
+            self.start(service_name)
+        elif not self.stop(service_name):
+            raise RuntimeError(f"O processo '{service_name}' não terminou.")
+
+    def start(self, name):
+        with self._lock:
+            spec = self._specs.get(name)
+            proc = self._procs.get(name)
+            if spec is None:
+                raise ValueError(f"Nenhum comando registrado para '{name}'.")
+            if proc is not None and proc.poll() is None:
+                return proc.pid
+            cwd = spec["cwd"]
+            if cwd is None:
+                # Sem pasta definida, roda na pasta do executável (servidores costumam procurar arquivos ao lado dele)
+                executable = shlex.split(spec["command"], posix=platform.system() != "Windows")[0].strip('"')
+                cwd = os.path.dirname(executable) if os.path.isfile(executable) and os.path.dirname(executable) else None
+            if platform.system() == "Windows":
+                args = spec["command"]
+                popen_kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP | subprocess.CREATE_NO_WINDOW}
+            else:
+                args = shlex.split(spec["command"])
+                popen_kwargs = {"start_new_session": True}
+            proc = subprocess.Popen(args, cwd=cwd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                    stderr=subprocess.STDOUT, encoding='latin-1', errors='replace', bufsize=1,
+                                    **popen_kwargs)
+            self._procs[name] = proc
+            self._stop_requested.discard(name)
+        threading.Thread(target=self._reader_worker, args=(name, proc), daemon=True,
+                         name=f"ChildProcessOutput-{name}").start()
+        self.logger.info(f"Processo '{name}' iniciado (PID {proc.pid}): {spec['command']}")
+        return proc.pid
+
+    def stop(self, name, grace=None):
+        """ SIGTERM e, após 'grace' segundos sem sair, SIGKILL. Bloqueia até o processo terminar. """
+        with self._lock:
+            proc = self._procs.get(name)
+            if grace is None:
+                grace = self._specs.get(name, {}).get("stop_grace", 10.0)
+            if proc is None or proc.poll() is not None:
+                return True
+            self._stop_requested.add(name)
+        try:
+            if platform.system() == "Windows":
+                proc.send_signal(signal.CTRL_BREAK_EVENT)
+            else:
+                proc.terminate()
+            proc.wait(timeout=grace)
+        except subprocess.TimeoutExpired:
+            self.logger.warning(f"Processo '{name}' não saiu em {grace:.0f}s após SIGTERM; enviando SIGKILL.")
+            proc.kill()
+            proc.wait(timeout=10)
+        except OSError:
+            pass  # processo já terminou entre a verificação e o sinal
+        return proc.poll() is not None
+
+    def wait_exit(self, name, timeout, cancel_event=None):
+        """ Aguarda a saída pelo handle do processo. Retorna True, False (tempo esgotado) ou None (cancelado). """
+        with self._lock:
+            proc = self._procs.get(name)
+        if proc is None:
+            return True
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                proc.wait(timeout=max(0.0, min(0.25, deadline - time.monotonic())))
+                return True
+            except subprocess.TimeoutExpired:
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+                if time.monotonic() >= deadline:
+                    return False
+
+    def shutdown(self, grace=5.0):
+        with self._lock:
+            names = [name for name, proc in self._procs.items() if proc.poll() is None]
+        for name in names:
+            self.stop(name, grace)
+
+    def _reader_worker(self, name, proc):
+        try:
+            for line in proc.stdout:
+                with self._lock:
+                    listeners = list(self._listeners.get(name, ()))
+                for callback in listeners:
+                    try:
+                        callback(line)
+                    except Exception as e:
+                        self.logger.error(f"Erro ao processar saída do processo '{name}': {e}", exc_info=True)
+        finally:
+            proc.stdout.close()
+            returncode = proc.wait()
+            status = self.status(name)
+            self.logger.info(f"Processo '{name}' (PID {proc.pid}) terminou com código {returncode} ({status}).")
+            if self.on_exit:
+                self.on_exit(name, status)
+
+
+# ==============================================================================
+# CLASSE ServiceManager - CAMADA ÚNICA DE CONTROLE DE SERVIÇOS (sc / systemctl)
+# ==============================================================================
+class ServiceManager:
+    """
+    Centraliza as consultas e comandos de serviço usados pelas abas Restarter e Votemap.
+    O backend do SO (systemd, SCM do Windows) é resolvido uma vez na criação; serviços 'process:<nome>' vão
+    para o ChildProcessBackend. O status de cada unidade fica em cache por 'status_ttl' segundos, e chamadas
+    simultâneas para a mesma unidade compartilham uma única consulta em andamento (single-flight).
+    """
+
+    def __init__(self, translator, status_ttl=2.0, logger=app_logger, backend=None):
+        self.os_type = platform.system()
+        self.translator = translator
+        self.status_ttl = status_ttl
+        self.logger = logger
+        self.backend = backend or ServiceBackend.for_platform(self.os_type, logger)
+        self.process_backend = ChildProcessBackend(logger)  # serviços 'process:<nome>' (processo filho)
+        self._lock = threading.Lock()
+        self._status_cache = {}  # unidade -> (status, time.monotonic() da consulta)
+        self._in_flight = {}  # unidade -> Future da consulta em andamento
+        self.main_pids = {}  # unidade -> PID principal informado pela última consulta em lote (ou None)
+        self.event_driven_units = set()  # unidades cujo cache é mantido por eventos (D-Bus) e não expira
+        self.logger.info(f"Backend de serviços: {self.backend.name}.")
+
+    @property
+    def can_manage_services(self):
+        return self.backend.available
+
+    @property
+    def privileged_helper(self):
+        """ PrivilegedServiceHelper do backend systemd (Linux não-root), se houver. """
+        return getattr(self.backend, "privileged_helper", None)
+
+    @privileged_helper.setter
+    def privileged_helper(self, helper):
+        self.backend.privileged_helper = helper
+
+    @staticmethod
+    def is_process_service(service_name):
+        return bool(service_name) and service_name.startswith(PROCESS_SERVICE_PREFIX)
+
+    def can_manage(self, service_name):
+        """ Se este serviço pode ser controlado aqui: processos filhos sempre; serviços do SO conforme o backend. """
+        return self.is_process_service(service_name) or self.can_manage_services
+
+    def _backend_for(self, service_name):
+        return self.process_backend if self.is_process_service(service_name) else self.backend
+
+    @staticmethod
+    def systemd_unit(service_name):
+        return service_name if service_name.endswith(".service") else f"{service_name}.service"
+
+    def timing_stats(self):
+        """ Contadores de tempo por backend e operação (ver ServiceBackend.stats). """
+        return {backend.name: backend.stats() for backend in (self.backend, self.process_backend)}
+
+    # --- Status ---
+
+    def get_status(self, service_name, max_age=None):
+        """
+        Retorna RUNNING, STOPPED, FAILED, START_PENDING, STOP_PENDING, NOT_FOUND, UNKNOWN, ERROR,
+        SYSTEMCTL_NOT_FOUND ou UNSUPPORTED. 'max_age' (segundos) sobrepõe o TTL do cache; 0 força nova consulta.
+        """
+        if not service_name:
+            return "NOT_FOUND"
+        if self.is_process_service(service_name):
+            return self.process_backend.query_status(service_name)
+        # Unidades acompanhadas por eventos têm o cache sempre atualizado; só 'max_age' explícito força consulta.
+        event_driven = max_age is None and service_name in self.event_driven_units
+        max_age = self.status_ttl if max_age is None else max_age
+        with self._lock:
+            cached = self._status_cache.get(service_name)
+            if cached and (event_driven or time.monotonic() - cached[1] <= max_age):
+                return cached[0]
+            future = self._in_flight.get(service_name)
+            is_owner = future is None
+            if is_owner:
+                future = self._in_flight[service_name] = Future()
+        if not is_owner:
+            try:
+                return future.result(timeout=30)
+            except Exception:
+                return "ERROR"
+        status = "ERROR"
+        try:
+            status = self.backend.query_status(service_name)
+        finally:
+            with self._lock:
+                self._status_cache[service_name] = (status, time.monotonic())
+                self._in_flight.pop(service_name, None)
+            future.set_result(status)
+        return status
+
+    def get_status_many(self, service_names):
+        """
+        Consulta o status de várias unidades com uma consulta em lote por backend ('systemctl show' no Linux,
+        SCM no Windows) e atualiza o cache. Retorna {nome_servico: status}.
+        """
+        service_names = [name for name in dict.fromkeys(service_names) if name]
+        statuses = {}
+        for backend in (self.backend, self.process_backend):
+            names = [name for name in service_names if self._backend_for(name) is backend]
+            if not names:
+                continue
+            if not backend.available:
+                statuses.update((name, "UNSUPPORTED") for name in names)
+                continue
+            try:
+                backend_statuses, pids = backend.query_status_many(names)
+            except Exception as e:
+                self.logger.error(f"Erro na consulta em lote de {len(names)} serviço(s): {e}", exc_info=True)
+                backend_statuses, pids = {name: "ERROR" for name in names}, dict.fromkeys(names)
+            self.main_pids.update(pids)
+            statuses.update(backend_statuses)
+            if backend is self.backend:
+                now = time.monotonic()
+                with self._lock:
+                    for name, status in backend_statuses.items():
+                        self._status_cache[name] = (status, now)
+        return statuses
+
+    def get_status_and_pid(self, service_name):
+        """ Status atual (sem cache) e PID principal da unidade, em uma única consulta. """
+        status = self.get_status_many([service_name]).get(service_name, "ERROR")
+        return status, self.main_pids.get(service_name)
+
+    @staticmethod
+    def _pid_alive(pid):
+        if platform.system() == "Windows":
+            return False  # no Windows o 'sc queryex' já informa PID 0 quando o processo terminou
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True  # existe, mas pertence a outro usuário (ex.: serviço rodando como root)
+        return True
+
+    def wait_until_stopped(self, service_name, timeout, cancel_event=None, main_pid=None,
+                           initial_interval=0.25, max_interval=2.0):
+        """
+        Consulta a unidade com backoff exponencial até ela estar parada e o processo principal ter saído.
+        Retorna (parado, segundos): parado é True, False (tempo esgotado) ou None (cancelado).
+        """
+        start = time.monotonic()
+        if self.is_process_service(service_name):
+            # Processo filho: o próprio handle do processo sinaliza a saída, sem consultas periódicas
+            stopped = self.process_backend.wait_exit(service_name, timeout, cancel_event)
+            return stopped, time.monotonic() - start
+        interval = initial_interval
+        while True:
+            status, current_pid = self.get_status_and_pid(service_name)
+            elapsed = time.monotonic() - start
+            if status in ("STOPPED", "FAILED", "NOT_FOUND") and current_pid is None and not (
+                    main_pid and self._pid_alive(main_pid)):
+                return True, elapsed
+            remaining = timeout - elapsed
+            if remaining <= 0:
+                return False, elapsed
+            if cancel_event is not None:
+                if cancel_event.wait(min(interval, remaining)):
+                    return None, time.monotonic() - start
+            else:
+                time.sleep(min(interval, remaining))
+            interval = min(interval * 2, max_interval)
+
+    def wait_until_running(self, service_name, timeout, cancel_event=None, initial_interval=0.25, max_interval=2.0):
+        """
+        Consulta o serviço (sem cache) com backoff exponencial até ele estar RUNNING.
+        Retorna (ativo, segundos): ativo é True, False (tempo esgotado ou falha) ou None (cancelado).
+        """
+        start = time.monotonic()
+        interval = initial_interval
+        while True:
+            status = self.get_status(service_name, max_age=0)
+            elapsed = time.monotonic() - start
+            if status == "RUNNING":
+                return True, elapsed
+            remaining = timeout - elapsed
+            if status in ("FAILED", "NOT_FOUND", "UNSUPPORTED") or remaining <= 0:
+                return False, elapsed
+            if cancel_event is not None:
+                if cancel_event.wait(min(interval, remaining)):
+                    return None, time.monotonic() - start
+            else:
+                time.sleep(min(interval, remaining))
+            interval = min(interval * 2, max_interval)
+
+    def set_cached_status(self, service_name, status):
+        """ Atualiza o cache com um status obtido por outra via (ex.: consulta em lote). """
+        with self._lock:
+            self._status_cache[service_name] = (status, time.monotonic())
+
+    def invalidate(self, service_name):
+        with self._lock:
+            self._status_cache.pop(service_name, None)
+
+    def list_services(self):
+        """ Nomes de todos os serviços do SO (usado pelo diálogo de seleção de serviço). """
+        return self.backend.list_services()
+
+    def describe_status(self, status):
+        """ Texto e cor exibidos no rótulo de serviço das abas para um status. """
+        _ = self.translator.get
+        if self.os_type == "Windows":
+            running, stopped = _('status_running_win'), _('status_stopped_win')
+            starting, stopping = _('status_starting_win'), _('status_stopping_win')
+        else:
+            running, stopped = f"({_('status_active_linux')})", f"({_('status_inactive_linux')})"
+            starting, stopping = f"({_('status_activating_linux')})", f"({_('status_deactivating_linux')})"
+        unavailable = {"Windows": _('na_pywin32'), "Linux": _('na_systemctl')}.get(
+            self.os_type, _('na_os', os=self.os_type))
+        status_map = {
+            "RUNNING": (running, "green"), "STOPPED": (stopped, "red"),
+            "FAILED": (f"({_('status_failed_linux')})", "red"),
+            "START_PENDING": (starting, "blue"), "STOP_PENDING": (stopping, "blue"),
+            "NOT_FOUND": (_('status_not_found_long'), "orange"), "ERROR": (_('status_error'), "red"),
+            "SYSTEMCTL_NOT_FOUND": (f"({_('na_systemctl')})", "gray"),
+            "UNSUPPORTED": (f"({unavailable})", "gray"),
+        }
+        return status_map.get(status, (f"({_('status_unknown')})", "gray"))
+
+    # --- Comandos ---
+
+    def start(self, service_name, log_callback=None, logger=None):
+        return self._run_control_command("start", service_name, log_callback, logger)
+
+    def stop(self, service_name, log_callback=None, logger=None):
+        return self._run_control_command("stop", service_name, log_callback, logger)
+
+    def _run_control_command(self, action, service_name, log_callback=None, logger=None):
+        """ Executa a ação ('start'/'stop') pelo backend do serviço. Retorna True se o comando foi aceito. """
+        _ = self.translator.get
+        log = log_callback or (lambda text: None)
+        backend = self._backend_for(service_name)
+        try:
+            if not backend.log_key:
+                log(_("log_unsupported_os_control", os=self.os_type) + "\n")
+                return False
+            log(_(f"log_executing_{backend.log_key}_{action}", service=backend.unit_name(service_name)) + "\n")
+            if backend.control(action, service_name) is False:
+                log(_("log_unsupported_os_control", os=self.os_type) + "\n")
+                return False
+            log(_(f"log_{action}_cmd_sent", service=service_name) + "\n")
+            return True
+        except Exception as e:
+            log(_(f"log_{action}_error", service=service_name, error=e) + "\n")
+            action_pt = "parar" if action == "stop" else "iniciar"
+            (logger or self.logger).error(f"Erro ao {action_pt} serviço '{service_name}': {e}", exc_info=True)
+            return False
+        finally:
+            self.invalidate(service_name)
+
+
+# ==============================================================================
+# CLASSE FleetStatusPoller - STATUS DE TODOS OS SERVIÇOS EM UMA ÚNICA CONSULTA
+# ==============================================================================
+class FleetStatusPoller:
+    """
+    Atualiza periodicamente o rótulo de serviço de todas as abas a partir de uma única consulta em lote
+    (ServiceManager.get_status_many), em vez de um processo 'systemctl'/'sc' por aba.
+    """
+
+    def __init__(self, app, interval=15.0):
+        self.app = app
+        self.interval = interval
+        self._wake_event = threading.Event()
+        self.thread = threading.Thread(target=self._worker, daemon=True, name="FleetStatusPoller")
+
+    def start(self):
+        if self.interval > 0 and self.app.service_manager.can_manage_services and not self.thread.is_alive():
+            self.thread.start()
+
+    def poll_now(self):
+        self._wake_event.set()
+
+    def poll_once(self):
+        tabs = [tab for tab in self.app.restarter_servidores + self.app.votemap_servidores if tab.nome_servico.get()]
+        if not tabs:
+            return {}
+        statuses = self.app.service_manager.get_status_many([tab.nome_servico.get() for tab in tabs])
+        for tab in tabs:
+            status = statuses.get(tab.nome_servico.get())
+            if status and not self.app._shutting_down:
+                tab.display_service_status(status)
+        return statuses
+
+    def _worker(self):
+        while not self.app._app_stop_event.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                app_logger.error(f"Erro na atualização em lote do status dos serviços: {e}", exc_info=True)
+            self._wake_event.wait(self.interval)
+            self._wake_event.clear()
+
+
+# ==============================================================================
+# CLASSE ProcessResourceSampler - CPU / RSS / E/S DOS SERVIDORES VIA /proc
+# ==============================================================================
+SPARKLINE_BLOCKS = "▁▂▃▄▅▆▇█"
+
+
+def sparkline(values):
+    """ Minigráfico em texto (um bloco Unicode por amostra), escalado entre o mínimo e o máximo da série. """
+    if not values:
+        return ""
+    low, high = min(values), max(values)
+    span = (high - low) or 1.0
+    top = len(SPARKLINE_BLOCKS) - 1
+    return "".join(SPARKLINE_BLOCKS[int((v - low) / span * top)] for v in values)
+
+
+class ResourceRing:
+    """ Buffer circular compacto (array de floats de 32 bits) com as últimas amostras de CPU (%) e RSS (MB). """
+    __slots__ = ("cpu", "rss_mb", "size", "count", "pos")
+
+    def __init__(self, size=120):
+        self.size = size
+        self.cpu = array('f', bytes(4 * size))
+        self.rss_mb = array('f', bytes(4 * size))
+        self.count = 0
+        self.pos = 0
+
+    def append(self, cpu, rss_mb):
+        self.cpu[self.pos], self.rss_mb[self.pos] = cpu, rss_mb
+        self.pos = (self.pos + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def series(self, buffer, last=None):
+        """ Amostras em ordem cronológica (as 'last' mais recentes, se informado). """
+        n = self.count if last is None else min(last, self.count)
+        start = (self.pos - n) % self.size
+        return [buffer[(start + i) % self.size] for i in range(n)]
+
+
+class ProcessResourceSampler:
+    """
+    Amostra, em uma única thread e a intervalo fixo, o processo principal do serviço de cada aba lendo
+    /proc/<pid>/stat (CPU), statm (RSS) e io (bytes lidos/escritos). Os PIDs vêm da consulta em lote do
+    ServiceManager e só são reconsultados a cada 'pid_refresh_interval' (todas as abas, numa consulta) ou,
+    para a aba cujo processo acabou de sumir (ou recém-adicionada), no ciclo seguinte. Abas com o serviço
+    parado esperam o próximo 'pid_refresh_interval'.
+    As amostras ficam em um ResourceRing por aba; o limite de RSS de cada aba (GB por N minutos) dispara o
+    reinício pela fila normal. Só funciona onde existe /proc (Linux).
+    """
+    SPARKLINE_WIDTH = 30
+
+    def __init__(self, app, interval=5.0, history=120, pid_refresh_interval=30.0):
+        self.app = app
+        self.interval = interval
+        self.history = history
+        self.pid_refresh_interval = pid_refresh_interval
+        self.page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+        self.clock_ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self._state = {}  # aba -> {"pid", "needs_pid", "ring", "last" (monotonic, ticks, read, write), "over_since"}
+        self._pids_resolved_at = None
+        self.thread = threading.Thread(target=self._worker, daemon=True, name="ProcessResourceSampler")
+
+    @staticmethod
+    def is_supported():
+        return os.path.isdir("/proc/self")
+
+    def start(self):
+        if self.interval > 0 and self.is_supported():
+            self.thread.start()
+
+    def ring_for(self, tab):
+        state = self._state.get(tab)
+        return state["ring"] if state else None
+
+    def read_proc(self, pid):
+        """ (ticks de CPU utime+stime, RSS em bytes, bytes lidos, bytes escritos) ou None se o PID não existe. """
+        try:
+            with open(f"/proc/{pid}/stat", "rb") as f:
+                fields = f.read().rsplit(b")", 1)[1].split()
+            with open(f"/proc/{pid}/statm", "rb") as f:
+                rss_pages = int(f.read().split()[1])
+        except (OSError, IndexError, ValueError):
+            return None
+        read_bytes = write_bytes = None
+        try:
+            with open(f"/proc/{pid}/io", "rb") as f:
+                io = dict(line.split(b":", 1) for line in f.read().splitlines() if b":" in line)
+            read_bytes, write_bytes = int(io[b"read_bytes"]), int(io[b"write_bytes"])
+        except (OSError, KeyError, ValueError):
+            pass  # /proc/<pid>/io de processos de outro usuário exige root
+        # Após o ')' do nome: campo 3 (estado) é o índice 0, então utime (14) e stime (15) são 11 e 12
+        return int(fields[11]) + int(fields[12]), rss_pages * self.page_size, read_bytes, write_bytes
+
+    def _resolve_pids(self, tabs):
+        names = [tab.nome_servico.get() for tab in tabs]
+        self.app.service_manager.get_status_many(names)
+        for tab in tabs:
+            state = self._state[tab]
+            state["pid"], state["needs_pid"] = self.app.service_manager.main_pids.get(tab.nome_servico.get()), False
+
+    def sample_once(self):
+        tabs = [tab for tab in self.app.restarter_servidores + self.app.votemap_servidores if tab.nome_servico.get()]
+        for tab in list(self._state):
+            if tab not in tabs: del self._state[tab]
+        for tab in tabs:
+            self._state.setdefault(tab, {"pid": None, "needs_pid": True, "ring": ResourceRing(self.history),
+                                         "last": None, "over_since": None})
+        if not tabs:
+            return
+        stale = self._pids_resolved_at is None or time.monotonic() - self._pids_resolved_at > self.pid_refresh_interval
+        if stale:
+            self._resolve_pids(tabs)
+            self._pids_resolved_at = time.monotonic()
+        else:
+            lost = [tab for tab in tabs if self._state[tab]["needs_pid"]]
+            if lost: self._resolve_pids(lost)
+        for tab in tabs:
+            state = self._state[tab]
+            sample = self.read_proc(state["pid"]) if state["pid"] else None
+            if sample is None:
+                if state["last"] is not None:  # processo amostrado saiu/reiniciou: só esta aba é reconsultada
+                    state["needs_pid"] = True
+                state["pid"], state["last"] = None, None
+                continue
+            now = time.monotonic()
+            ticks, rss, read_bytes, write_bytes = sample
+            last = state["last"]
+            state["last"] = (now, ticks, read_bytes, write_bytes)
+            if last is None:
+                continue
+            elapsed = now - last[0]
+            cpu = (ticks - last[1]) / self.clock_ticks / elapsed * 100 if elapsed > 0 else 0.0
+            io_rates = None
+            if read_bytes is not None and last[2] is not None and elapsed > 0:
+                io_rates = ((read_bytes - last[2]) / elapsed, (write_bytes - last[3]) / elapsed)
+            state["ring"].append(cpu, rss / (1024 * 1024))
+            self._check_rss_limit(tab, state, rss, now)
+            if not self.app._shutting_down:
+                tab.display_resource_usage(cpu, rss, io_rates, state["ring"])
+
+    def _check_rss_limit(self, tab, state, rss, now):
+        try:
+            limit_gb, minutes = float(tab.rss_limit_gb_var.get()), float(tab.rss_limit_minutes_var.get())
+        except (tk.TclError, ValueError):
+            return
+        if limit_gb <= 0 or rss <= limit_gb * 1024 ** 3:
+            state["over_since"] = None
+            return
+        state["over_since"] = state["over_since"] or now
+        if now - state["over_since"] >= minutes * 60:
+            state["over_since"] = None
+            app_logger.warning(f"Aba '{tab.nome}': RSS de {rss / 1024 ** 3:.2f} GB acima de {limit_gb} GB por "
+                               f"{minutes:.0f} min; solicitando reinício.")
+            tab.append_text_to_log_area_threadsafe(self.app.translator.get(
+                "log_rss_limit_restart", rss=f"{rss / 1024 ** 3:.2f}", limit=limit_gb, minutes=f"{minutes:.0f}") + "\n")
+            self.app.notify_event("warning", tab.nome, self.app.translator.get(
+                "log_rss_limit_restart", rss=f"{rss / 1024 ** 3:.2f}", limit=limit_gb, minutes=f"{minutes:.0f}"))
+            tab.solicitar_reinicio(RestartOrchestrator.PRIORITY_TRIGGER, kind=RestartHistoryDB.KIND_RSS)
+
+    def _worker(self):
+        while not self.app._app_stop_event.is_set():
+            try:
+                self.sample_once()
+            except Exception as e:
+                app_logger.error(f"Erro na amostragem de recursos dos servidores: {e}", exc_info=True)
+            self.app._app_stop_event.wait(self.interval)
+
+
+# ==============================================================================
+# SONDAGEM A2S (Steam Query, UDP) - DETECÇÃO DE SERVIDORES TRAVADOS
+# ==============================================================================
+A2S_INFO_REQUEST = b"\xFF\xFF\xFF\xFFTSource Engine Query\x00"
+A2S_HEADER = b"\xFF\xFF\xFF\xFF"
+
+
+def parse_a2s_address(text, default_port=17777):
+    """ 'host:porta' (ou só 'host') -> (host, porta), ou None se inválido. """
+    text = (text or "").strip()
+    if not text:
+        return None
+    host, sep, port = text.rpartition(":")
+    if not sep:
+        host, port = text, str(default_port)
+    if not host or not port.isdigit() or not 0 < int(port) < 65536:
+        return None
+    return host, int(port)
+
+
+def parse_a2s_info(payload):
+    """ Interpreta a resposta A2S_INFO (sem o cabeçalho 0xFFFFFFFF e o tipo 'I'). """
+    pos = 1  # byte de versão do protocolo
+    strings = []
+    for _i in range(4):  # nome, mapa, pasta, jogo
+        end = payload.index(b"\x00", pos)
+        strings.append(payload[pos:end].decode("utf-8", errors="replace"))
+        pos = end + 1
+    _app_id, players, max_players, bots = struct.unpack_from("<hBBB", payload, pos)
+    return {"name": strings[0], "map": strings[1], "players": players, "max_players": max_players, "bots": bots}
+
+
+class A2SClient(asyncio.DatagramProtocol):
+    """
+    Um único socket UDP para todas as consultas. As respostas são associadas ao pedido pelo endereço de
+    origem; respostas de desafio (S2C_CHALLENGE, tipo 'A') são respondidas com o pedido + desafio.
+    """
+
+    def __init__(self):
+        self.transport = None
+        self._pending = {}  # (ip, porta) -> Future
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        future = self._pending.get(addr[:2])
+        if future is None or future.done() or not data.startswith(A2S_HEADER) or len(data) < 5:
+            return
+        kind = data[4:5]
+        if kind == b"A" and len(data) >= 9:
+            self.transport.sendto(A2S_INFO_REQUEST + data[5:9], addr)
+        elif kind == b"I":
+            try:
+                future.set_result(parse_a2s_info(data[5:]))
+            except (ValueError, struct.error) as e:
+                future.set_exception(e)
+
+    def error_received(self, exc):
+        pass  # ICMP 'porta inacessível' etc.: a consulta simplesmente expira
+
+    async def query(self, addr, timeout):
+        """ A2S_INFO em 'addr' (ip, porta). Retorna o dict da resposta com 'latency_ms', ou None se expirar. """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending[addr] = future
+        start = time.perf_counter()
+        try:
+            self.transport.sendto(A2S_INFO_REQUEST, addr)
+            info = await asyncio.wait_for(future, timeout)
+            info["latency_ms"] = (time.perf_counter() - start) * 1000
+            return info
+        except (asyncio.TimeoutError, ValueError, struct.error, OSError):
+            return None
+        finally:
+            if self._pending.get(addr) is future:
+                del self._pending[addr]
+
+
+class A2SProber:
+    """
+    Sonda todos os servidores com endereço A2S configurado, em paralelo, a partir de um único socket asyncio
+    (em uma thread própria). Registra latência e jogadores; após 'N' sondagens seguidas sem resposta com o
+    serviço ativo, o servidor é reiniciado pela fila de reinícios. Servidores com reinício em andamento ou em
+    cooldown não são contados.
+    """
+
+    def __init__(self, app, interval=10.0, timeout=2.0):
+        self.app = app
+        self.interval = interval
+        self.timeout = timeout
+        self.missed = {}  # aba -> sondagens seguidas sem resposta
+        self.thread = threading.Thread(target=lambda: asyncio.run(self._main()), daemon=True, name="A2SProber")
+
+    def start(self):
+        if self.interval > 0:
+            self.thread.start()
+
+    async def _main(self):
+        loop = asyncio.get_running_loop()
+        transport, client = await loop.create_datagram_endpoint(A2SClient, local_addr=("0.0.0.0", 0))
+        try:
+            while not self.app._app_stop_event.is_set():
+                try:
+                    await self.probe_all(client)
+                except Exception as e:
+                    app_logger.error(f"Erro na sondagem A2S dos servidores: {e}", exc_info=True)
+                await loop.run_in_executor(None, self.app._app_stop_event.wait, self.interval)
+        finally:
+            transport.close()
+
+    async def _resolve(self, loop, address):
+        try:
+            infos = await loop.getaddrinfo(address[0], address[1], family=socket.AF_INET, type=socket.SOCK_DGRAM)
+            return infos[0][4][:2]
+        except (OSError, IndexError):
+            return None
+
+    async def probe_all(self, client):
+        loop = asyncio.get_running_loop()
+        orchestrator = self.app.restart_orchestrator
+        tabs = []
+        for tab in self.app.restarter_servidores + self.app.votemap_servidores:
+            address = parse_a2s_address(tab.a2s_address_var.get())
+            if address is None:
+                self.missed.pop(tab, None)
+                continue
+            if orchestrator.is_busy(orchestrator.service_key(tab.nome, tab.nome_servico.get())):
+                self.missed[tab] = 0  # servidor reiniciando: o silêncio é esperado
+                continue
+            tabs.append((tab, address))
+        if not tabs:
+            return
+        resolved = await asyncio.gather(*(self._resolve(loop, address) for _tab, address in tabs))
+        results = await asyncio.gather(*(client.query(addr, self.timeout) if addr else asyncio.sleep(0)
+                                         for addr in resolved))
+        # Status dos serviços sem resposta em uma consulta em lote, fora do loop (systemctl/sc é bloqueante)
+        services = {tab: tab.nome_servico.get() for (tab, _address), info in zip(tabs, results) if info is None}
+        names = [name for name in services.values() if name]
+        statuses = {}
+        if names:
+            statuses = await loop.run_in_executor(None, self.app.service_manager.get_status_many, names)
+        for (tab, _address), info in zip(tabs, results):
+            self._record(tab, info, statuses.get(services.get(tab)))
+
+    def _record(self, tab, info, status=None):
+        """ 'status': do serviço da aba quando ela não respondeu (None se a aba não tem serviço). """
+        if info is not None:
+            self.missed[tab] = 0
+            if not self.app._shutting_down: tab.display_probe_result(info, 0)
+            return
+        # Sem resposta só conta se o serviço está ativo (servidor parado de propósito não é travamento)
+        if status is not None and status != "RUNNING":
+            self.missed[tab] = 0
+            return
+        missed = self.missed.get(tab, 0) + 1
+        self.missed[tab] = missed
+        if not self.app._shutting_down: tab.display_probe_result(None, missed)
+        try:
+            limit = int(tab.a2s_max_missed_var.get())
+        except (tk.TclError, ValueError):
+            return
+        if limit > 0 and missed >= limit:
+            self.missed[tab] = 0
+            app_logger.warning(f"Aba '{tab.nome}': {missed} sondagens A2S seguidas sem resposta; solicitando reinício.")
+            tab.append_text_to_log_area_threadsafe(
+                self.app.translator.get("log_a2s_unresponsive_restart", missed=missed) + "\n")
+            self.app.notify_event("warning", tab.nome, self.app.translator.get("log_a2s_unresponsive_restart",
+                                                                              missed=missed))
+            tab.solicitar_reinicio(RestartOrchestrator.PRIORITY_TRIGGER, kind=RestartHistoryDB.KIND_A2S)
+
+
+# ==============================================================================
+# RCON BATTLEYE (UDP) - AVISOS AOS JOGADORES ANTES DOS REINÍCIOS
+# ==============================================================================
+RCON_DEFAULT_WARNING = "Server restart in {time}!"
+RCON_DEFAULT_PORT = 19999
+RCON_WARNING_SLACK = 5.0  # atraso (s) com que um estágio ainda é enviado (ex.: agendador despertou um pouco tarde)
+
+
+def parse_warning_stages(text):
+    """ '300,60,10' ou '5m,1m,10s' -> [300, 60, 10] (segundos, decrescente). ValueError se inválido. """
+    stages = set()
+    for part in (text or "").replace(";", ",").split(","):
+        part = part.strip().lower()
+        if not part:
+            continue
+        multiplier = 60 if part.endswith("m") else 1
+        value = int(part.rstrip("ms"))
+        if value <= 0:
+            raise ValueError(f"Estágio de aviso inválido: '{part}'")
+        stages.add(value * multiplier)
+    return sorted(stages, reverse=True)
+
+
+def format_warning_stage(seconds):
+    return f"{seconds // 60} min" if seconds >= 60 and seconds % 60 == 0 else f"{seconds} s"
+
+
+class BattlEyeRConClient:
+    """
+    Sessão RCon BattlEye persistente (UDP) com um servidor. O login é feito uma vez e a sessão é mantida
+    com keepalive; comandos são enviados em pipeline (até 256 em voo, casados pela sequência) sem
+    reconectar. Se um comando expira (inclusive os enviados sem esperar, como os avisos), se nada chega do
+    servidor por SESSION_TIMEOUT segundos (ex.: servidor reiniciado, que não conhece mais o login) ou se o
+    socket falha, a sessão é descartada, os pendentes falham e o login é refeito no próximo envio.
+    Mensagens do servidor (tipo 0x02) são confirmadas e repassadas a 'on_message'.
+    """
+    KEEPALIVE_INTERVAL = 30.0  # o servidor derruba clientes sem pacotes há 45 s
+    SESSION_TIMEOUT = 45.0  # sem nenhum pacote recebido (nem a resposta do keepalive): sessão perdida
+    TYPE_LOGIN, TYPE_COMMAND, TYPE_MESSAGE = 0x00, 0x01, 0x02
+
+    def __init__(self, host, port, password, timeout=3.0):
+        self.address = (host, port)
+        self.password = password
+        self.timeout = timeout
+        self.on_message = None
+        self._lock = threading.Lock()
+        self._sock = None
+        self._login_event = threading.Event()
+        self._login_ok = False
+        self._seq = 0
+        self._pending = {}  # sequência -> [Future, {índice: parte}, prazo (monotonic)]
+        self._last_sent = 0.0
+        self._last_received = 0.0
+        self._closed = False
+
+    @staticmethod
+    def packet(kind, payload=b""):
+        body = b"\xFF" + bytes([kind]) + payload
+        return b"BE" + struct.pack("<I", zlib.crc32(body) & 0xFFFFFFFF) + body
+
+    @staticmethod
+    def parse_packet(data):
+        """ (tipo, carga) de um pacote válido, ou None (cabeçalho/CRC inválidos). """
+        if len(data) < 8 or data[:2] != b"BE" or data[6] != 0xFF:
+            return None
+        if struct.unpack("<I", data[2:6])[0] != zlib.crc32(data[6:]) & 0xFFFFFFFF:
+            return None
+        return data[7], data[8:]
+
+    @property
+    def connected(self):
+        return self._sock is not None and self._login_ok
+
+    def _send(self, sock, kind, payload=b""):
+        sock.send(self.packet(kind, payload))
+        self._last_sent = time.monotonic()
+
+    def _ensure_session(self):
+        """ Abre a sessão e faz o login se necessário. Chamado com '_lock'. """
+        if self._closed:
+            raise ConnectionError("cliente RCon encerrado")
+        if self.connected:
+            return self._sock
+        self._drop_session()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.settimeout(1.0)
+        sock.connect(self.address)
+        self._sock, self._login_ok = sock, False
+        self._login_event.clear()
+        threading.Thread(target=self._reader_worker, args=(sock,), daemon=True,
+                         name=f"BERCon-{self.address[0]}:{self.address[1]}").start()
+        self._send(sock, self.TYPE_LOGIN, self.password.encode("latin-1", errors="replace"))
+        if not self._login_event.wait(self.timeout):
+            self._drop_session()
+            raise TimeoutError(f"RCon {self.address[0]}:{self.address[1]} não respondeu ao login")
+        if not self._login_ok:
+            self._drop_session()
+            raise PermissionError(f"RCon {self.address[0]}:{self.address[1]} recusou a senha")
+        app_logger.info(f"Sessão RCon aberta com {self.address[0]}:{self.address[1]}.")
+        return sock
+
+    def _drop_session(self, error=None):
+        """ Fecha o socket e falha os comandos pendentes. Chamado com '_lock' (ou pela leitora). """
+        sock, self._sock, self._login_ok = self._sock, None, False
+        if sock is not None:
+            try:
+                sock.close()
+            except OSError:
+                pass
+        pending, self._pending = self._pending, {}
+        for future, _parts, _deadline in pending.values():
+            if not future.done(): future.set_exception(error or ConnectionError("sessão RCon encerrada"))
+
+    def send_command(self, command):
+        """ Envia o comando sem esperar a resposta (pipeline). Retorna um Future com o texto da resposta. """
+        with self._lock:
+            sock = self._ensure_session()
+            seq = self._seq
+            self._seq = (seq + 1) % 256
+            future = Future()
+            self._pending[seq] = [future, {}, time.monotonic() + self.timeout]
+            try:
+                self._send(sock, self.TYPE_COMMAND, bytes([seq]) + command.encode("utf-8"))
+            except OSError as e:
+                self._drop_session(e)
+        return future
+
+    def command(self, command, timeout=None):
+        """ Envia e espera a resposta; em caso de expiração a sessão é refeita no próximo envio. """
+        future = self.send_command(command)
+        try:
+            return future.result(timeout or self.timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                self._drop_session(TimeoutError("RCon sem resposta"))
+            raise TimeoutError(f"RCon {self.address[0]}:{self.address[1]} não respondeu a '{command}'")
+
+    def say_all(self, message):
+        return self.send_command(f"say -1 {message}")
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            self._drop_session()
+
+    def _check_session(self, sock):
+        """ Expira comandos sem resposta, descarta a sessão muda e envia o keepalive. Chamado pela leitora. """
+        now = time.monotonic()
+        with self._lock:
+            if sock is not self._sock or not self._login_ok:
+                return
+            expired = any(now >= deadline for _future, _parts, deadline in self._pending.values())
+            if expired or now - self._last_received >= self.SESSION_TIMEOUT:
+                reason = "comando sem resposta" if expired else f"nenhum pacote há {self.SESSION_TIMEOUT:.0f}s"
+                app_logger.warning(f"Sessão RCon com {self.address[0]}:{self.address[1]} descartada: {reason}.")
+                self._drop_session(TimeoutError(f"RCon {self.address[0]}:{self.address[1]}: {reason}"))
+                return
+            if now - self._last_sent >= self.KEEPALIVE_INTERVAL:
+                seq, self._seq = self._seq, (self._seq + 1) % 256
+                try:
+                    self._send(sock, self.TYPE_COMMAND, bytes([seq]))  # comando vazio = keepalive
+                except OSError as e:
+                    self._drop_session(e)
+
+    def _reader_worker(self, sock):
+        while sock is self._sock:
+            try:
+                data = sock.recv(65535)
+            except socket.timeout:
+                self._check_session(sock)
+                continue
+            except OSError:
+                break
+            parsed = self.parse_packet(data)
+            if parsed is None:
+                continue
+            self._last_received = time.monotonic()
+            kind, payload = parsed
+            if kind == self.TYPE_LOGIN:
+                self._login_ok = payload[:1] == b"\x01"
+                self._login_event.set()
+            elif kind == self.TYPE_COMMAND and payload:
+                self._on_command_reply(payload[0], payload[1:])
+            elif kind == self.TYPE_MESSAGE and payload:
+                try:
+                    self._send(sock, self.TYPE_MESSAGE, payload[:1])  # confirmação obrigatória
+                except OSError:
+                    break
+                if self.on_message: self.on_message(payload[1:].decode("utf-8", errors="replace"))
+            self._check_session(sock)  # também sob fluxo contínuo de mensagens, sem timeouts do recv
+        with self._lock:
+            if sock is self._sock: self._drop_session()
+
+    def _on_command_reply(self, seq, body):
+        with self._lock:
+            entry = self._pending.get(seq)
+            if entry is None:
+                return  # resposta de keepalive
+            future, parts, _deadline = entry
+            if body[:1] == b"\x00" and len(body) >= 3:  # resposta em várias partes: 0x00, total, índice
+                total, index = body[1], body[2]
+                parts[index] = body[3:]
+                if len(parts) < total:
+                    return
+                body = b"".join(parts[i] for i in range(total))
+            del self._pending[seq]
+        if not future.done(): future.set_result(body.decode("utf-8", errors="replace"))
+
+
+class RConPool:
+    """ Uma sessão RCon por servidor (host, porta), reaproveitada por todas as abas e avisos. """
+
+    def __init__(self, timeout=3.0):
+        self.timeout = timeout
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get(self, host, port, password):
+        with self._lock:
+            client = self._clients.get((host, port))
+            if client is None or client.password != password:
+                if client is not None: client.close()
+                client = BattlEyeRConClient(host, port, password, timeout=self.timeout)
+                self._clients[(host, port)] = client
+            return client
+
+    def close_all(self):
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            client.close()
+
+
+# ==============================================================================
+# CLASSE WebhookNotifier - NOTIFICAÇÕES EXTERNAS (WEBHOOK COMPATÍVEL COM DISCORD)
+# ==============================================================================
+class WebhookNotifier:
+    """
+    Envia eventos (reinícios, vencedores do votemap, falhas) para um webhook compatível com o Discord.
+    'notify' nunca bloqueia: o evento entra numa fila limitada (os mais antigos são descartados se ela
+    encher) e uma única thread os agrupa - espera 'debounce' segundos sem eventos novos (ou no máximo
+    'max_window' desde o primeiro) e envia uma só mensagem, juntando eventos iguais do mesmo servidor
+    ('10 reinícios em um minuto' viram uma linha com contagem). Respeita HTTP 429/Retry-After e os
+    cabeçalhos X-RateLimit; com o endpoint fora do ar, tenta de novo com backoff exponencial, mesclando
+    o que chegar nesse meio tempo.
+    """
+    KIND_ICONS = {"restart": "🔄", "restart_failed": "❌", "winner": "🗳️", "warning": "⚠️", "error": "❌",
+                  "info": "ℹ️"}
+    MAX_CONTENT = 2000  # limite do Discord por mensagem
+    MAX_BACKOFF = 300.0
+
+    def __init__(self, url="", debounce=5.0, max_window=60.0, queue_size=500, stop_event=None, timeout=10.0):
+        self.url = url
+        self.debounce = debounce
+        self.max_window = max_window
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.sent = 0
+        self.dropped = 0
+        self._events = deque()
+        self._first_at = self._last_at = 0.0
+        self._next_send_at = 0.0
+        self._cond = threading.Condition()
+        self._stop_event = stop_event or threading.Event()
+        self.thread = threading.Thread(target=self._worker, daemon=True, name="WebhookNotifier")
+        self.thread.start()
+
+    def notify(self, kind, server, message):
+        """ Enfileira um evento; não bloqueia nem falha se o webhook não estiver configurado. """
+        if not self.url:
+            return
+        now = time.monotonic()
+        with self._cond:
+            if len(self._events) >= self.queue_size:
+                self._events.popleft()
+                self.dropped += 1
+            if not self._events: self._first_at = now
+            self._last_at = now
+            self._events.append((kind, server, message, datetime.now()))
+            self._cond.notify_all()
+
+    def shutdown(self):
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    def format_batch(self, events, dropped=0):
+        """ Agrupa por (tipo, servidor) mantendo a ordem de chegada; uma linha por grupo com a contagem. """
+        groups = {}
+        for kind, server, message, when in events:
+            group = groups.setdefault((kind, server), [0, message, when])
+            group[0] += 1
+            group[1], group[2] = message, when
+        lines = []
+        for (kind, server), (count, message, when) in groups.items():
+            suffix = f" (×{count})" if count > 1 else ""
+            lines.append(f"{self.KIND_ICONS.get(kind, '•')} `{when:%H:%M:%S}` **{server}**: {message}{suffix}")
+        if dropped:
+            lines.append(f"… +{dropped}")
+        content = "\n".join(lines)
+        if len(content) > self.MAX_CONTENT:
+            content = content[:self.MAX_CONTENT - 1] + "…"
+        return content
+
+    def _wait_for_batch(self, pending):
+        """ Espera a rajada acalmar e devolve os eventos novos. Chamado com '_cond'. """
+        while not self._events and not pending and not self._stop_event.is_set():
+            self._cond.wait()
+        while self._events and not self._stop_event.is_set():
+            now = time.monotonic()
+            deadline = min(self._last_at + self.debounce, self._first_at + self.max_window)
+            if now >= deadline:
+                break
+            self._cond.wait(deadline - now)
+        events = list(self._events)
+        self._events.clear()
+        return events
+
+    def _post(self, content):
+        """ Envia uma mensagem. Retorna ('ok' | 'retry' | 'drop', segundos a esperar). """
+        request = urllib.request.Request(
+            self.url, data=json.dumps({"content": content}).encode("utf-8"),
+            headers={"Content-Type": "application/json", "User-Agent": "PQDT_Toolbox"}, method="POST")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                if response.headers.get("X-RateLimit-Remaining") == "0":
+                    return "ok", float(response.headers.get("X-RateLimit-Reset-After") or 1.0)
+                return "ok", 0.0
+        except urllib.error.HTTPError as e:
+            if e.code == 429:
+                retry_after = e.headers.get("Retry-After")
+                try:
+                    retry_after = float(retry_after or json.loads(e.read() or b"{}").get("retry_after", 1.0))
+                except (ValueError, AttributeError):
+                    retry_after = 1.0
+                return "retry", retry_after
+            if e.code >= 500:
+                return "retry", None
+            app_logger.error(f"Webhook recusou a notificação (HTTP {e.code}); descartada.")
+            return "drop", 0.0
+        except (urllib.error.URLError, OSError) as e:
+            app_logger.warning(f"Webhook indisponível: {e}")
+            return "retry", None
+
+    def _worker(self):
+        pending, failures = [], 0
+        while not self._stop_event.is_set():
+            with self._cond:
+                pending.extend(self._wait_for_batch(pending))
+                dropped, self.dropped = self.dropped, 0
+            if self._stop_event.is_set():
+                break
+            if len(pending) > self.queue_size:  # endpoint fora do ar por muito tempo: mantém os mais recentes
+                dropped += len(pending) - self.queue_size
+                pending = pending[-self.queue_size:]
+            if not pending or not self.url:
+                pending = []
+                continue
+            self._stop_event.wait(max(0.0, self._next_send_at - time.monotonic()))
+            result, wait = self._post(self.format_batch(pending, dropped))
+            if result == "retry":
+                failures += 1
+                if wait is None:
+                    wait = min(self.MAX_BACKOFF, 2 ** failures) + random.uniform(0, 1)
+                self._next_send_at = time.monotonic() + wait
+                with self._cond:
+                    self.dropped += dropped
+                continue
+            if result == "ok":
+                self.sent += 1
+            pending, failures = [], 0
+            self._next_send_at = time.monotonic() + wait
+
+
+# ==============================================================================
+# CLASSE LogSilenceWatchdog - SERVIDORES SEM ESCREVER NO LOG HÁ MUITO TEMPO
+# ==============================================================================
+class LogSilenceWatchdog:
+    """
+    Uma única thread avalia todas as abas contra o limite de silêncio configurado em cada uma. As abas só
+    incrementam 'log_lines_seen' por linha lida (sem consultar o relógio); o watchdog compara o contador
+    a cada intervalo e guarda o instante da última mudança. Ao exceder o limite com o serviço ativo, mostra
+    um aviso ou reinicia pela fila de reinícios, conforme a ação escolhida na aba.
+    """
+    ACTION_NOTIFY = "notify"
+    ACTION_RESTART = "restart"
+
+    def __init__(self, app, interval=30.0):
+        self.app = app
+        self.interval = interval
+        self._state = {}  # aba -> [contador visto, instante da última mudança, já alertado]
+        self.thread = threading.Thread(target=self._worker, daemon=True, name="LogSilenceWatchdog")
+
+    def start(self):
+        if self.interval > 0:
+            self.thread.start()
+
+    def check_once(self, now=None):
+        """ Avalia todas as abas; retorna a lista de (aba, minutos em silêncio) que dispararam ação. """
+        now = time.monotonic() if now is None else now
+        orchestrator = self.app.restart_orchestrator
+        fired = []
+        for tab in self.app.restarter_servidores + self.app.votemap_servidores:
+            count = tab.log_lines_seen
+            state = self._state.get(tab)
+            if state is None or state[0] != count or tab._paused:
+                self._state[tab] = [count, now, False]
+                continue
+            try:
+                limit_minutes = float(tab.log_silence_minutes_var.get())
+            except (tk.TclError, ValueError):
+                continue
+            if limit_minutes <= 0 or state[2] or count == 0 or now - state[1] < limit_minutes * 60:
+                continue  # desativado, já alertado, monitoramento ainda sem linhas ou dentro do limite
+            service = tab.nome_servico.get()
+            if not service or self.app.service_manager.get_status(service) != "RUNNING":
+                continue
+            if orchestrator.is_busy(orchestrator.service_key(tab.nome, service)):
+                state[1] = now  # reinício em andamento: o silêncio é esperado
+                continue
+            silent_minutes = (now - state[1]) / 60
+            fired.append((tab, silent_minutes))
+            self._act(tab, silent_minutes)
+            if tab.log_silence_action_var.get() == self.ACTION_RESTART:
+                state[1] = now  # volta a vigiar após o reinício
+            else:
+                state[2] = True  # um aviso por período de silêncio; rearma quando o log voltar
+        for tab in [t for t in self._state if t not in self.app.restarter_servidores + self.app.votemap_servidores]:
+            del self._state[tab]
+        return fired
+
+    def _act(self, tab, silent_minutes):
+        _ = self.app.translator.get
+        minutes = f"{silent_minutes:.0f}"
+        app_logger.warning(f"Aba '{tab.nome}': nenhuma linha de log há {minutes} min.")
+        self.app.notify_event("warning", tab.nome, _("dialog_log_silence_msg", minutes=minutes))
+        if tab.log_silence_action_var.get() == self.ACTION_RESTART:
+            tab.append_text_to_log_area_threadsafe(_("log_silence_restart", minutes=minutes) + "\n")
+            tab.solicitar_reinicio(RestartOrchestrator.PRIORITY_TRIGGER, kind=RestartHistoryDB.KIND_LOG_SILENCE)
+        else:
+            self.app.show_messagebox_from_thread("warning", _("dialog_log_silence_title", server=tab.nome),
+                                                 _("dialog_log_silence_msg", minutes=minutes))
+
+    def _worker(self):
+        while not self.app._app_stop_event.wait(self.interval):
+            try:
+                self.check_once()
+            except Exception as e:
+                app_logger.error(f"Erro no watchdog de silêncio dos logs: {e}", exc_info=True)
+
+
+# ==============================================================================
+# CLASSE ServiceListCache - LISTA DE SERVIÇOS DO SO EM CACHE + ÍNDICE DE BUSCA
+# ==============================================================================
+class ServiceNameIndex:
+    """
+    Índice para a busca incremental do diálogo de seleção de serviço. Nomes que começam com o termo
+    vêm primeiro (busca binária na lista ordenada); depois os que apenas contêm o termo, localizados
+    pelos trigramas do termo em vez de percorrer todos os nomes.
+    """
+
+    def __init__(self, names):
+        self.names = sorted(set(names), key=str.lower)
+        self._lower = [name.lower() for name in self.names]
+        self._trigrams = {}  # trigrama -> conjunto de posições em self.names
+        for pos, lower in enumerate(self._lower):
+            for i in range(len(lower) - 2):
+                self._trigrams.setdefault(lower[i:i + 3], set()).add(pos)
+
+    def __len__(self):
+        return len(self.names)
+
+    def search(self, query, candidates=None):
+        """
+        Posições dos nomes que contêm 'query', com os prefixos primeiro. 'candidates' (resultado de uma busca
+        anterior cujo termo é prefixo deste) restringe a busca, o que torna cada tecla digitada incremental.
+        """
+        query = query.lower()
+        if not query:
+            return list(range(len(self.names)))
+        if candidates is None:
+            if len(query) >= 3:
+                sets = sorted((self._trigrams.get(query[i:i + 3], set()) for i in range(len(query) - 2)), key=len)
+                candidates = set.intersection(*sets) if sets[0] else set()
+            else:
+                candidates = range(len(self.names))
+        matches = sorted(pos for pos in candidates if query in self._lower[pos])
+        prefix_start = bisect.bisect_left(self._lower, query)
+        prefix_end = bisect.bisect_left(self._lower, query + "\uffff")
+        return [pos for pos in matches if prefix_start <= pos < prefix_end] + \
+               [pos for pos in matches if not prefix_start <= pos < prefix_end]
+
+
+class ServiceListCache:
+    """
+    Guarda a lista de serviços do SO (lenta de obter: 'systemctl list-units' / WMI) para o diálogo de seleção.
+    Abrir o diálogo usa a lista em cache; se ela tiver mais de 'ttl' segundos, é recarregada em segundo plano.
+    """
+
+    def __init__(self, loader, ttl=300.0, logger=app_logger):
+        self.loader = loader
+        self.ttl = ttl
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._index = None
+        self._loaded_at = None
+        self._refreshing = False
+
+    @property
+    def index(self):
+        """ Último ServiceNameIndex carregado, ou None se a lista ainda não foi obtida. """
+        return self._index
+
+    def is_stale(self):
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl
+
+    def refresh(self):
+        """ Recarrega a lista de forma síncrona (exceções do loader são propagadas). Retorna o novo índice. """
+        start = time.monotonic()
+        index = ServiceNameIndex(self.loader())
+        with self._lock:
+            self._index, self._loaded_at = index, time.monotonic()
+        self.logger.info(f"Lista de serviços carregada: {len(index)} serviço(s) em {time.monotonic() - start:.2f}s.")
+        return index
+
+    def refresh_async(self, on_done=None):
+        """ Recarrega em segundo plano (uma recarga por vez) e chama on_done(índice) ao terminar com sucesso. """
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def _worker():
+            try:
+                index = self.refresh()
+                if on_done: on_done(index)
+            except Exception as e:
+                self.logger.warning(f"Falha ao recarregar a lista de serviços em segundo plano: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(target=_worker, daemon=True, name="ServiceListRefresh").start()
+
+
+# ==============================================================================
+# BACKEND DE STATUS POR EVENTOS - SINAIS PropertiesChanged DO SYSTEMD VIA D-BUS
+# ==============================================================================
+def systemd_unit_object_path(unit):
+    """ Caminho D-Bus de uma unidade (mesmo escape do systemd: bytes fora de [A-Za-z0-9] viram _xx). """
+    escaped = "".join(c if c.isascii() and c.isalnum() else "".join(f"_{b:02x}" for b in c.encode("utf-8"))
+                      for c in unit)
+    return f"/org/freedesktop/systemd1/unit/{escaped or '_'}"
+
+
+class JeepneySystemdBus:
+    """ Conexão com o barramento de sistema (jeepney) que entrega os PropertiesChanged das unidades. """
+
+    def __init__(self):
+        self.conn = open_dbus_connection(bus="SYSTEM")
+        self.manager = DBusAddress("/org/freedesktop/systemd1", bus_name="org.freedesktop.systemd1",
+                                   interface="org.freedesktop.systemd1.Manager")
+        self.conn.send_and_get_reply(new_method_call(self.manager, "Subscribe"))
+        rule = MatchRule(type="signal", interface="org.freedesktop.DBus.Properties", member="PropertiesChanged",
+                         path_namespace="/org/freedesktop/systemd1/unit")
+        rule.add_arg_condition(0, "org.freedesktop.systemd1.Unit")
+        self.conn.send_and_get_reply(message_bus.AddMatch(rule))
+        self._signals = self.conn.filter(rule, bufsize=256)
+
+    def load_unit(self, unit):
+        """ Retorna (caminho do objeto, LoadState, ActiveState) de uma unidade. """
+        path = self.conn.send_and_get_reply(new_method_call(self.manager, "LoadUnit", "s", (unit,))).body[0]
+        unit_address = DBusAddress(path, bus_name="org.freedesktop.systemd1",
+                                   interface="org.freedesktop.systemd1.Unit")
+        props = self.conn.send_and_get_reply(Properties(unit_address).get_all()).body[0]
+        return path, props["LoadState"][1], props["ActiveState"][1]
+
+    def receive(self, timeout):
+        """ Próximo sinal como (caminho, {propriedade: valor}), ou None se nada chegar em 'timeout' segundos. """
+        try:
+            msg = self.conn.recv_until_filtered(self._signals.queue, timeout=timeout)
+        except TimeoutError:
+            return None
+        _interface, changed, _invalidated = msg.body
+        return msg.header.fields[HeaderFields.path], {name: value for name, (_sig, value) in changed.items()}
+
+    def close(self):
+        self._signals.close()
+        self.conn.close()
+
+
+class SystemdDBusWatcher:
+    """
+    Mantém o cache do ServiceManager atualizado a partir dos sinais do systemd, sem consultas periódicas.
+    'units_provider' devolve os nomes de serviço configurados; novas unidades são assinadas a cada
+    'resync_interval' segundos e 'on_change(nome_servico, status)' é chamado a cada mudança.
+    Se o barramento cair, 'on_failure()' é chamado para que a aplicação volte à consulta periódica.
+    """
+
+    def __init__(self, service_manager, units_provider, on_change, bus_factory=None, resync_interval=5.0,
+                 on_failure=None):
+        self.service_manager = service_manager
+        self.units_provider = units_provider
+        self.on_change = on_change
+        self.on_failure = on_failure
+        self.bus_factory = bus_factory or JeepneySystemdBus
+        self.resync_interval = resync_interval
+        self.bus = None
+        self.paths = {}  # caminho do objeto -> {nomes de serviço}
+        self._stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._worker, daemon=True, name="SystemdDBusWatcher")
+
+    @staticmethod
+    def is_available():
+        return platform.system() == "Linux" and JEEPNEY_AVAILABLE
+
+    def start(self):
+        """ Conecta ao barramento e inicia a thread. Retorna False se o barramento não estiver acessível. """
+        try:
+            self.bus = self.bus_factory()
+        except Exception as e:
+            app_logger.warning(f"Backend D-Bus do systemd indisponível ({e}); usando consulta periódica.")
+            return False
+        self._sync_units()
+        self.thread.start()
+        app_logger.info("Status dos serviços acompanhado por sinais D-Bus do systemd.")
+        return True
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _sync_units(self):
+        known = {name for names in self.paths.values() for name in names}
+        for name in dict.fromkeys(self.units_provider()):
+            if not name or name in known:
+                continue
+            try:
+                path, load_state, active_state = self.bus.load_unit(self.service_manager.systemd_unit(name))
+            except Exception as e:
+                app_logger.error(f"D-Bus: falha ao carregar a unidade de '{name}': {e}", exc_info=True)
+                continue
+            self.paths.setdefault(path, set()).add(name)
+            self.service_manager.event_driven_units.add(name)
+            status = "NOT_FOUND" if load_state == "not-found" else SYSTEMD_ACTIVE_STATE_STATUS.get(active_state,
+                                                                                                  "UNKNOWN")
+            self._publish(name, status)
+
+    def _publish(self, name, status):
+        self.service_manager.set_cached_status(name, status)
+        try:
+            self.on_change(name, status)
+        except Exception as e:
+            app_logger.error(f"Erro ao aplicar status D-Bus de '{name}': {e}", exc_info=True)
+
+    def _worker(self):
+        next_sync = time.monotonic() + self.resync_interval
+        try:
+            while not self._stop_event.is_set():
+                signal = self.bus.receive(timeout=1.0)
+                if signal:
+                    path, changed = signal
+                    if "ActiveState" in changed:
+                        status = SYSTEMD_ACTIVE_STATE_STATUS.get(changed["ActiveState"], "UNKNOWN")
+                        for name in self.paths.get(path, ()):
+                            self._publish(name, status)
+                if time.monotonic() >= next_sync:
+                    self._sync_units()
+                    next_sync = time.monotonic() + self.resync_interval
+        except Exception as e:
+            app_logger.error(f"Backend D-Bus do systemd interrompido: {e}", exc_info=True)
+            self.service_manager.event_driven_units.clear()
+            if self.on_failure:
+                self.on_failure()
+        finally:
+            self.bus.close()
+
+
+# ==============================================================================
+# CLASSE LogReadinessProbe - PRONTIDÃO DO SERVIDOR DETECTADA PELO LOG DA NOVA SESSÃO
+# ==============================================================================
+class LogReadinessProbe:
+    """
+    Aguarda o servidor ficar pronto lendo, desde o início, o arquivo de log da pasta de sessão (logs_*)
+    criada após o início do serviço, até encontrar 'ready_pattern'.
+    Deve ser criado ANTES de iniciar o serviço: as pastas de sessão existentes nesse momento são ignoradas.
+    """
+
+    def __init__(self, log_root, log_filename, ready_pattern, poll_interval=0.25, cancel_event=None):
+        self.log_root = log_root
+        self.log_filename = log_filename or "console.log"
+        self.poll_interval = poll_interval
+        self.cancel_event = cancel_event
+        try:
+            self.ready_regex = re.compile(ready_pattern) if ready_pattern else None
+        except re.error as e:
+            app_logger.warning(f"Padrão de prontidão inválido '{ready_pattern}': {e}. Usando apenas o delay fixo.")
+            self.ready_regex = None
+        self.known_folders = set(self._session_folders()) if self.enabled else set()
+
+    @property
+    def enabled(self):
+        return self.ready_regex is not None and bool(self.log_root) and os.path.isdir(self.log_root)
+
+    def _session_folders(self):
+        try:
+            return [e.path for e in os.scandir(self.log_root) if e.is_dir() and LOG_SESSION_FOLDER_REGEX.match(e.name)]
+        except OSError:
+            return []
+
+    def _sleep(self, seconds):
+        if self.cancel_event:
+            return self.cancel_event.wait(seconds)
+        time.sleep(seconds)
+        return False
+
+    def wait(self, timeout):
+        """
+        Bloqueia até o padrão aparecer, 'timeout' expirar ou o cancelamento.
+        Retorna (pronto, segundos_aguardados, linha). 'pronto' é None quando a sonda está desativada
+        (sem pasta de logs ou padrão) e o tempo todo foi aguardado como delay fixo.
+        """
+        start = time.monotonic()
+        if not self.enabled:
+            self._sleep(timeout)
+            return None, time.monotonic() - start, None
+        deadline = start + timeout
+        log_path, handle, pending = None, None, ""
+        try:
+            while time.monotonic() < deadline:
+                if handle is None:
+                    new_folders = [f for f in self._session_folders() if f not in self.known_folders]
+                    if new_folders:
+                        log_path = os.path.join(max(new_folders, key=os.path.getmtime), self.log_filename)
+                        try:
+                            handle = open(log_path, "r", encoding="utf-8", errors="replace")
+                        except OSError:
+                            handle = None  # pasta criada, log ainda não
+                if handle is not None:
+                    chunk = handle.read()
+                    if chunk:
+                        lines = (pending + chunk).split("\n")
+                        pending = lines.pop()
+                        for line in lines:
+                            if self.ready_regex.search(line):
+                                return True, time.monotonic() - start, line.strip()
+                        continue
+                if self._sleep(self.poll_interval):
+                    break
+            return False, time.monotonic() - start, None
+        finally:
+            if handle is not None:
+                handle.close()
+
+
+class PipeReadinessProbe:
+    """
+    Equivalente ao LogReadinessProbe para serviços de processo filho: escuta a saída do processo pelo
+    ChildProcessBackend. Deve ser criado ANTES de iniciar o processo para não perder a linha de prontidão.
+    """
+
+    def __init__(self, backend, service_name, ready_pattern, cancel_event=None):
+        self.backend = backend
+        self.service_name = service_name
+        self.cancel_event = cancel_event
+        self._lines = queue.Queue()
+        try:
+            self.ready_regex = re.compile(ready_pattern) if ready_pattern else None
+        except re.error as e:
+            app_logger.warning(f"Padrão de prontidão inválido '{ready_pattern}': {e}. Usando apenas o delay fixo.")
+            self.ready_regex = None
+        if self.enabled:
+            backend.add_line_listener(service_name, self._lines.put)
+
+    @property
+    def enabled(self):
+        return self.ready_regex is not None
+
+    def wait(self, timeout):
+        """ Mesmo contrato de LogReadinessProbe.wait(): (pronto, segundos_aguardados, linha). """
+        start = time.monotonic()
+        if not self.enabled:
+            if self.cancel_event:
+                self.cancel_event.wait(timeout)
+            else:
+                time.sleep(timeout)
+            return None, time.monotonic() - start, None
+        deadline = start + timeout
+        try:
+            while time.monotonic() < deadline:
+                remaining = deadline - time.monotonic()
+                if self.cancel_event is not None and self.cancel_event.is_set():
+                    break
+                try:
+                    line = self._lines.get(timeout=min(0.25, remaining))
+                except queue.Empty:
+                    if self.backend.status(self.service_name) in ("STOPPED", "FAILED"):
+                        break  # o processo saiu antes de ficar pronto
+                    continue
+                if self.ready_regex.search(line):
+                    return True, time.monotonic() - start, line.strip()
+            return False, time.monotonic() - start, None
+        finally:
+            self.backend.remove_line_listener(self.service_name, self._lines.put)
+
+
+
+# ==============================================================================
+# CLASSE RestartOrchestrator - FILA CENTRAL DE REINÍCIOS (LIMITE E ESCALONAMENTO)
+# ==============================================================================
+class RestartOrchestrator:
+    """
+    Fila única para os reinícios de todas as abas. Executa no máximo 'max_concurrent' reinícios ao mesmo
+    tempo neste host e espaça o início de cada um em pelo menos 'stagger_seconds', evitando que vários
+    servidores carreguem o mapa juntos. A ordem é por prioridade (manual > gatilho > agendado) e chegada.
+
+    Cada serviço tem uma máquina de estados (idle -> pending -> queued -> running -> cooldown): pedidos que
+    chegam enquanto já há um reinício em andamento, ou durante o cooldown após ele, são absorvidos e contados.
+    """
+    PRIORITY_MANUAL, PRIORITY_TRIGGER, PRIORITY_SCHEDULED = 0, 1, 2
+    KIND_KEYS = {PRIORITY_MANUAL: "restart_type_manual", PRIORITY_TRIGGER: "restart_type_trigger",
+                 PRIORITY_SCHEDULED: "restart_type_scheduled"}
+
+    def __init__(self, max_concurrent=2, stagger_seconds=15.0, stop_event=None, cooldown_seconds=120.0):
+        self.max_concurrent = max(1, int(max_concurrent))
+        self.stagger_seconds = max(0.0, float(stagger_seconds))
+        self.cooldown_seconds = max(0.0, float(cooldown_seconds))
+        self._service_states = {}  # chave do serviço -> {"state", "cooldown_until", "collapsed"}
+        self._stop_event = stop_event or threading.Event()
+        self._cond = threading.Condition()
+        self._heap = []  # (prioridade, sequência, job)
+        self._running = []
+        self._seq = 0
+        self._last_launch = None
+        self._dispatcher = threading.Thread(target=self._dispatch_worker, daemon=True, name="RestartOrchestrator")
+        self._dispatcher.start()
+
+    @staticmethod
+    def service_key(server_name, service_name):
+        return service_name or f"tab:{server_name}"
+
+    def _service_state(self, key):
+        return self._service_states.setdefault(key, {"state": "idle", "cooldown_until": 0.0, "collapsed": 0})
+
+    def claim(self, key, ignore_cooldown=False):
+        """
+        Reserva o reinício do serviço 'key'. Retorna None se a reserva foi feita (estado 'pending'), ou o
+        motivo ("in_flight"/"cooldown") se o pedido foi absorvido por um reinício em andamento ou recente.
+        """
+        with self._cond:
+            st = self._service_state(key)
+            if st["state"] == "cooldown" and (ignore_cooldown or time.monotonic() >= st["cooldown_until"]):
+                st["state"] = "idle"
+            if st["state"] != "idle":
+                st["collapsed"] += 1
+                reason = "cooldown" if st["state"] == "cooldown" else "in_flight"
+                app_logger.info(f"Pedido de reinício para '{key}' absorvido ({reason}, estado '{st['state']}'); "
+                                f"{st['collapsed']} pedido(s) agrupado(s) até agora.")
+                return reason
+            st["state"] = "pending"
+            return None
+
+    def release(self, key):
+        """ Desfaz uma reserva feita por claim() que não chegou a ser enfileirada. """
+        with self._cond:
+            st = self._service_state(key)
+            if st["state"] == "pending": st["state"] = "idle"
+
+    def is_busy(self, key):
+        """ Se o serviço tem um reinício em andamento ou ainda está no cooldown após um. """
+        with self._cond:
+            st = self._service_state(key)
+            return st["state"] in ("pending", "queued", "running") or (
+                    st["state"] == "cooldown" and time.monotonic() < st["cooldown_until"])
+
+    def collapsed_count(self, key):
+        with self._cond:
+            return self._service_state(key)["collapsed"]
+
+    def submit(self, server_name, service_name, priority, func, key=None):
+        """
+        Enfileira 'func' (a rotina de reinício da aba). Retorna a posição na fila (1 = próximo), ou None se o
+        pedido foi absorvido. Se 'key' for informada, o chamador já reservou o serviço com claim().
+        """
+        if key is None:
+            key = self.service_key(server_name, service_name)
+            if self.claim(key, ignore_cooldown=priority == self.PRIORITY_MANUAL):
+                return None
+        with self._cond:
+            self._seq += 1
+            st = self._service_state(key)
+            st["state"] = "queued"
+            job = {"server": server_name, "service": service_name, "priority": priority, "func": func,
+                   "key": key, "state": "queued", "submitted_at": time.time(), "started_at": None,
+                   "collapsed_before": st["collapsed"]}
+            heapq.heappush(self._heap, (priority, self._seq, job))
+            position = sorted(self._heap).index((priority, self._seq, job)) + 1
+            self._cond.notify_all()
+        app_logger.info(f"Reinício de '{server_name}' ({service_name}) enfileirado com prioridade {priority}; "
+                        f"posição {position}.")
+        return position
+
+    def snapshot(self):
+        """ Lista (em execução primeiro, depois a fila em ordem) de cópias dos jobs, para a visualização. """
+        with self._cond:
+            running = [dict(job) for job in self._running]
+            queued = [dict(job) for _p, _s, job in sorted(self._heap)]
+            for job in running + queued:
+                job["collapsed"] = self._service_state(job["key"])["collapsed"] - job["collapsed_before"]
+        return running + queued
+
+    def shutdown(self):
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    def _dispatch_worker(self):
+        while not self._stop_event.is_set():
+            with self._cond:
+                wait_for = None
+                if self._heap and len(self._running) < self.max_concurrent:
+                    if self._last_launch is not None:
+                        wait_for = self._last_launch + self.stagger_seconds - time.monotonic()
+                    if wait_for is None or wait_for <= 0:
+                        _priority, _seq, job = heapq.heappop(self._heap)
+                        job["state"], job["started_at"] = "running", time.time()
+                        self._service_state(job["key"])["state"] = "running"
+                        self._running.append(job)
+                        self._last_launch = time.monotonic()
+                        threading.Thread(target=self._run_job, args=(job,), daemon=True,
+                                         name=f"RestartJob-{job['server']}").start()
+                        continue
+                self._cond.wait(timeout=wait_for if wait_for and wait_for > 0 else None)
+
+    def _run_job(self, job):
+        start = time.monotonic()
+        try:
+            job["func"]()
+        except Exception as e:
+            app_logger.error(f"Erro no reinício de '{job['server']}': {e}", exc_info=True)
+        finally:
+            with self._cond:
+                self._running.remove(job)
+                st = self._service_state(job["key"])
+                st["state"], st["cooldown_until"] = "cooldown", time.monotonic() + self.cooldown_seconds
+                self._cond.notify_all()
+            app_logger.info(f"Reinício de '{job['server']}' concluído em {time.monotonic() - start:.1f}s.")
+
+
+# ==============================================================================
+# CLASSE RestartSchedule - EXPRESSÕES DE AGENDAMENTO (HH:MM, CRON, DATA ÚNICA)
+# ==============================================================================
+class RestartSchedule:
+    """
+    Expressão de agendamento compilada uma única vez (e reaproveitada via 'compile'). Formatos aceitos:
+      'HH:MM'              todo dia nesse horário
+      'AAAA-MM-DD HH:MM'   uma única vez
+      cron de 5 campos     'minuto hora dia mês dia-da-semana', ex.: '0 */6 * * mon-fri', '0 5 * * mon,thu'
+    'next_after(dt)' calcula o próximo disparo percorrendo só os dias candidatos (busca binária nos horários),
+    sem comparar texto a cada minuto.
+    """
+    MONTH_NAMES = {name: i + 1 for i, name in enumerate(
+        ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"))}
+    DOW_NAMES = {name: i for i, name in enumerate(("sun", "mon", "tue", "wed", "thu", "fri", "sat"))}
+    SEARCH_DAYS = 366 * 5  # cobre expressões que só casam em 29/02
+    _cache = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(self, text):
+        text = " ".join(text.split())
+        self.once = None
+        daily = re.fullmatch(r"([01]?\d|2[0-3]):([0-5]\d)", text)
+        if daily:
+            hour, minute = int(daily.group(1)), int(daily.group(2))
+            self.text = f"{hour:02d}:{minute:02d}"
+            self.minutes, self.hours = [minute], [hour]
+            self.days, self.months, self.weekdays = list(range(1, 32)), list(range(1, 13)), list(range(7))
+            self.dom_any = self.dow_any = True
+            return
+        self.text = text
+        if re.fullmatch(r"\d{4}-\d{2}-\d{2} \d{1,2}:\d{2}", text):
+            self.once = datetime.strptime(text, "%Y-%m-%d %H:%M")
+            return
+        fields = text.split(" ")
+        if len(fields) != 5:
+            raise ValueError(f"Expressão de agendamento inválida: '{text}'")
+        self.minutes = self._parse_field(fields[0], 0, 59)
+        self.hours = self._parse_field(fields[1], 0, 23)
+        self.days = self._parse_field(fields[2], 1, 31)
+        self.months = self._parse_field(fields[3], 1, 12, self.MONTH_NAMES)
+        self.weekdays = sorted({d % 7 for d in self._parse_field(fields[4], 0, 7, self.DOW_NAMES)})
+        self.dom_any, self.dow_any = fields[2] == "*", fields[4] == "*"
+
+    @classmethod
+    def compile(cls, text):
+        """ Compila (ou reaproveita do cache) a expressão; ValueError se for inválida. """
+        with cls._cache_lock:
+            schedule = cls._cache.get(text)
+        if schedule is None:
+            schedule = cls(text)
+            with cls._cache_lock:
+                cls._cache[text] = schedule
+        return schedule
+
+    @staticmethod
+    def _parse_field(field, low, high, names=None):
+        values = set()
+        for part in field.lower().split(","):
+            span, has_step, step = part.partition("/")
+            step = int(step) if has_step else 1
+            if span == "*":
+                first, last = low, high
+            else:
+                bounds = [names[v] if names and v in names else int(v) for v in span.split("-", 1)]
+                first, last = bounds[0], bounds[-1] if len(bounds) == 2 else (high if has_step else bounds[0])
+            if step < 1 or not low <= first <= last <= high:
+                raise ValueError(f"Campo de agendamento fora do intervalo {low}-{high}: '{part}'")
+            values.update(range(first, last + 1, step))
+        return sorted(values)
+
+    def _day_matches(self, day):
+        dom_ok = day.day in self.days
+        dow_ok = (day.weekday() + 1) % 7 in self.weekdays
+        if not self.dom_any and not self.dow_any:
+            return dom_ok or dow_ok  # como no cron: dia do mês OU dia da semana
+        return dom_ok and dow_ok
+
+    def next_after(self, after):
+        """ Próximo disparo (datetime local) estritamente depois de 'after', ou None se não houver mais. """
+        if self.once is not None:
+            return self.once if self.once > after else None
+        start = (after + timedelta(minutes=1)).replace(second=0, microsecond=0)
+        day, hour0, minute0 = start.date(), start.hour, start.minute
+        for _i in range(self.SEARCH_DAYS):
+            if day.month not in self.months:
+                day = (day.replace(day=1) + timedelta(days=32)).replace(day=1)
+                hour0 = minute0 = 0
+                continue
+            if self._day_matches(day):
+                for hour in self.hours[bisect.bisect_left(self.hours, hour0):]:
+                    pos = bisect.bisect_left(self.minutes, minute0 if hour == hour0 else 0)
+                    if pos < len(self.minutes):
+                        return datetime(day.year, day.month, day.day, hour, self.minutes[pos])
+            day += timedelta(days=1)
+            hour0 = minute0 = 0
+        return None
+
+    @classmethod
+    def upcoming(cls, texts, after, count=5):
+        """ Os 'count' próximos disparos de um conjunto de expressões: lista de (datetime, texto). Ignora inválidas. """
+        heap = []
+        for text in texts:
+            try:
+                schedule = cls.compile(text)
+            except ValueError:
+                continue
+            fire = schedule.next_after(after)
+            if fire is not None:
+                heap.append((fire, text, schedule))
+        heapq.heapify(heap)
+        result = []
+        while heap and len(result) < count:
+            fire, text, schedule = heapq.heappop(heap)
+            if not result or result[-1] != (fire, text):
+                result.append((fire, text))
+            following = schedule.next_after(fire)
+            if following is not None:
+                heapq.heappush(heap, (following, text, schedule))
+        return result
+
+
+# ==============================================================================
+# CLASSE RestartScheduler - AGENDADOR ÚNICO DOS REINÍCIOS PROGRAMADOS
+# ==============================================================================
+class RestartScheduler:
+    """
+    Um único agendador para os horários de todas as abas. Mantém um heap com o próximo disparo de cada
+    expressão (RestartSchedule, já compilada) e dorme até o mais próximo. Editar os horários de uma aba
+    ('reschedule') invalida as entradas antigas dela (descartadas preguiçosamente) e insere as novas.
+
+    As esperas são monotônicas e limitadas a MAX_SLEEP; a cada despertar o relógio de parede é conferido
+    contra o monotônico, de modo que suspensões e ajustes de relógio são detectados. O último disparo de
+    cada expressão é gravado em 'state_file': ao iniciar (ou após uma suspensão) os horários perdidos são
+    tratados pela política da aba - executar uma vez com atraso (dentro da janela de tolerância) ou pular.
+    """
+    POLICY_RUN_LATE = "run_late"
+    POLICY_SKIP = "skip"
+    MAX_SLEEP = 30.0
+    ON_TIME_TOLERANCE = 60.0  # atraso (s) ainda considerado "no horário"
+    CLOCK_JUMP_THRESHOLD = 5.0
+    MAX_CATCHUP_STEPS = 100000
+
+    def __init__(self, stop_event=None, state_file="scheduler_state.json"):
+        self._stop_event = stop_event or threading.Event()
+        self._cond = threading.Condition()
+        self._heap = []  # (despertar epoch, sequência, versão, aba, expressão, RestartSchedule, disparo epoch)
+        self._versions = {}  # aba -> versão atual dos seus horários
+        self._warning_leads = {}  # aba -> antecedência (s) dos avisos RCon, calculada na thread da GUI
+        self._seq = 0
+        self.state_file = state_file
+        self._last_fired = self._load_state()  # nome da aba -> {expressão: epoch do último disparo}
+        self.thread = threading.Thread(target=self._worker, daemon=True, name="RestartScheduler")
+        self.thread.start()
+
+    def _load_state(self):
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            app_logger.warning(f"Estado do agendador ilegível em '{self.state_file}': {e}. Começando do zero.")
+            return {}
+
+    def _save_state(self):
+        try:
+            tmp_path = self.state_file + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._last_fired, f, indent=2)
+            os.replace(tmp_path, self.state_file)
+        except OSError as e:
+            app_logger.error(f"Erro ao gravar o estado do agendador em '{self.state_file}': {e}")
+
+    def _push(self, tab, time_str, schedule, version, after):
+        fire = schedule.next_after(after)
+        if fire is None:
+            return  # data única já passada
+        self._seq += 1
+        fire_ts = fire.timestamp()
+        # Desperta antes do horário pela antecedência dos avisos RCon da aba; o reinício acontece no horário
+        wake_ts = fire_ts - self._warning_leads.get(tab, 0)
+        heapq.heappush(self._heap, (wake_ts, self._seq, version, tab, time_str, schedule, fire_ts))
+
+    def reschedule(self, tab, warning_lead=0):
+        """
+        (Re)insere todos os horários da aba; chamado ao criar a aba e a cada edição dos horários. Cada
+        expressão continua do seu último disparo gravado, então ocorrências perdidas entram já vencidas;
+        expressões novas começam de agora. 'warning_lead' (s) vem de tab.restart_warning_lead() na thread da
+        GUI: as variáveis Tk da aba nunca são lidas aqui, com _cond adquirido.
+        """
+        now = time.time()
+        with self._cond:
+            version = self._versions.get(tab, 0) + 1
+            self._versions[tab] = version
+            self._warning_leads[tab] = warning_lead
+            previous = self._last_fired.get(tab.nome, {})
+            fired = {}
+            for time_str in tab.scheduled_restarts_list:
+                try:
+                    schedule = RestartSchedule.compile(time_str)
+                except ValueError as e:
+                    app_logger.warning(f"Aba '{tab.nome}': agendamento ignorado: {e}")
+                    continue
+                fired[time_str] = min(previous.get(time_str, now), now)
+                self._push(tab, time_str, schedule, version, datetime.fromtimestamp(fired[time_str]))
+            if fired != previous:
+                self._last_fired[tab.nome] = fired
+                self._save_state()
+            self._cond.notify_all()
+
+    def rename(self, tab, new_name):
+        """
+        Renomeia a aba e move o estado gravado dela para o novo nome (as chaves do estado são o nome da aba).
+        Ambos sob _cond, para o worker não gravar um disparo sob o nome antigo no meio da troca.
+        """
+        with self._cond:
+            old_name, tab.nome = tab.nome, new_name
+            if old_name in self._last_fired:
+                self._last_fired[new_name] = self._last_fired.pop(old_name)
+                self._save_state()
+
+    def remove(self, tab):
+        with self._cond:
+            self._versions.pop(tab, None)
+            self._warning_leads.pop(tab, None)
+            self._cond.notify_all()
+
+    def upcoming(self, limit=20):
+        """ Próximos disparos válidos, em ordem: lista de (datetime, aba, expressão). """
+        with self._cond:
+            entries = [e for e in self._heap if self._versions.get(e[3]) == e[2]]
+        return [(datetime.fromtimestamp(e[6]), e[3], e[4]) for e in heapq.nsmallest(limit, entries)]
+
+    def shutdown(self):
+        self._stop_event.set()
+        with self._cond:
+            self._cond.notify_all()
+
+    def _latest_occurrence(self, schedule, fire_ts, now):
+        """ A ocorrência mais recente ainda não posterior a 'now', a partir de uma vencida em 'fire_ts'. """
+        occurrence = datetime.fromtimestamp(fire_ts)
+        limit = datetime.fromtimestamp(now)
+        for _i in range(self.MAX_CATCHUP_STEPS):
+            following = schedule.next_after(occurrence)
+            if following is None or following > limit:
+                break
+            occurrence = following
+        return occurrence.timestamp()
+
+    def _worker(self):
+        last_wall, last_mono = time.time(), time.monotonic()
+        while not self._stop_event.is_set():
+            due = []
+            with self._cond:
+                now, now_mono = time.time(), time.monotonic()
+                drift = (now - last_wall) - (now_mono - last_mono)
+                if abs(drift) > self.CLOCK_JUMP_THRESHOLD:
+                    app_logger.warning(f"Agendador: relógio de parede saltou {drift:+.0f}s em relação ao monotônico "
+                                       f"(suspensão ou ajuste de horário); reconciliando agendamentos.")
+                last_wall, last_mono = now, now_mono
+                while self._heap and self._versions.get(self._heap[0][3]) != self._heap[0][2]:
+                    heapq.heappop(self._heap)  # entrada de uma versão antiga ou de aba removida
+                delay = self._heap[0][0] - now if self._heap else self.MAX_SLEEP
+                if delay > 0:
+                    self._cond.wait(timeout=min(delay, self.MAX_SLEEP))
+                    continue
+                while self._heap and self._heap[0][0] <= now:
+                    _wake_ts, _seq, version, tab, time_str, schedule, fire_ts = heapq.heappop(self._heap)
+                    if self._versions.get(tab) != version:
+                        continue
+                    fire_ts = self._latest_occurrence(schedule, fire_ts, now)  # várias perdidas contam como uma
+                    due.append((tab, time_str, now - fire_ts, fire_ts))
+                    self._last_fired.setdefault(tab.nome, {})[time_str] = fire_ts
+                    self._push(tab, time_str, schedule, version, datetime.fromtimestamp(fire_ts))
+                if due: self._save_state()
+            for tab, time_str, late_seconds, fire_ts in due:
+                try:
+                    self._dispatch(tab, time_str, late_seconds, fire_ts)
+                except Exception as e:
+                    app_logger.error(f"Erro ao disparar reinício agendado de '{tab.nome}' ({time_str}): {e}",
+                                     exc_info=True)
+
+    def _dispatch(self, tab, time_str, late_seconds, fire_ts):
+        if late_seconds <= self.ON_TIME_TOLERANCE:
+            tab.disparar_reinicio_agendado(time_str, restart_at=fire_ts)
+            return
+        try:
+            grace_seconds = float(tab.schedule_grace_minutes_var.get()) * 60
+        except (tk.TclError, ValueError):
+            grace_seconds = 0.0
+        if tab.schedule_missed_policy_var.get() == self.POLICY_RUN_LATE and late_seconds <= grace_seconds:
+            tab.disparar_reinicio_agendado(time_str, late_seconds=late_seconds)
+        else:
+            tab.registrar_agendamento_perdido(time_str, late_seconds)
+
+# ==============================================================================
+# CLASSE RestartQueueWindow - VISUALIZAÇÃO DA FILA DE REINÍCIOS
+# ==============================================================================
+class RestartQueueWindow(ttk.Toplevel):
+    """ Janela não modal que mostra os reinícios em execução e na fila, atualizada a cada segundo. """
+
+    def __init__(self, app):
+        super().__init__(app.root)
+        self.app = app
+        _ = app.translator.get
+        orchestrator = app.restart_orchestrator
+        self.title(_("restart_queue_title"))
+        self.geometry("720x320")
+        self.transient(app.root)
+        ttk.Label(self, text=_("restart_queue_limits", max=orchestrator.max_concurrent,
+                               stagger=int(orchestrator.stagger_seconds),
+                               cooldown=int(orchestrator.cooldown_seconds))).pack(anchor='w', padx=10, pady=(10, 0))
+        columns = ("server", "service", "kind", "state", "time", "collapsed")
+        self.tree = ttk.Treeview(self, columns=columns, show="headings")
+        for col, width in zip(columns, (160, 160, 110, 100, 70, 80)):
+            self.tree.heading(col, text=_(f"restart_queue_col_{col}"))
+            self.tree.column(col, width=width, anchor='w')
+        self.tree.pack(fill='both', expand=True, padx=10, pady=10)
+        self._refresh()
+
+    def _refresh(self):
+        if self.app._shutting_down or not self.winfo_exists():
+            return
+        _ = self.app.translator.get
+        now = time.time()
+        self.tree.delete(*self.tree.get_children())
+        for job in self.app.restart_orchestrator.snapshot():
+            running = job["state"] == "running"
+            elapsed = now - (job["started_at"] if running else job["submitted_at"])
+            self.tree.insert("", "end", values=(
+                job["server"], job["service"], _(RestartOrchestrator.KIND_KEYS[job["priority"]]),
+                _("restart_queue_running") if running else _("restart_queue_waiting"), f"{int(elapsed)}s",
+                job["collapsed"]))
+        self.after(1000, self._refresh)
+
+
+# ==============================================================================
+# CLASSE ServerTabMixin - COMPORTAMENTO COMUM ÀS ABAS DE SERVIDOR (RESTARTER E VOTEMAP)
+# ==============================================================================
+class ServerTabMixin:
+    """
+    Métodos idênticos nas duas abas de servidor. Assume os atributos que ambas definem:
+    'app', 'nome', 'logger', 'nome_servico', 'pasta_raiz', as variáveis de configuração do serviço e o
+    '_restart_cancel_event', além de '_executar_reinicio(priority, kind)', a tarefa que cada aba enfileira.
+    """
+
+    def _criar_sonda_prontidao(self):
+        """ Cria a sonda de prontidão antes do início do serviço (para ignorar as pastas de sessão antigas). """
+        nome_servico = self.nome_servico.get()
+        if ServiceManager.is_process_service(nome_servico):
+            return PipeReadinessProbe(self.app.service_manager.process_backend, nome_servico,
+                                      self.ready_pattern_var.get(), cancel_event=self._restart_cancel_event)
+        return LogReadinessProbe(self.pasta_raiz.get(), self.log_filename_var.get(), self.ready_pattern_var.get(),
+                                 cancel_event=self._restart_cancel_event)
+
+    def _aguardar_servico_ativo(self, nome_servico, start_delay):
+        """
+        Consulta o serviço até ele estar RUNNING e só então marca a fase 'running' (o comando de início aceito
+        não significa serviço ativo). Retorna o que resta de 'start_delay' para a espera de prontidão.
+        """
+        running, elapsed = self.app.service_manager.wait_until_running(nome_servico, start_delay,
+                                                                       cancel_event=self._restart_cancel_event)
+        if running: self._marcar_fase_reinicio("running")
+        self.logger.info(f"Tab '{self.nome}': serviço ativo após início = {running} em {elapsed:.1f}s.")
+        return max(0.0, start_delay - elapsed)
+
+    def _aguardar_prontidao_servidor(self, probe, start_delay):
+        """ Aguarda o padrão de prontidão no log da nova sessão, com 'start_delay' como limite. """
+        _ = self.app.translator.get
+        if not probe.enabled:
+            self.append_text_to_log_area_threadsafe(_("log_wait_after_start", delay=start_delay) + "\n")
+        else:
+            self.append_text_to_log_area_threadsafe(_("log_waiting_ready", timeout=start_delay) + "\n")
+        ready, elapsed, _line = probe.wait(start_delay)
+        if ready:
+            self.append_text_to_log_area_threadsafe(_("log_server_ready", elapsed=f"{elapsed:.1f}") + "\n")
+        elif ready is False:
+            self.append_text_to_log_area_threadsafe(_("log_ready_timeout", timeout=start_delay) + "\n")
+        self.logger.info(f"Tab '{self.nome}': prontidão após início = {ready} em {elapsed:.1f}s.")
+        return ready
+
+    def _aguardar_parada_servico(self, nome_servico, main_pid):
+        """ Aguarda a parada confirmada (estado da unidade e saída do PID), com 'stop_delay' como limite. """
+        _ = self.app.translator.get
+        stop_delay = self.stop_delay_var.get()
+        self.append_text_to_log_area_threadsafe(_("log_waiting_stop", timeout=stop_delay) + "\n")
+        stopped, elapsed = self.app.service_manager.wait_until_stopped(
+            nome_servico, stop_delay, cancel_event=self._restart_cancel_event, main_pid=main_pid)
+        if stopped:
+            self.append_text_to_log_area_threadsafe(_("log_stop_confirmed", elapsed=f"{elapsed:.1f}") + "\n")
+        elif stopped is False:
+            self.append_text_to_log_area_threadsafe(_("log_stop_timeout", timeout=stop_delay) + "\n")
+        self.logger.info(f"Tab '{self.nome}': parada de '{nome_servico}' = {stopped} em {elapsed:.1f}s.")
+        return stopped
+
+    def _registrar_comando_processo(self):
+        """ Atualiza no backend de processo filho o comando e o prazo de parada desta aba. Thread-safe. """
+        nome_servico = self.nome_servico.get()
+        command = self.process_command_var.get().strip()
+        if not command or not ServiceManager.is_process_service(nome_servico):
+            return False
+        self.app.service_manager.process_backend.register(nome_servico, command, stop_grace=self.stop_delay_var.get())
+        return True
+
+    def _aplicar_comando_processo(self):
+        """
+        Com um comando preenchido, a aba passa a usar o serviço 'process:<aba>' (processo filho, saída lida do
+        pipe); com o campo vazio, volta a não ter serviço selecionado. Chamado na thread da GUI.
+        """
+        nome_servico = self.nome_servico.get()
+        is_process = ServiceManager.is_process_service(nome_servico)
+        if self.process_command_var.get().strip():
+            target = nome_servico if is_process else f"{PROCESS_SERVICE_PREFIX}{self.nome}"
+        elif is_process:
+            self.app.service_manager.process_backend.unregister(nome_servico)
+            target = ""
+        else:
+            return
+        if target != nome_servico:
+            self.stop_log_monitoring()
+            self.set_selected_service(target)
+            self._stop_event.clear()
+            self.initialize_from_config_vars()
+        self._registrar_comando_processo()
+
+    def _iniciar_escuta_processo(self):
+        nome_servico = self.nome_servico.get()
+        self._registrar_comando_processo()
+        self.app.service_manager.process_backend.add_line_listener(nome_servico, self._on_process_output_line)
+        self._process_listener_service = nome_servico
+
+    def _create_rss_limit_ui(self, parent_frame, row):
+        """ Linha de opções do limite de memória (RSS) que dispara o reinício. """
+        rss_frame = ttk.Frame(parent_frame)
+        rss_frame.grid(row=row, column=0, columnspan=2, sticky='ew', pady=(10, 0))
+        self.rss_limit_lbl = ttk.Label(rss_frame)
+        self.rss_limit_lbl.pack(side='left', padx=5)
+        self.rss_limit_spinbox = ttk.Spinbox(rss_frame, from_=0, to=256, increment=0.5,
+                                             textvariable=self.rss_limit_gb_var, width=6)
+        self.rss_limit_spinbox.pack(side='left', padx=5)
+        self.rss_limit_spinbox_tooltip = ToolTip(self.rss_limit_spinbox)
+        self.rss_limit_minutes_lbl = ttk.Label(rss_frame)
+        self.rss_limit_minutes_lbl.pack(side='left', padx=(15, 5))
+        self.rss_limit_minutes_spinbox = ttk.Spinbox(rss_frame, from_=1, to=240,
+                                                     textvariable=self.rss_limit_minutes_var, width=5)
+        self.rss_limit_minutes_spinbox.pack(side='left', padx=5)
+
+    def _update_rss_limit_ui_text(self):
+        _ = self.app.translator.get
+        self.rss_limit_lbl.config(text=_('lbl_rss_limit'))
+        self.rss_limit_spinbox_tooltip.text = _('tooltip_rss_limit')
+        self.rss_limit_minutes_lbl.config(text=_('lbl_rss_limit_minutes'))
+
+    def display_resource_usage(self, cpu, rss, io_rates, ring):
+        """ Mostra CPU/RSS atuais e os minigráficos do ResourceRing (chamado pelo ProcessResourceSampler). """
+        width = ProcessResourceSampler.SPARKLINE_WIDTH
+        text = self.app.translator.get(
+            "resource_summary", cpu=f"{cpu:.0f}", cpu_spark=sparkline(ring.series(ring.cpu, width)),
+            rss=f"{rss / 1024 ** 3:.2f}", rss_spark=sparkline(ring.series(ring.rss_mb, width)))
+        if io_rates is not None:
+            text += self.app.translator.get("resource_io", read=f"{io_rates[0] / 1024 ** 2:.1f}",
+                                            write=f"{io_rates[1] / 1024 ** 2:.1f}")
+        if self.winfo_exists():
+            self.app.root.after(0, self.resource_label_var.set, text)
+
+    def _create_a2s_probe_ui(self, parent_frame, row):
+        """ Linha de opções da sonda A2S (endereço de consulta e falhas seguidas até reiniciar). """
+        a2s_frame = ttk.Frame(parent_frame)
+        a2s_frame.grid(row=row, column=0, columnspan=2, sticky='ew', pady=(10, 0))
+        self.a2s_address_lbl = ttk.Label(a2s_frame)
+        self.a2s_address_lbl.pack(side='left', padx=5)
+        self.a2s_address_entry = ttk.Entry(a2s_frame, textvariable=self.a2s_address_var, width=22)
+        self.a2s_address_entry.pack(side='left', padx=5)
+        self.a2s_address_entry_tooltip = ToolTip(self.a2s_address_entry)
+        self.a2s_max_missed_lbl = ttk.Label(a2s_frame)
+        self.a2s_max_missed_lbl.pack(side='left', padx=(15, 5))
+        self.a2s_max_missed_spinbox = ttk.Spinbox(a2s_frame, from_=0, to=60,
+                                                  textvariable=self.a2s_max_missed_var, width=5)
+        self.a2s_max_missed_spinbox.pack(side='left', padx=5)
+
+    def _update_a2s_probe_ui_text(self):
+        _ = self.app.translator.get
+        self.a2s_address_lbl.config(text=_('lbl_a2s_address'))
+        self.a2s_address_entry_tooltip.text = _('tooltip_a2s_address')
+        self.a2s_max_missed_lbl.config(text=_('lbl_a2s_max_missed'))
+
+    def display_probe_result(self, info, missed):
+        """ Mostra a última sondagem A2S: latência e jogadores, ou quantas sondagens seguidas falharam. """
+        if info is not None:
+            text = self.app.translator.get("probe_summary", latency=f"{info['latency_ms']:.0f}",
+                                           players=info["players"], max_players=info["max_players"],
+                                           map=info["map"])
+        else:
+            text = self.app.translator.get("probe_no_response", missed=missed)
+        if self.winfo_exists():
+            self.app.root.after(0, self.probe_label_var.set, text)
+
+    def _create_log_silence_ui(self, parent_frame, row):
+        """ Linha de opções do watchdog de silêncio do log (minutos sem linhas e ação). """
+        silence_frame = ttk.Frame(parent_frame)
+        silence_frame.grid(row=row, column=0, columnspan=2, sticky='ew', pady=(10, 0))
+        self.log_silence_lbl = ttk.Label(silence_frame)
+        self.log_silence_lbl.pack(side='left', padx=5)
+        self.log_silence_spinbox = ttk.Spinbox(silence_frame, from_=0, to=240,
+                                               textvariable=self.log_silence_minutes_var, width=5)
+        self.log_silence_spinbox.pack(side='left', padx=5)
+        self.log_silence_spinbox_tooltip = ToolTip(self.log_silence_spinbox)
+        self.log_silence_action_combo = ttk.Combobox(silence_frame, state='readonly', width=22)
+        self.log_silence_action_combo.pack(side='left', padx=(15, 5))
+        self.log_silence_action_combo.bind("<<ComboboxSelected>>", self._on_log_silence_action_selected)
+
+    def _update_log_silence_ui_text(self):
+        _ = self.app.translator.get
+        self.log_silence_lbl.config(text=_('lbl_log_silence'))
+        self.log_silence_spinbox_tooltip.text = _('tooltip_log_silence')
+        self.log_silence_action_combo.config(
+            values=[_('log_silence_action_notify'), _('log_silence_action_restart')])
+        self.log_silence_action_combo.current(
+            1 if self.log_silence_action_var.get() == LogSilenceWatchdog.ACTION_RESTART else 0)
+
+    def _on_log_silence_action_selected(self, event=None):
+        self.log_silence_action_var.set(LogSilenceWatchdog.ACTION_RESTART if self.log_silence_action_combo.current() == 1
+                                        else LogSilenceWatchdog.ACTION_NOTIFY)
+
+    def _create_rcon_warning_ui(self, parent_frame, row):
+        """ Duas linhas de opções dos avisos RCon antes do reinício (endereço/senha; estágios/mensagem). """
+        rcon_frame = ttk.Frame(parent_frame)
+        rcon_frame.grid(row=row, column=0, columnspan=2, sticky='ew', pady=(10, 0))
+        self.rcon_address_lbl = ttk.Label(rcon_frame)
+        self.rcon_address_lbl.pack(side='left', padx=5)
+        self.rcon_address_entry = ttk.Entry(rcon_frame, textvariable=self.rcon_address_var, width=22)
+        self.rcon_address_entry.pack(side='left', padx=5)
+        self.rcon_address_entry_tooltip = ToolTip(self.rcon_address_entry)
+        self.rcon_password_lbl = ttk.Label(rcon_frame)
+        self.rcon_password_lbl.pack(side='left', padx=(15, 5))
+        self.rcon_password_entry = ttk.Entry(rcon_frame, textvariable=self.rcon_password_var, width=14, show="*")
+        self.rcon_password_entry.pack(side='left', padx=5)
+
+        warning_frame = ttk.Frame(parent_frame)
+        warning_frame.grid(row=row + 1, column=0, columnspan=2, sticky='ew', pady=(5, 0))
+        self.restart_warning_stages_lbl = ttk.Label(warning_frame)
+        self.restart_warning_stages_lbl.pack(side='left', padx=5)
+        self.restart_warning_stages_entry = ttk.Entry(warning_frame, textvariable=self.restart_warning_stages_var,
+                                                      width=12)
+        self.restart_warning_stages_entry.pack(side='left', padx=5)
+        self.restart_warning_stages_tooltip = ToolTip(self.restart_warning_stages_entry)
+        self.restart_warning_message_lbl = ttk.Label(warning_frame)
+        self.restart_warning_message_lbl.pack(side='left', padx=(15, 5))
+        ttk.Entry(warning_frame, textvariable=self.restart_warning_message_var, width=30).pack(
+            side='left', fill='x', expand=True, padx=5)
+
+    def _update_rcon_warning_ui_text(self):
+        _ = self.app.translator.get
+        self.rcon_address_lbl.config(text=_('lbl_rcon_address'))
+        self.rcon_address_entry_tooltip.text = _('tooltip_rcon_address')
+        self.rcon_password_lbl.config(text=_('lbl_rcon_password'))
+        self.restart_warning_stages_lbl.config(text=_('lbl_restart_warning_stages'))
+        self.restart_warning_stages_tooltip.text = _('tooltip_restart_warning_stages')
+        self.restart_warning_message_lbl.config(text=_('lbl_restart_warning_message'))
+
+    def _marcar_fase_reinicio(self, phase):
+        if self._restart_timeline is not None: self._restart_timeline.mark(phase)
+
+    def _registrar_historico_reinicio(self, success):
+        """ Grava o reinício concluído no histórico e atualiza as estatísticas exibidas na aba. """
+        timeline, self._restart_timeline = self._restart_timeline, None
+        if timeline is None: return
+        self.app.restart_history.record(timeline, success)
+        self._atualizar_estatisticas_reinicio()
+
+    def _atualizar_estatisticas_reinicio(self):
+        _ = self.app.translator.get
+        count, p50, p95 = self.app.restart_history.downtime_stats(self.nome)
+        if count:
+            text = _("restart_stats_summary", count=count, p50=f"{p50:.0f}", p95=f"{p95:.0f}")
+        else:
+            text = _("restart_stats_empty")
+        if self.winfo_exists():
+            self.app.root.after(0, self.restart_stats_label_var.set, text)
+
+    def display_service_status(self, status, base_text=None):
+        """ Mostra um status (vindo da consulta da aba ou de outra fonte) no rótulo de serviço. Thread-safe. """
+        display_text, color = self.app.service_manager.describe_status(status)
+        if base_text is None:
+            base_text = f"{self.app.translator.get('lbl_service_prefix')}: {self.nome_servico.get()}"
+        if self.app.root.winfo_exists() and self.winfo_exists():
+            self.app.root.after(0, lambda: (
+                self.servico_label_var.set(f"{base_text} {display_text}"),
+                self.servico_label_widget.config(foreground=color)
+            ))
+
+    def _get_and_display_service_status_thread_worker(self, service_name, base_text):
+        status = self._verificar_status_servico(service_name)
+        self.display_service_status(status, base_text)
+
+    def _verificar_status_servico(self, nome_servico_local, max_age=None):
+        return self.app.service_manager.get_status(nome_servico_local, max_age=max_age)
+
+    def _stop_service(self, service_name):
+        self._registrar_comando_processo()
+        return self.app.service_manager.stop(service_name, self.append_text_to_log_area_threadsafe, self.logger)
+
+    def _start_service(self, service_name):
+        if self._registrar_comando_processo():
+            # Saída do novo processo = nova sessão do servidor (equivale à troca de arquivo de log)
+            self.app.reset_player_sessions_for_source(self.pasta_raiz.get())
+        return self.app.service_manager.start(service_name, self.append_text_to_log_area_threadsafe, self.logger)
+
+    def _desfazer_reserva_reinicio(self, restart_key, error):
+        """ Libera o serviço reservado por claim() quando o reinício não chegou à fila (inócuo se já chegou). """
+        self.app.restart_orchestrator.release(restart_key)
+        self.logger.error(f"Tab '{self.nome}': falha antes de enfileirar o reinício: {error}", exc_info=True)
+        self.append_text_to_log_area_threadsafe(
+            self.app.translator.get("log_restart_request_error", error=error) + "\n")
+
+    def _registrar_reinicio_agrupado(self, restart_key, reason):
+        count = self.app.restart_orchestrator.collapsed_count(restart_key)
+        self.logger.info(f"Tab '{self.nome}': Restart request collapsed ({reason}); total collapsed: {count}.")
+        self.append_text_to_log_area_threadsafe(
+            self.app.translator.get(f"log_restart_collapsed_{reason}", count=count) + "\n")
 
-        # Título da Notificação
-        title_label = ttk.Label(inner_frame, text=title, font=("-weight bold",))
-        title_label.pack(side='top', fill='x')
+    def solicitar_reinicio(self, priority, restart_key=None, warn=False, restart_at=None, kind=None):
+        """
+        Envia o reinício desta aba para a fila central (RestartOrchestrator). 'restart_key' indica que o
+        serviço já foi reservado (gatilho com atraso); sem ela, a reserva é feita aqui. Com 'warn' e RCon
+        configurado, os jogadores são avisados nos estágios configurados antes do reinício ('restart_at').
+        'kind' é o tipo gravado no histórico (padrão: conforme a prioridade).
+        """
+        orchestrator = self.app.restart_orchestrator
+        if restart_key is None:
+            restart_key = orchestrator.service_key(self.nome, self.nome_servico.get())
+            reason = orchestrator.claim(restart_key, ignore_cooldown=priority == RestartOrchestrator.PRIORITY_MANUAL)
+            if reason:
+                self._registrar_reinicio_agrupado(restart_key, reason)
+                return
+        try:
+            stages, target = self._configuracao_aviso() if warn else ([], None)
+            if stages:  # lidos uma única vez: editar os campos RCon depois não afeta este reinício
+                threading.Thread(target=self._avisar_e_reiniciar,
+                                 args=(priority, restart_key, restart_at, kind, stages, target),
+                                 daemon=True, name=f"RestartWarnings-{self.nome}").start()
+                return
+            self._enfileirar_reinicio(priority, restart_key, kind)
+        except Exception as e:
+            self._desfazer_reserva_reinicio(restart_key, e)
 
-        ttk.Separator(inner_frame).pack(side='top', fill='x', pady=5)
+    def _enfileirar_reinicio(self, priority, restart_key, kind=None):
+        position = self.app.restart_orchestrator.submit(self.nome, self.nome_servico.get(), priority,
+                                                        lambda: self._executar_reinicio(priority, kind),
+                                                        key=restart_key)
+        self.append_text_to_log_area_threadsafe(self.app.translator.get("log_restart_queued", position=position) + "\n")
 
-        # Mensagem da Notificação
-        msg_label = ttk.Label(inner_frame, text=message, wraplength=380)
-        msg_label.pack(side='top', fill='x', pady=(0, 5))
+    def _configuracao_aviso(self):
+        """
+        (estágios em s, decrescente; (host, porta, senha)) dos avisos RCon. Sem endereço/senha RCon ou com
+        estágios inválidos, devolve ([], None).
+        """
+        address = parse_a2s_address(self.rcon_address_var.get(), default_port=RCON_DEFAULT_PORT)
+        password = self.rcon_password_var.get()
+        if not address or not password:
+            return [], None
+        try:
+            stages = parse_warning_stages(self.restart_warning_stages_var.get())
+        except ValueError:
+            return [], None
+        return (stages, (address[0], address[1], password)) if stages else ([], None)
 
-        # Label para a contagem regressiva
-        self.countdown_label_var = tk.StringVar()
-        countdown_label = ttk.Label(inner_frame, textvariable=self.countdown_label_var, font=("-size 7",))
-        countdown_label.pack(side='bottom', fill='x', anchor='e')
+    def _estagios_aviso(self):
+        return self._configuracao_aviso()[0]
 
-        self.update_idletasks()
-        self.countdown(self.duration)
+    def _avisar_e_reiniciar(self, priority, restart_key, restart_at, kind, stages, target):
+        """
+        Envia os avisos pela sessão RCon (sem reconectar a cada um) e enfileira o reinício no instante dele.
+        'stages' e 'target' (host, porta, senha) vêm de _configuracao_aviso(). Um 'restart_at' dado nunca é
+        adiado: só os estágios que ainda cabem até ele são enviados (um gatilho de 10s com '5m,1m,10s' avisa
+        apenas '10s'). Sem 'restart_at' o reinício ocorre após o maior estágio. Se for cancelado ou falhar antes
+        de enfileirar, a reserva do serviço é desfeita.
+        """
+        try:
+            host, port, password = target
+            client = self.app.rcon_pool.get(host, port, password)
+            template = self.restart_warning_message_var.get().strip() or RCON_DEFAULT_WARNING
+            if restart_at is None:
+                restart_at = time.time() + stages[0]
+            else:
+                stages = [stage for stage in stages if stage <= restart_at - time.time() + RCON_WARNING_SLACK]
+            for stage in stages:
+                if self._restart_cancel_event.wait(max(0.0, restart_at - stage - time.time())):
+                    self.app.restart_orchestrator.release(restart_key)
+                    return
+                message = template.replace("{time}", format_warning_stage(stage))
+                try:
+                    client.say_all(message).add_done_callback(
+                        lambda future, m=message: self._registrar_aviso_rcon(m, future.exception()))
+                except OSError as e:
+                    self._registrar_aviso_rcon(message, e)
+            if self._restart_cancel_event.wait(max(0.0, restart_at - time.time())):
+                self.app.restart_orchestrator.release(restart_key)
+                return
+            self._enfileirar_reinicio(priority, restart_key, kind)
+        except Exception as e:
+            self._desfazer_reserva_reinicio(restart_key, e)
 
-    def countdown(self, seconds_left):
+    def _registrar_aviso_rcon(self, message, error):
         _ = self.app.translator.get
-        if seconds_left > 0:
-            self.countdown_label_var.set(_('closing_in', s=seconds_left))
-            self.after_id = self.after(1000, lambda: self.countdown(seconds_left - 1))
+        if error is None:
+            self.append_text_to_log_area_threadsafe(_("log_rcon_warning_sent", message=message) + "\n")
         else:
-            self.close_toast()
-
-    def close_toast(self):
-        if hasattr(self, 'after_id'):
-            self.after_cancel(self.after_id)
-        self.app.on_toast_closed(self)
-        self.destroy()
+            self.logger.warning(f"Tab '{self.nome}': aviso RCon '{message}' não enviado: {error}")
+            self.append_text_to_log_area_threadsafe(_("log_rcon_warning_failed", error=error) + "\n")
 
 
 # ==============================================================================
 # CLASSE RestarterTab (Originalmente ServidorTab de PQD_ScheduledRestart.PY)
 # ==============================================================================
-class RestarterTab(ttk.Frame):
+class RestarterTab(ServerTabMixin, ttk.Frame):
     def __init__(self, master_notebook, app_instance, nome_servidor, config_dict=None):
         super().__init__(master_notebook)
         self.app = app_instance
@@ -680,21 +4969,44 @@ class RestarterTab(ttk.Frame):
         self.filtro_var = tk.StringVar(value=self.config_inicial.get("filter", ""))
         self.stop_delay_var = tk.IntVar(value=self.config_inicial.get("stop_delay", 10))
         self.start_delay_var = tk.IntVar(value=self.config_inicial.get("start_delay", 30))
+        self.ready_pattern_var = tk.StringVar(value=self.config_inicial.get("ready_pattern", "Game successfully created"))
+        self.process_command_var = tk.StringVar(value=self.config_inicial.get("process_command", ""))
+        self.rss_limit_gb_var = tk.DoubleVar(value=self.config_inicial.get("rss_limit_gb", 0.0))
+        self.rss_limit_minutes_var = tk.IntVar(value=self.config_inicial.get("rss_limit_minutes", 10))
+        self.resource_label_var = tk.StringVar()
+        self.a2s_address_var = tk.StringVar(value=self.config_inicial.get("a2s_address", ""))
+        self.a2s_max_missed_var = tk.IntVar(value=self.config_inicial.get("a2s_max_missed", 3))
+        self.probe_label_var = tk.StringVar()
+        self.log_silence_minutes_var = tk.IntVar(value=self.config_inicial.get("log_silence_minutes", 0))
+        self.log_silence_action_var = tk.StringVar(
+            value=self.config_inicial.get("log_silence_action", LogSilenceWatchdog.ACTION_NOTIFY))
+        self.log_lines_seen = 0  # lido pelo LogSilenceWatchdog
+        self.restart_stats_label_var = tk.StringVar()
+        self._restart_timeline = None  # RestartTimeline do reinício em andamento (um por vez, via fila)
         self.auto_scroll_log_var = tk.BooleanVar(value=self.config_inicial.get("auto_scroll_log", True))
         self.log_search_var = tk.StringVar()
         self.scheduled_restarts_list = list(self.config_inicial.get("scheduled_restarts", []))
         self.predefined_schedule_vars = {}
         self.custom_schedule_entry_var = tk.StringVar()
-        self.last_scheduled_restart_processed_time_str = None
+        self.schedule_preview_var = tk.StringVar()
+        self.schedule_missed_policy_var = tk.StringVar(
+            value=self.config_inicial.get("schedule_missed_policy", RestartScheduler.POLICY_RUN_LATE))
+        self.schedule_grace_minutes_var = tk.IntVar(value=self.config_inicial.get("schedule_grace_minutes", 30))
+        self.rcon_address_var = tk.StringVar(value=self.config_inicial.get("rcon_address", ""))
+        self.rcon_password_var = tk.StringVar(value=self.config_inicial.get("rcon_password", ""))
+        self.restart_warning_stages_var = tk.StringVar(
+            value=self.config_inicial.get("restart_warning_stages", "5m,1m,10s"))
+        self.restart_warning_message_var = tk.StringVar(
+            value=self.config_inicial.get("restart_warning_message", RCON_DEFAULT_WARNING))
         self.last_search_pos = "1.0"
         self.search_log_frame_visible = False
 
         # --- Threads e Eventos ---
         self._stop_event = threading.Event()
-        self._scheduler_stop_event = threading.Event()
+        self._restart_cancel_event = threading.Event()  # interrompe esperas de parada/início ao fechar a aba
+        self._process_listener_service = None  # serviço 'process:' cuja saída esta aba está escutando
         self._paused = False
         self.log_monitor_thread = None
-        self.scheduler_thread = None
 
         self._create_ui_for_tab()
         self.update_ui_text()
@@ -705,12 +5017,17 @@ class RestarterTab(ttk.Frame):
             self.pasta_raiz, self.nome_servico, self.filtro_var, self.log_filename_var,
             self.trigger_log_message_var, self.auto_restart_on_trigger_var,
             self.auto_scroll_log_var, self.stop_delay_var, self.start_delay_var,
-            self.restart_delay_after_trigger_var
+            self.restart_delay_after_trigger_var, self.ready_pattern_var,
+            self.process_command_var, self.rss_limit_gb_var, self.rss_limit_minutes_var,
+            self.a2s_address_var, self.a2s_max_missed_var, self.log_silence_minutes_var,
+            self.log_silence_action_var, self.schedule_missed_policy_var, self.schedule_grace_minutes_var,
+            self.rcon_address_var, self.rcon_password_var, self.restart_warning_stages_var,
+            self.restart_warning_message_var
         ]
         for var in vars_to_trace:
             var.trace_add("write", lambda *args, v=var: self._value_changed())
-
-        self.start_scheduler_thread()
+        self._atualizar_estatisticas_reinicio()
+        self._reagendar()
 
     def _value_changed(self, new_value=None):
         self.app.mark_config_changed()
@@ -727,8 +5044,22 @@ class RestarterTab(ttk.Frame):
             "restart_delay_after_trigger": self.restart_delay_after_trigger_var.get(),
             "stop_delay": self.stop_delay_var.get(),
             "start_delay": self.start_delay_var.get(),
+            "ready_pattern": self.ready_pattern_var.get(),
+            "process_command": self.process_command_var.get(),
+            "rss_limit_gb": self.rss_limit_gb_var.get(),
+            "rss_limit_minutes": self.rss_limit_minutes_var.get(),
+            "a2s_address": self.a2s_address_var.get(),
+            "a2s_max_missed": self.a2s_max_missed_var.get(),
+            "log_silence_minutes": self.log_silence_minutes_var.get(),
+            "log_silence_action": self.log_silence_action_var.get(),
             "auto_scroll_log": self.auto_scroll_log_var.get(),
-            "scheduled_restarts": sorted(list(set(self.scheduled_restarts_list)))
+            "scheduled_restarts": sorted(list(set(self.scheduled_restarts_list))),
+            "schedule_missed_policy": self.schedule_missed_policy_var.get(),
+            "schedule_grace_minutes": self.schedule_grace_minutes_var.get(),
+            "rcon_address": self.rcon_address_var.get(),
+            "rcon_password": self.rcon_password_var.get(),
+            "restart_warning_stages": self.restart_warning_stages_var.get(),
+            "restart_warning_message": self.restart_warning_message_var.get()
         }
 
     def _create_ui_for_tab(self):
@@ -771,6 +5102,13 @@ class RestarterTab(ttk.Frame):
         self.servico_label_widget = ttk.Label(path_labels_frame_line1, textvariable=self.servico_label_var, anchor='w',
                                               width=30)
         self.servico_label_widget.pack(side='left', padx=(5, 0))
+        self.resource_label = ttk.Label(self.selection_labelframe, textvariable=self.resource_label_var, anchor='w')
+        self.resource_label.pack(fill='x', padx=5)
+        self.probe_label = ttk.Label(self.selection_labelframe, textvariable=self.probe_label_var, anchor='w')
+        self.probe_label.pack(fill='x', padx=5)
+        self.restart_stats_label = ttk.Label(self.selection_labelframe, textvariable=self.restart_stats_label_var,
+                                             anchor='w')
+        self.restart_stats_label.pack(fill='x', padx=5)
 
         self.controls_labelframe = ttk.Labelframe(outer_top_frame, padding=(10, 5))
         self.controls_labelframe.pack(side='top', fill='x', pady=(5, 0))
@@ -867,6 +5205,31 @@ class RestarterTab(ttk.Frame):
         self.start_delay_spinbox = ttk.Spinbox(delay_frame, from_=5, to=180, textvariable=self.start_delay_var, width=5)
         self.start_delay_spinbox.pack(side='left', padx=5)
         self.start_delay_spinbox_tooltip = ToolTip(self.start_delay_spinbox)
+
+        self.ready_pattern_lbl = ttk.Label(options_inner_frame)
+        self.ready_pattern_lbl.grid(row=8, column=0, sticky='w', padx=5, pady=(10, 0))
+        self.ready_pattern_entry = ttk.Entry(options_inner_frame, textvariable=self.ready_pattern_var, width=40)
+        self.ready_pattern_entry.grid(row=9, column=0, sticky='ew', padx=5, pady=2, columnspan=2)
+        self.ready_pattern_entry_tooltip = ToolTip(self.ready_pattern_entry)
+
+        self.process_command_lbl = ttk.Label(options_inner_frame)
+        self.process_command_lbl.grid(row=10, column=0, sticky='w', padx=5, pady=(10, 0))
+        self.process_command_entry = ttk.Entry(options_inner_frame, textvariable=self.process_command_var, width=40)
+        self.process_command_entry.grid(row=11, column=0, sticky='ew', padx=5, pady=2, columnspan=2)
+        self.process_command_entry.bind("<FocusOut>", lambda e: self._aplicar_comando_processo())
+        self.process_command_entry.bind("<Return>", lambda e: self._aplicar_comando_processo())
+        self.process_command_entry_tooltip = ToolTip(self.process_command_entry)
+
+        self._create_rss_limit_ui(options_inner_frame, row=12)
+
+        self._create_a2s_probe_ui(options_inner_frame, row=13)
+
+        self._create_log_silence_ui(options_inner_frame, row=14)
+
+        self._create_rcon_warning_ui(options_inner_frame, row=15)
+        # A antecedência dos avisos muda o instante em que o agendador desperta
+        for entry in (self.rcon_address_entry, self.rcon_password_entry, self.restart_warning_stages_entry):
+            entry.bind("<FocusOut>", lambda e: self._reagendar())
         options_inner_frame.columnconfigure(0, weight=1)
 
         self.scheduled_restarts_frame = ttk.Frame(self.tab_notebook, padding=10)
@@ -920,6 +5283,14 @@ class RestarterTab(ttk.Frame):
         self.stop_delay_spinbox_tooltip.text = _('tooltip_stop_delay_win')
         self.start_delay_lbl.config(text=_('lbl_start_delay'))
         self.start_delay_spinbox_tooltip.text = _('tooltip_start_delay_win')
+        self.ready_pattern_lbl.config(text=_('lbl_ready_pattern'))
+        self.ready_pattern_entry_tooltip.text = _('tooltip_ready_pattern')
+        self.process_command_lbl.config(text=_('lbl_process_command'))
+        self.process_command_entry_tooltip.text = _('tooltip_process_command')
+        self._update_rss_limit_ui_text()
+        self._update_a2s_probe_ui_text()
+        self._update_log_silence_ui_text()
+        self._update_rcon_warning_ui_text()
 
         self.tab_notebook.tab(self.scheduled_restarts_frame, text=_('restarter_tab_scheduled'))
         self.predefined_lf.config(text=_('restarter_scheduled_predefined'))
@@ -929,6 +5300,14 @@ class RestarterTab(ttk.Frame):
         self.add_btn.config(text=_('restarter_btn_add'))
         self.remove_btn.config(text=_('restarter_btn_remove'))
         self.remove_btn_tooltip.text = _('tooltip_restarter_btn_remove')
+        self.missed_schedule_lf.config(text=_('restarter_scheduled_missed'))
+        self.schedule_missed_policy_combo.config(
+            values=[_('schedule_missed_run_late'), _('schedule_missed_skip')])
+        self.schedule_missed_policy_combo.current(
+            1 if self.schedule_missed_policy_var.get() == RestartScheduler.POLICY_SKIP else 0)
+        self.schedule_missed_policy_tooltip.text = _('tooltip_schedule_missed_policy')
+        self.schedule_grace_lbl.config(text=_('lbl_schedule_grace'))
+        self._update_schedule_preview()
 
         # Atualiza labels dinâmicas que dependem de estado
         self.initialize_from_config_vars()
@@ -954,7 +5333,7 @@ class RestarterTab(ttk.Frame):
         custom_add_frame.pack(fill="x", pady=(0, 5))
         self.custom_add_lbl = ttk.Label(custom_add_frame)
         self.custom_add_lbl.pack(side="left", padx=(0, 5))
-        custom_entry = ttk.Entry(custom_add_frame, textvariable=self.custom_schedule_entry_var, width=10)
+        custom_entry = ttk.Entry(custom_add_frame, textvariable=self.custom_schedule_entry_var, width=24)
         custom_entry.pack(side="left", padx=5)
         self.custom_entry_tooltip = ToolTip(custom_entry)
         self.add_btn = ttk.Button(custom_add_frame, command=self._add_custom_schedule, bootstyle=SUCCESS)
@@ -972,6 +5351,20 @@ class RestarterTab(ttk.Frame):
                                      bootstyle=DANGER)
         self.remove_btn.pack(side="left", padx=(5, 0), anchor="n")
         self.remove_btn_tooltip = ToolTip(self.remove_btn)
+        self.schedule_preview_lbl = ttk.Label(self.custom_lf, textvariable=self.schedule_preview_var, anchor='w',
+                                              justify='left')
+        self.schedule_preview_lbl.pack(fill="x", pady=(5, 0))
+
+        self.missed_schedule_lf = ttk.Labelframe(parent_frame, padding=10)
+        self.missed_schedule_lf.pack(fill="x", pady=5)
+        self.schedule_missed_policy_combo = ttk.Combobox(self.missed_schedule_lf, state='readonly', width=30)
+        self.schedule_missed_policy_combo.pack(side="left", padx=(0, 5))
+        self.schedule_missed_policy_combo.bind("<<ComboboxSelected>>", self._on_schedule_missed_policy_selected)
+        self.schedule_missed_policy_tooltip = ToolTip(self.schedule_missed_policy_combo)
+        self.schedule_grace_lbl = ttk.Label(self.missed_schedule_lf)
+        self.schedule_grace_lbl.pack(side="left", padx=(15, 5))
+        ttk.Spinbox(self.missed_schedule_lf, from_=1, to=1440, textvariable=self.schedule_grace_minutes_var,
+                    width=6).pack(side="left", padx=5)
 
     def _update_scheduled_restarts_ui_from_list(self):
         if not hasattr(self, 'predefined_schedule_vars') or not hasattr(self, 'custom_schedules_listbox'):
@@ -988,6 +5381,17 @@ class RestarterTab(ttk.Frame):
             actually_custom_times = sorted(list(all_times - predefined_as_set))
             for time_str in actually_custom_times:
                 self.custom_schedules_listbox.insert(tk.END, time_str)
+        self._update_schedule_preview()
+
+    def _update_schedule_preview(self):
+        """ Mostra os próximos disparos (todas as expressões da aba combinadas). """
+        _ = self.app.translator.get
+        upcoming = RestartSchedule.upcoming(self.scheduled_restarts_list, datetime.now(), count=5)
+        if upcoming:
+            lines = [f"{fire.strftime('%a %d/%m %H:%M')}  ({text})" for fire, text in upcoming]
+            self.schedule_preview_var.set(_("restarter_scheduled_preview") + "\n" + "\n".join(lines))
+        else:
+            self.schedule_preview_var.set(_("restarter_scheduled_preview_none"))
 
     def _toggle_predefined_schedule(self, hour_int, var):
         hour_str = f"{hour_int:02d}:00"
@@ -998,11 +5402,14 @@ class RestarterTab(ttk.Frame):
             if hour_str in self.scheduled_restarts_list:
                 self.scheduled_restarts_list.remove(hour_str)
         self.scheduled_restarts_list = sorted(list(set(self.scheduled_restarts_list)))
+        self._reagendar()
         self._value_changed()
 
     def _add_custom_schedule(self):
         time_str = self.custom_schedule_entry_var.get().strip()
-        if not re.fullmatch(r"([01]\d|2[0-3]):([0-5]\d)", time_str):
+        try:
+            time_str = RestartSchedule.compile(time_str).text  # forma normalizada (ex.: '8:30' -> '08:30')
+        except ValueError:
             self.app.show_messagebox_from_thread("error",
                                                  self.app.translator.get("dialog_invalid_time_format_title"),
                                                  self.app.translator.get("dialog_invalid_time_format_msg",
@@ -1017,6 +5424,7 @@ class RestarterTab(ttk.Frame):
         self.scheduled_restarts_list = sorted(list(set(self.scheduled_restarts_list)))
         self._update_scheduled_restarts_ui_from_list()
         self.custom_schedule_entry_var.set("")
+        self._reagendar()
         self._value_changed()
 
     def _remove_selected_custom_schedule(self):
@@ -1030,58 +5438,44 @@ class RestarterTab(ttk.Frame):
         if selected_time_str in self.scheduled_restarts_list:
             self.scheduled_restarts_list.remove(selected_time_str)
             self._update_scheduled_restarts_ui_from_list()
+            self._reagendar()
             self._value_changed()
 
-    def start_scheduler_thread(self):
-        if self.scheduler_thread and self.scheduler_thread.is_alive():
-            return
-        self._scheduler_stop_event.clear()
-        self.scheduler_thread = threading.Thread(target=self._scheduler_worker, daemon=True,
-                                                 name=f"Scheduler-{self.nome}")
-        self.scheduler_thread.start()
-        self.logger.info(f"Tab '{self.nome}': Scheduler de reinícios agendados iniciado.")
-
-    def stop_scheduler_thread(self, from_tab_closure=False):
-        self._scheduler_stop_event.set()
-        if self.scheduler_thread and self.scheduler_thread.is_alive() and self.scheduler_thread != threading.current_thread():
-            self.scheduler_thread.join(timeout=2.0)
-        self.scheduler_thread = None
-
-    def _scheduler_worker(self):
-        while not self._scheduler_stop_event.is_set():
-            try:
-                current_time_str_hh_mm = datetime.now().strftime("%H:%M")
-                if self.last_scheduled_restart_processed_time_str != current_time_str_hh_mm:
-                    self.last_scheduled_restart_processed_time_str = None
+    def registrar_agendamento_perdido(self, time_str, late_seconds):
+        """ Chamado pelo RestartScheduler quando um horário perdido é pulado (política ou fora da tolerância). """
+        self.logger.warning(f"Tab '{self.nome}': Reinício agendado '{time_str}' perdido há {late_seconds:.0f}s; pulado.")
+        self.append_text_to_log_area_threadsafe(
+            self.app.translator.get("log_scheduled_restart_skipped", time=time_str,
+                                    minutes=f"{late_seconds / 60:.0f}") + "\n")
+        if self.winfo_exists(): self.app.root.after(0, self._update_schedule_preview)
 
-                service_to_restart = self.nome_servico.get()
-                if not service_to_restart or not self.scheduled_restarts_list:
-                    if self._scheduler_stop_event.wait(20): break
-                    continue
+    def _on_schedule_missed_policy_selected(self, event=None):
+        self.schedule_missed_policy_var.set(
+            RestartScheduler.POLICY_SKIP if self.schedule_missed_policy_combo.current() == 1
+            else RestartScheduler.POLICY_RUN_LATE)
 
-                if (current_time_str_hh_mm in self.scheduled_restarts_list and
-                        self.last_scheduled_restart_processed_time_str != current_time_str_hh_mm):
-                    self.logger.info(
-                        f"Tab '{self.nome}': Disparando reinício agendado para '{service_to_restart}' às {current_time_str_hh_mm}.")
-                    self.append_text_to_log_area_threadsafe(
-                        self.app.translator.get("log_scheduled_restart_triggered", time=current_time_str_hh_mm) + "\n")
-                    threading.Thread(
-                        target=self._executar_logica_reinicio_servico_efetivamente,
-                        args=(True,), daemon=True, name=f"ScheduledRestartExec-{self.nome}"
-                    ).start()
-                    self.last_scheduled_restart_processed_time_str = current_time_str_hh_mm
-            except Exception as e_scheduler:
-                self.logger.error(f"Tab '{self.nome}': Erro no _scheduler_worker: {e_scheduler}", exc_info=True)
-
-            if self._scheduler_stop_event.wait(15):
-                break
-        self.logger.info(f"Tab '{self.nome}': Thread _scheduler_worker encerrada.")
+    def disparar_reinicio_agendado(self, time_str, late_seconds=0.0, restart_at=None):
+        """
+        Chamado pelo RestartScheduler no horário 'time_str' (ou depois, se perdido e a política permitir).
+        Com avisos RCon, é chamado antes do horário e 'restart_at' é o instante do reinício.
+        """
+        service_to_restart = self.nome_servico.get()
+        if not service_to_restart:
+            return
+        self.logger.info(f"Tab '{self.nome}': Disparando reinício agendado para '{service_to_restart}' às {time_str}"
+                         f" (atraso {late_seconds:.0f}s).")
+        if late_seconds > 0:
+            message = self.app.translator.get("log_scheduled_restart_late", time=time_str,
+                                              minutes=f"{late_seconds / 60:.0f}")
+        else:
+            message = self.app.translator.get("log_scheduled_restart_triggered", time=time_str)
+        self.append_text_to_log_area_threadsafe(message + "\n")
+        self.solicitar_reinicio(RestartOrchestrator.PRIORITY_SCHEDULED, warn=True, restart_at=restart_at)
+        if self.winfo_exists(): self.app.root.after(0, self._update_schedule_preview)
 
     def _update_manual_control_button_states(self):
         has_service = bool(self.nome_servico.get())
-        os_system = platform.system()
-        can_manage = (os_system == "Windows" and PYWIN32_AVAILABLE) or \
-                     (os_system == "Linux" and SYSTEMCTL_AVAILABLE)
+        can_manage = self.app.service_manager.can_manage(self.nome_servico.get())
         new_state = NORMAL if has_service and can_manage else DISABLED
         if self.iniciar_servico_btn.winfo_exists(): self.iniciar_servico_btn.config(state=new_state)
         if self.parar_servico_btn.winfo_exists(): self.parar_servico_btn.config(state=new_state)
@@ -1108,14 +5502,15 @@ class RestarterTab(ttk.Frame):
         else:
             self.log_folder_path_label_var.set(f"{log_folder_prefix}: {_('status_none')}")
             self.log_folder_path_label.config(foreground=default_fg)
+        if ServiceManager.is_process_service(self.nome_servico.get()):
+            self.start_log_monitoring()
 
         os_system = platform.system()
-        can_manage_services = (os_system == "Windows" and PYWIN32_AVAILABLE) or (
-                os_system == "Linux" and SYSTEMCTL_AVAILABLE)
+        can_manage_services = self.app.service_manager.can_manage_services
         if self.servico_btn.winfo_exists(): self.servico_btn.config(state=NORMAL if can_manage_services else DISABLED)
 
         nome_servico_val = self.nome_servico.get()
-        can_refresh_status = bool(nome_servico_val) and can_manage_services
+        can_refresh_status = bool(nome_servico_val) and self.app.service_manager.can_manage(nome_servico_val)
         if self.refresh_servico_status_btn.winfo_exists(): self.refresh_servico_status_btn.config(
             state=NORMAL if can_refresh_status else DISABLED)
 
@@ -1140,7 +5535,6 @@ class RestarterTab(ttk.Frame):
 
         self._update_manual_control_button_states()
         self._update_scheduled_restarts_ui_from_list()
-        self.start_scheduler_thread()
 
     def selecionar_pasta(self):
         pasta_selecionada = filedialog.askdirectory(
@@ -1174,16 +5568,8 @@ class RestarterTab(ttk.Frame):
         if not nome_servico_val:
             self.initialize_from_config_vars()
             return
-        os_system = platform.system()
-        worker = None
-        if os_system == "Windows":
-            if not PYWIN32_AVAILABLE: self.initialize_from_config_vars(); return
-            worker = self._get_and_display_service_status_win_thread_worker
-        elif os_system == "Linux":
-            if not SYSTEMCTL_AVAILABLE: self.initialize_from_config_vars(); return
-            worker = self._get_and_display_service_status_linux_thread_worker
-        else:
-            self.initialize_from_config_vars();
+        if not self.app.service_manager.can_manage(self.nome_servico.get()):
+            self.display_service_status("UNSUPPORTED")
             return
 
         _ = self.app.translator.get
@@ -1191,103 +5577,17 @@ class RestarterTab(ttk.Frame):
         self.servico_label_var.set(f"{current_text_base} ({_('status_checking')})")
         self.servico_label_widget.config(foreground="blue")
         threading.Thread(
-            target=worker, args=(nome_servico_val, current_text_base), daemon=True,
-            name=f"ServiceStatusCheck-{self.nome}"
+            target=self._get_and_display_service_status_thread_worker, args=(nome_servico_val, current_text_base),
+            daemon=True, name=f"ServiceStatusCheck-{self.nome}"
         ).start()
 
-    def _get_and_display_service_status_win_thread_worker(self, service_name, base_text):
-        status = self._verificar_status_servico_win(service_name)
-        _ = self.app.translator.get
-        status_map = {
-            "RUNNING": (_('status_running_win'), "green"), "STOPPED": (_('status_stopped_win'), "red"),
-            "START_PENDING": (_('status_starting_win'), "blue"), "STOP_PENDING": (_('status_stopping_win'), "blue"),
-            "NOT_FOUND": (_('status_not_found_long'), "orange"), "ERROR": (_('status_error'), "red"),
-            "UNKNOWN": (_('status_unknown'), "gray")
-        }
-        display_text, color = status_map.get(status, (f"({_('status_unknown')})", "gray"))
-        if self.app.root.winfo_exists() and self.winfo_exists():
-            self.app.root.after(0, lambda: (
-                self.servico_label_var.set(f"{base_text} {display_text}"),
-                self.servico_label_widget.config(foreground=color)
-            ))
-
-    def _get_and_display_service_status_linux_thread_worker(self, service_name, base_text):
-        status = self._verificar_status_servico_linux(service_name)
-        _ = self.app.translator.get
-        status_map = {
-            "RUNNING": (f"({_('status_active_linux')})", "green"),
-            "STOPPED": (f"({_('status_inactive_linux')})", "red"),
-            "FAILED": (f"({_('status_failed_linux')})", "red"),
-            "START_PENDING": (f"({_('status_activating_linux')})", "blue"),
-            "STOP_PENDING": (f"({_('status_deactivating_linux')})", "blue"),
-            "NOT_FOUND": (_('status_not_found_long'), "orange"),
-            "ERROR": (_('status_error'), "red"), "SYSTEMCTL_NOT_FOUND": (f"({_('na_systemctl')})", "gray"),
-            "UNKNOWN": (f"({_('status_unknown')})", "gray")
-        }
-        display_text, color = status_map.get(status, (f"({_('status_unknown')})", "gray"))
-        if self.app.root.winfo_exists() and self.winfo_exists():
-            self.app.root.after(0, lambda: (
-                self.servico_label_var.set(f"{base_text} {display_text}"),
-                self.servico_label_widget.config(foreground=color)
-            ))
-
-    def _verificar_status_servico_win(self, nome_servico_local):
-        if not PYWIN32_AVAILABLE: return "ERROR"
-        if not nome_servico_local: return "NOT_FOUND"
-        try:
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            startupinfo.wShowWindow = subprocess.SW_HIDE
-            encodings_to_try = ['latin-1', 'utf-8', 'cp850', 'cp1252']
-            output_text = None
-            for enc in encodings_to_try:
-                try:
-                    result = subprocess.run(['sc', 'query', nome_servico_local], capture_output=True, text=False,
-                                            check=False, startupinfo=startupinfo)
-                    output_text = result.stdout.decode(enc, errors='replace') + result.stderr.decode(enc,
-                                                                                                     errors='replace')
-                    break
-                except UnicodeDecodeError:
-                    continue
-            if output_text is None: return "ERROR"
-            output_lower = output_text.lower()
-            if any(err in output_lower for err in
-                   ["failed 1060", "falha 1060", "does not exist as an installed service"]): return "NOT_FOUND"
-            if "state" not in output_lower and "estado" not in output_lower: return "ERROR"
-            if "running" in output_lower or "em execução" in output_lower: return "RUNNING"
-            if "stopped" in output_lower or "parado" in output_lower: return "STOPPED"
-            if "start_pending" in output_lower: return "START_PENDING"
-            if "stop_pending" in output_lower: return "STOP_PENDING"
-            return "UNKNOWN"
-        except Exception:
-            return "ERROR"
-
-    def _verificar_status_servico_linux(self, nome_servico_local):
-        if not SYSTEMCTL_AVAILABLE: return "SYSTEMCTL_NOT_FOUND"
-        if not nome_servico_local: return "NOT_FOUND"
-        nome_tentativa = f"{nome_servico_local}.service" if not nome_servico_local.endswith(
-            ".service") else nome_servico_local
-        try:
-            cmd = ['systemctl', 'is-active', nome_tentativa]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
-            status = result.stdout.strip()
-            if result.returncode == 0:
-                if status == "active": return "RUNNING"
-                if status == "activating": return "START_PENDING"
-                if status == "deactivating": return "STOP_PENDING"
-                if status == "failed": return "FAILED"
-            elif result.returncode == 3:
-                return "STOPPED"
-            elif result.returncode == 4:
-                return "NOT_FOUND"
-            return "UNKNOWN"
-        except Exception:
-            return "ERROR"
-
     def start_log_monitoring(self):
         """Inicia a thread única de monitoramento e processamento de logs."""
         if self.log_monitor_thread and self.log_monitor_thread.is_alive():
             return
+        if ServiceManager.is_process_service(self.nome_servico.get()):
+            self._iniciar_escuta_processo()  # a saída chega pelo pipe do processo filho, sem leitura de arquivo
+            return
 
         if not self.pasta_raiz.get() or not os.path.isdir(self.pasta_raiz.get()):
             self.append_text_to_log_area(
@@ -1305,6 +5605,11 @@ class RestarterTab(ttk.Frame):
     def stop_log_monitoring(self, from_tab_closure=False):
         """Para a thread de monitoramento de logs de forma segura."""
         self._stop_event.set()
+        if from_tab_closure: self._restart_cancel_event.set()
+        if self._process_listener_service:
+            self.app.service_manager.process_backend.remove_line_listener(self._process_listener_service,
+                                                                         self._on_process_output_line)
+            self._process_listener_service = None
         if self.log_monitor_thread and self.log_monitor_thread.is_alive():
             if self.log_monitor_thread != threading.current_thread():
                 self.log_monitor_thread.join(timeout=1.5)
@@ -1336,7 +5641,10 @@ class RestarterTab(ttk.Frame):
                     novo_arquivo_log = os.path.join(subpasta_recente, log_filename)
                     if os.path.exists(novo_arquivo_log) and novo_arquivo_log != caminho_log_atual:
                         self.logger.info(f"Restarter [{self.nome}]: New log file detected: {novo_arquivo_log}")
-                        if file_handle: file_handle.close()
+                        if file_handle:
+                            file_handle.close()
+                            # Novo arquivo de log = servidor reiniciado; encerra as sessões abertas desta fonte.
+                            self.app.reset_player_sessions_for_source(pasta_raiz)
 
                         caminho_log_atual = novo_arquivo_log
                         self.append_text_to_log_area_threadsafe(
@@ -1370,9 +5678,15 @@ class RestarterTab(ttk.Frame):
             file_handle.close()
         self.logger.info(f"Restarter [{self.nome}]: Log processing worker stopped.")
 
+    def _on_process_output_line(self, linha):
+        """ Linha lida do pipe do processo filho (thread leitora do ChildProcessBackend). """
+        if self._paused: return  # o pipe não pode ser retido: em pausa as linhas são descartadas
+        self._process_log_line(linha, self.filtro_var.get().lower())
+
     def _process_log_line(self, linha, current_filter):
+        self.log_lines_seen += 1
         # Chama o processador de informações do jogador na app principal
-        self.app.process_player_info_from_log(linha)
+        self.app.process_player_info_from_log(linha, source=self.pasta_raiz.get())
 
         if not current_filter or current_filter in linha.lower():
             self.append_text_to_log_area(linha)
@@ -1381,7 +5695,15 @@ class RestarterTab(ttk.Frame):
         if trigger_message_to_find and trigger_message_to_find in linha.strip():
             self.logger.info(f"Restarter [{self.nome}]: Trigger detected. Line: '{linha.strip()}'.")
             if self.auto_restart_on_trigger_var.get():
-                threading.Thread(target=self._delayed_restart_worker, daemon=True).start()
+                # Reserva o serviço já na detecção: gatilhos repetidos durante o atraso não geram novas threads
+                orchestrator = self.app.restart_orchestrator
+                restart_key = orchestrator.service_key(self.nome, self.nome_servico.get())
+                reason = orchestrator.claim(restart_key)
+                if reason:
+                    self._registrar_reinicio_agrupado(restart_key, reason)
+                    return
+                threading.Thread(target=self._delayed_restart_worker, args=(restart_key,), daemon=True,
+                                 name=f"DelayedRestart-{self.nome}").start()
 
     def _obter_subpasta_log_mais_recente(self, pasta_raiz_logs):
         if not pasta_raiz_logs or not os.path.isdir(pasta_raiz_logs): return None
@@ -1394,15 +5716,41 @@ class RestarterTab(ttk.Frame):
         except Exception:
             return None
 
-    def _delayed_restart_worker(self):
-        delay_s = self.restart_delay_after_trigger_var.get()
-        self.append_text_to_log_area_threadsafe(self.app.translator.get("log_trigger_detected", delay=delay_s) + "\n")
-        time.sleep(delay_s)
-        self._executar_logica_reinicio_servico_efetivamente(is_scheduled_restart=False)
+    def _delayed_restart_worker(self, restart_key):
+        """ Aguarda o atraso do gatilho e envia o reinício. Se algo falhar antes do envio, a reserva é desfeita. """
+        try:
+            delay_s = self.restart_delay_after_trigger_var.get()
+            self.append_text_to_log_area_threadsafe(
+                self.app.translator.get("log_trigger_detected", delay=delay_s) + "\n")
+            if self._estagios_aviso():  # o atraso do gatilho passa a contar dentro da antecedência dos avisos
+                self.solicitar_reinicio(RestartOrchestrator.PRIORITY_TRIGGER, restart_key=restart_key, warn=True,
+                                        restart_at=time.time() + delay_s)
+                return
+            time.sleep(delay_s)
+            self.solicitar_reinicio(RestartOrchestrator.PRIORITY_TRIGGER, restart_key=restart_key)
+        except Exception as e:
+            self._desfazer_reserva_reinicio(restart_key, e)
+
+    def _executar_reinicio(self, priority, kind=None):
+        """ Tarefa enfileirada por ServerTabMixin._enfileirar_reinicio. """
+        self._executar_logica_reinicio_servico_efetivamente(restart_priority=priority, kind=kind)
+
+    def restart_warning_lead(self):
+        """ Antecedência (s) dos avisos RCon antes do reinício. Lê variáveis Tk: só na thread da GUI. """
+        stages = self._estagios_aviso()
+        return stages[0] if stages else 0
 
-    def _executar_logica_reinicio_servico_efetivamente(self, is_scheduled_restart=False):
+    def _reagendar(self):
+        """ Reenvia os horários da aba ao RestartScheduler, com a antecedência dos avisos já calculada aqui. """
+        self.app.restart_scheduler.reschedule(self, warning_lead=self.restart_warning_lead())
+
+    def _executar_logica_reinicio_servico_efetivamente(self, is_scheduled_restart=False, restart_priority=None,
+                                                       kind=None):
         _ = self.app.translator.get
-        tipo_reinicio_msg_key = "restart_type_scheduled" if is_scheduled_restart else "restart_type_trigger"
+        if restart_priority is None:
+            restart_priority = (RestartOrchestrator.PRIORITY_SCHEDULED if is_scheduled_restart
+                                else RestartOrchestrator.PRIORITY_TRIGGER)
+        tipo_reinicio_msg_key = RestartOrchestrator.KIND_KEYS[restart_priority]
         tipo_reinicio_msg = _(tipo_reinicio_msg_key)
         nome_servico = self.nome_servico.get()
         if not nome_servico:
@@ -1412,8 +5760,18 @@ class RestarterTab(ttk.Frame):
             return
         self.append_text_to_log_area_threadsafe(
             _("log_restart_process_started", type=tipo_reinicio_msg.upper(), service=nome_servico) + "\n")
-        success = self._operar_servico_com_delays(nome_servico)
+        self._restart_timeline = RestartTimeline(self.nome, nome_servico,
+                                                 kind or RestartHistoryDB.KIND_BY_PRIORITY[restart_priority])
+        try:
+            success = self._operar_servico_com_delays(nome_servico)
+        except Exception:
+            self._registrar_historico_reinicio(False)
+            raise
+        self._registrar_historico_reinicio(success)
         if self.app.root.winfo_exists():
+            self.app.notify_event("restart" if success else "restart_failed", self.nome,
+                                  _("dialog_server_restarted_msg" if success else "dialog_restart_failed_msg",
+                                    service=nome_servico))
             if success:
                 self.app.show_messagebox_from_thread("success", _("dialog_server_restarted_title", server=self.nome),
                                                      _("dialog_server_restarted_msg", service=nome_servico))
@@ -1464,80 +5822,29 @@ class RestarterTab(ttk.Frame):
                                                  _("error_service_start_failed_msg", service=service_name))
         self.update_service_status_display()
 
-    def _stop_service(self, service_name):
-        _ = self.app.translator.get
-        os_system = platform.system()
-        try:
-            if os_system == "Windows":
-                self.append_text_to_log_area_threadsafe(_("log_executing_sc_stop", service=service_name) + "\n")
-                startupinfo = subprocess.STARTUPINFO();
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                subprocess.run(["sc", "stop", service_name], check=True, startupinfo=startupinfo, timeout=30)
-            elif os_system == "Linux":
-                nome_servico_systemd = f"{service_name}.service" if not service_name.endswith(
-                    ".service") else service_name
-                cmd_prefix = ['sudo'] if os.geteuid() != 0 else []
-                self.append_text_to_log_area_threadsafe(
-                    _("log_executing_sysd_stop", service=nome_servico_systemd) + "\n")
-                subprocess.run(cmd_prefix + ['systemctl', 'stop', nome_servico_systemd], check=True,
-                               capture_output=True, timeout=30)
-            else:
-                self.append_text_to_log_area_threadsafe(_("log_unsupported_os_control", os=os_system) + "\n")
-                return False
-            self.append_text_to_log_area_threadsafe(_("log_stop_cmd_sent", service=service_name) + "\n")
-            return True
-        except Exception as e:
-            self.append_text_to_log_area_threadsafe(_("log_stop_error", service=service_name, error=e) + "\n")
-            self.logger.error(f"Erro ao parar serviço '{service_name}': {e}", exc_info=True)
-            return False
-
-    def _start_service(self, service_name):
-        _ = self.app.translator.get
-        os_system = platform.system()
-        try:
-            if os_system == "Windows":
-                self.append_text_to_log_area_threadsafe(_("log_executing_sc_start", service=service_name) + "\n")
-                startupinfo = subprocess.STARTUPINFO();
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                subprocess.run(["sc", "start", service_name], check=True, startupinfo=startupinfo, timeout=30)
-            elif os_system == "Linux":
-                nome_servico_systemd = f"{service_name}.service" if not service_name.endswith(
-                    ".service") else service_name
-                cmd_prefix = ['sudo'] if os.geteuid() != 0 else []
-                self.append_text_to_log_area_threadsafe(
-                    _("log_executing_sysd_start", service=nome_servico_systemd) + "\n")
-                subprocess.run(cmd_prefix + ['systemctl', 'start', nome_servico_systemd], check=True,
-                               capture_output=True, timeout=30)
-            else:
-                self.append_text_to_log_area_threadsafe(_("log_unsupported_os_control", os=os_system) + "\n")
-                return False
-            self.append_text_to_log_area_threadsafe(_("log_start_cmd_sent", service=service_name) + "\n")
-            return True
-        except Exception as e:
-            self.append_text_to_log_area_threadsafe(_("log_start_error", service=service_name, error=e) + "\n")
-            self.logger.error(f"Erro ao iniciar serviço '{service_name}': {e}", exc_info=True)
-            return False
-
     def _operar_servico_com_delays(self, nome_servico):
         _ = self.app.translator.get
-        stop_delay, start_delay = self.stop_delay_var.get(), self.start_delay_var.get()
-        status_win = self._verificar_status_servico_win(nome_servico)
-        status_linux = self._verificar_status_servico_linux(nome_servico)
-        if status_win == "RUNNING" or status_linux == "RUNNING":
+        start_delay = self.start_delay_var.get()
+        status, main_pid = self.app.service_manager.get_status_and_pid(nome_servico)
+        if status == "RUNNING":
+            self._marcar_fase_reinicio("stop_issued")
             if not self._stop_service(nome_servico):
                 self.append_text_to_log_area_threadsafe(_("log_restart_abort", service=nome_servico) + "\n")
                 return False
-            self.append_text_to_log_area_threadsafe(_("log_wait_after_stop", delay=stop_delay) + "\n")
-            time.sleep(stop_delay)
+            stopped = self._aguardar_parada_servico(nome_servico, main_pid)
+            if stopped is None:
+                self.append_text_to_log_area_threadsafe(_("log_restart_cancelled") + "\n")
+                return False
+            if stopped: self._marcar_fase_reinicio("stopped")
+        probe = self._criar_sonda_prontidao()
+        self._marcar_fase_reinicio("start_issued")
         if not self._start_service(nome_servico):
             self.append_text_to_log_area_threadsafe(
                 _("log_start_error", service=nome_servico, error="").strip() + ".\n")
             return False
-        self.append_text_to_log_area_threadsafe(_("log_wait_after_start", delay=start_delay) + "\n")
-        time.sleep(start_delay)
-        final_status_win = self._verificar_status_servico_win(nome_servico)
-        final_status_linux = self._verificar_status_servico_linux(nome_servico)
-        return final_status_win == "RUNNING" or final_status_linux == "RUNNING"
+        start_delay = self._aguardar_servico_ativo(nome_servico, start_delay)
+        if self._aguardar_prontidao_servidor(probe, start_delay): self._marcar_fase_reinicio("ready")
+        return self._verificar_status_servico(nome_servico, max_age=0) == "RUNNING"
 
     def append_text_to_log_area(self, texto):
         if self.winfo_exists():
@@ -1622,7 +5929,7 @@ class RestarterTab(ttk.Frame):
 # ==============================================================================
 # CLASSE VotemapTab (Originalmente ServidorTab de PQDT_Raphael_Votemappatch.py)
 # ==============================================================================
-class VotemapTab(ttk.Frame):
+class VotemapTab(ServerTabMixin, ttk.Frame):
     def __init__(self, master_notebook, app_instance, nome_servidor, config_dict=None):
         super().__init__(master_notebook)
         self.app = app_instance
@@ -1648,6 +5955,26 @@ class VotemapTab(ttk.Frame):
             value=self.config_inicial.get("default_mission", "{B88CC33A14B71FDC}Missions/V30_MapVoting_Mission.conf"))
         self.stop_delay_var = tk.IntVar(value=self.config_inicial.get("stop_delay", 10))
         self.start_delay_var = tk.IntVar(value=self.config_inicial.get("start_delay", 30))
+        self.ready_pattern_var = tk.StringVar(value=self.config_inicial.get("ready_pattern", "Game successfully created"))
+        self.process_command_var = tk.StringVar(value=self.config_inicial.get("process_command", ""))
+        self.rss_limit_gb_var = tk.DoubleVar(value=self.config_inicial.get("rss_limit_gb", 0.0))
+        self.rss_limit_minutes_var = tk.IntVar(value=self.config_inicial.get("rss_limit_minutes", 10))
+        self.resource_label_var = tk.StringVar()
+        self.a2s_address_var = tk.StringVar(value=self.config_inicial.get("a2s_address", ""))
+        self.a2s_max_missed_var = tk.IntVar(value=self.config_inicial.get("a2s_max_missed", 3))
+        self.probe_label_var = tk.StringVar()
+        self.log_silence_minutes_var = tk.IntVar(value=self.config_inicial.get("log_silence_minutes", 0))
+        self.log_silence_action_var = tk.StringVar(
+            value=self.config_inicial.get("log_silence_action", LogSilenceWatchdog.ACTION_NOTIFY))
+        self.log_lines_seen = 0  # lido pelo LogSilenceWatchdog
+        self.rcon_address_var = tk.StringVar(value=self.config_inicial.get("rcon_address", ""))
+        self.rcon_password_var = tk.StringVar(value=self.config_inicial.get("rcon_password", ""))
+        self.restart_warning_stages_var = tk.StringVar(
+            value=self.config_inicial.get("restart_warning_stages", "5m,1m,10s"))
+        self.restart_warning_message_var = tk.StringVar(
+            value=self.config_inicial.get("restart_warning_message", RCON_DEFAULT_WARNING))
+        self.restart_stats_label_var = tk.StringVar()
+        self._restart_timeline = None  # RestartTimeline do reinício em andamento (um por vez, via fila)
         self.auto_scroll_log_var = tk.BooleanVar(value=self.config_inicial.get("auto_scroll_log", True))
         self.log_search_var = tk.StringVar()
         self.last_search_pos = "1.0"
@@ -1655,6 +5982,9 @@ class VotemapTab(ttk.Frame):
 
         # --- Threads e Eventos ---
         self._stop_event = threading.Event()
+        self._restart_cancel_event = threading.Event()  # interrompe esperas de parada/início ao fechar a aba
+        self._process_listener_service = None  # serviço 'process:' cuja saída esta aba está escutando
+        self._output_patterns = None  # (voto, vencedor) compilados para a saída do processo filho
         self._paused = False
         self.log_monitor_thread = None
 
@@ -1666,10 +5996,17 @@ class VotemapTab(ttk.Frame):
             self.pasta_raiz, self.arquivo_json, self.arquivo_json_votemap, self.nome_servico,
             self.filtro_var, self.log_filename_var, self.vote_pattern_var, self.winner_pattern_var,
             self.default_mission_var, self.auto_restart_var, self.auto_scroll_log_var,
-            self.stop_delay_var, self.start_delay_var
+            self.stop_delay_var, self.start_delay_var, self.ready_pattern_var,
+            self.process_command_var, self.rss_limit_gb_var, self.rss_limit_minutes_var,
+            self.a2s_address_var, self.a2s_max_missed_var, self.log_silence_minutes_var,
+            self.log_silence_action_var, self.rcon_address_var, self.rcon_password_var,
+            self.restart_warning_stages_var, self.restart_warning_message_var
         ]
         for var in vars_to_trace:
             var.trace_add("write", lambda *args: self._value_changed())
+        for var in (self.vote_pattern_var, self.winner_pattern_var):
+            var.trace_add("write", lambda *args: setattr(self, "_output_patterns", None))
+        self._atualizar_estatisticas_reinicio()
 
     def _value_changed(self):
         self.app.mark_config_changed()
@@ -1689,6 +6026,18 @@ class VotemapTab(ttk.Frame):
             "default_mission": self.default_mission_var.get(),
             "stop_delay": self.stop_delay_var.get(),
             "start_delay": self.start_delay_var.get(),
+            "ready_pattern": self.ready_pattern_var.get(),
+            "process_command": self.process_command_var.get(),
+            "rss_limit_gb": self.rss_limit_gb_var.get(),
+            "rss_limit_minutes": self.rss_limit_minutes_var.get(),
+            "a2s_address": self.a2s_address_var.get(),
+            "a2s_max_missed": self.a2s_max_missed_var.get(),
+            "log_silence_minutes": self.log_silence_minutes_var.get(),
+            "log_silence_action": self.log_silence_action_var.get(),
+            "rcon_address": self.rcon_address_var.get(),
+            "rcon_password": self.rcon_password_var.get(),
+            "restart_warning_stages": self.restart_warning_stages_var.get(),
+            "restart_warning_message": self.restart_warning_message_var.get(),
             "auto_scroll_log": self.auto_scroll_log_var.get(),
         }
 
@@ -1734,6 +6083,13 @@ class VotemapTab(ttk.Frame):
         self.servico_label_widget = ttk.Label(path_labels_frame_line1, textvariable=self.servico_label_var, anchor='w',
                                               width=30)
         self.servico_label_widget.pack(side='left', padx=(5, 0))
+        self.resource_label = ttk.Label(self.selection_labelframe, textvariable=self.resource_label_var, anchor='w')
+        self.resource_label.pack(fill='x', padx=5)
+        self.probe_label = ttk.Label(self.selection_labelframe, textvariable=self.probe_label_var, anchor='w')
+        self.probe_label.pack(fill='x', padx=5)
+        self.restart_stats_label = ttk.Label(self.selection_labelframe, textvariable=self.restart_stats_label_var,
+                                             anchor='w')
+        self.restart_stats_label.pack(fill='x', padx=5)
 
         path_labels_frame_line2 = ttk.Frame(self.selection_labelframe)
         path_labels_frame_line2.pack(fill='x', pady=(0, 0))
@@ -1849,6 +6205,27 @@ class VotemapTab(ttk.Frame):
         self.start_delay_lbl.pack(side='left', padx=15)
         self.start_delay_spinbox = ttk.Spinbox(delay_frame, from_=5, to=180, textvariable=self.start_delay_var, width=5)
         self.start_delay_spinbox.pack(side='left', padx=5)
+        self.ready_pattern_lbl = ttk.Label(options_inner_frame)
+        self.ready_pattern_lbl.grid(row=10, column=0, sticky='w', padx=5, pady=(10, 0))
+        self.ready_pattern_entry = ttk.Entry(options_inner_frame, textvariable=self.ready_pattern_var, width=60)
+        self.ready_pattern_entry.grid(row=11, column=0, sticky='ew', padx=5, pady=2, columnspan=2)
+        self.ready_pattern_entry_tooltip = ToolTip(self.ready_pattern_entry)
+
+        self.process_command_lbl = ttk.Label(options_inner_frame)
+        self.process_command_lbl.grid(row=12, column=0, sticky='w', padx=5, pady=(10, 0))
+        self.process_command_entry = ttk.Entry(options_inner_frame, textvariable=self.process_command_var, width=60)
+        self.process_command_entry.grid(row=13, column=0, sticky='ew', padx=5, pady=2, columnspan=2)
+        self.process_command_entry.bind("<FocusOut>", lambda e: self._aplicar_comando_processo())
+        self.process_command_entry.bind("<Return>", lambda e: self._aplicar_comando_processo())
+        self.process_command_entry_tooltip = ToolTip(self.process_command_entry)
+
+        self._create_rss_limit_ui(options_inner_frame, row=14)
+
+        self._create_a2s_probe_ui(options_inner_frame, row=15)
+
+        self._create_log_silence_ui(options_inner_frame, row=16)
+
+        self._create_rcon_warning_ui(options_inner_frame, row=17)
         options_inner_frame.columnconfigure(0, weight=1)
 
     def update_ui_text(self):
@@ -1908,13 +6285,20 @@ class VotemapTab(ttk.Frame):
         self.log_filename_entry_tooltip.text = _('tooltip_log_filename')
         self.stop_delay_lbl.config(text=_('lbl_stop_delay_short'))
         self.start_delay_lbl.config(text=_('lbl_start_delay_short'))
+        self.ready_pattern_lbl.config(text=_('lbl_ready_pattern'))
+        self.ready_pattern_entry_tooltip.text = _('tooltip_ready_pattern')
+        self.process_command_lbl.config(text=_('lbl_process_command'))
+        self.process_command_entry_tooltip.text = _('tooltip_process_command')
+        self._update_rss_limit_ui_text()
+        self._update_a2s_probe_ui_text()
+        self._update_log_silence_ui_text()
+        self._update_rcon_warning_ui_text()
 
         self.initialize_from_config_vars()
 
     def _update_manual_control_button_states(self):
         has_service = bool(self.nome_servico.get())
-        os_system = platform.system()
-        can_manage = (os_system == "Windows" and PYWIN32_AVAILABLE) or (os_system == "Linux" and SYSTEMCTL_AVAILABLE)
+        can_manage = self.app.service_manager.can_manage(self.nome_servico.get())
         new_state = NORMAL if has_service and can_manage else DISABLED
         if hasattr(self,
                    'iniciar_servico_btn') and self.iniciar_servico_btn.winfo_exists(): self.iniciar_servico_btn.config(
@@ -1939,14 +6323,16 @@ class VotemapTab(ttk.Frame):
         else:
             self.log_folder_path_label_var.set(f"{log_folder_prefix}: {_('status_none')}")
             self.log_folder_path_label.config(foreground=default_fg)
+        if ServiceManager.is_process_service(self.nome_servico.get()):
+            self.start_log_monitoring()
 
         self.forcar_refresh_json_display()
         os_system = platform.system()
-        can_manage_services = (os_system == "Windows" and PYWIN32_AVAILABLE) or (
-                os_system == "Linux" and SYSTEMCTL_AVAILABLE)
+        can_manage_services = self.app.service_manager.can_manage_services
         self.servico_btn.config(state=NORMAL if can_manage_services else DISABLED)
         self.refresh_servico_status_btn.config(
-            state=NORMAL if can_manage_services and self.nome_servico.get() else DISABLED)
+            state=NORMAL if self.nome_servico.get() and self.app.service_manager.can_manage(
+                self.nome_servico.get()) else DISABLED)
 
         service_prefix = _('lbl_service_prefix')
         if self.nome_servico.get():
@@ -2055,81 +6441,25 @@ class VotemapTab(ttk.Frame):
 
     def update_service_status_display(self):
         service_name = self.nome_servico.get()
-        if not service_name: self.initialize_from_config_vars(); return
+        if not service_name:
+            self.initialize_from_config_vars()
+            return
+        if not self.app.service_manager.can_manage(self.nome_servico.get()):
+            self.display_service_status("UNSUPPORTED")
+            return
         _ = self.app.translator.get
         base_text = f"{_('lbl_service_prefix')}: {service_name}"
         self.servico_label_var.set(f"{base_text} ({_('status_checking')})")
         self.servico_label_widget.config(foreground="blue")
-        os_system = platform.system()
-        worker_func = None
-        if os_system == "Windows" and PYWIN32_AVAILABLE:
-            worker_func = self._get_and_display_service_status_win_thread_worker
-        elif os_system == "Linux" and SYSTEMCTL_AVAILABLE:
-            worker_func = self._get_and_display_service_status_linux_thread_worker
-        if worker_func:
-            threading.Thread(target=worker_func, args=(service_name, base_text), daemon=True).start()
-        else:
-            self.initialize_from_config_vars()
-
-    def _get_and_display_service_status_win_thread_worker(self, service_name, base_text):
-        status = self._verificar_status_servico_win(service_name)
-        _ = self.app.translator.get
-        status_map = {
-            "RUNNING": (_('status_running_win'), "green"), "STOPPED": (_('status_stopped_win'), "red"),
-            "NOT_FOUND": (_('status_not_found_long'), "orange"), "ERROR": (_('status_error'), "red")
-        }
-        display_text, color = status_map.get(status, (_('status_unknown'), "gray"))
-        if self.app.root.winfo_exists() and self.winfo_exists():
-            self.app.root.after(0, lambda: (self.servico_label_var.set(f"{base_text} {display_text}"),
-                                            self.servico_label_widget.config(foreground=color)))
-
-    def _get_and_display_service_status_linux_thread_worker(self, service_name, base_text):
-        status = self._verificar_status_servico_linux(service_name)
-        _ = self.app.translator.get
-        status_map = {
-            "RUNNING": (f"({_('status_active_linux')})", "green"),
-            "STOPPED": (f"({_('status_inactive_linux')})", "red"),
-            "FAILED": (f"({_('status_failed_linux')})", "red"), "NOT_FOUND": (_('status_not_found_long'), "orange"),
-            "ERROR": (_('status_error'), "red")
-        }
-        display_text, color = status_map.get(status, (f"({_('status_unknown')})", "gray"))
-        if self.app.root.winfo_exists() and self.winfo_exists():
-            self.app.root.after(0, lambda: (self.servico_label_var.set(f"{base_text} {display_text}"),
-                                            self.servico_label_widget.config(foreground=color)))
-
-    def _verificar_status_servico_win(self, nome_servico_local):
-        if not PYWIN32_AVAILABLE: return "ERROR"
-        if not nome_servico_local: return "NOT_FOUND"
-        try:
-            startupinfo = subprocess.STARTUPINFO()
-            startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-            result = subprocess.run(['sc', 'query', nome_servico_local], capture_output=True, text=True,
-                                    errors='ignore', startupinfo=startupinfo)
-            if "failed 1060" in result.stdout.lower(): return "NOT_FOUND"
-            if "RUNNING" in result.stdout: return "RUNNING"
-            if "STOPPED" in result.stdout: return "STOPPED"
-            return "UNKNOWN"
-        except Exception:
-            return "ERROR"
-
-    def _verificar_status_servico_linux(self, nome_servico_local):
-        if not SYSTEMCTL_AVAILABLE: return "ERROR"
-        if not nome_servico_local: return "NOT_FOUND"
-        nome_servico_systemd = f"{nome_servico_local}.service" if not nome_servico_local.endswith(
-            ".service") else nome_servico_local
-        try:
-            result = subprocess.run(['systemctl', 'is-active', nome_servico_systemd], capture_output=True, text=True)
-            status = result.stdout.strip()
-            if status == "active": return "RUNNING"
-            if status == "inactive": return "STOPPED"
-            if status == "failed": return "FAILED"
-            return "UNKNOWN"
-        except Exception:
-            return "ERROR"
+        threading.Thread(target=self._get_and_display_service_status_thread_worker, args=(service_name, base_text),
+                         daemon=True, name=f"ServiceStatusCheck-{self.nome}").start()
 
     def start_log_monitoring(self):
         if self.log_monitor_thread and self.log_monitor_thread.is_alive():
             return
+        if ServiceManager.is_process_service(self.nome_servico.get()):
+            self._iniciar_escuta_processo()  # a saída chega pelo pipe do processo filho, sem leitura de arquivo
+            return
 
         if not self.pasta_raiz.get() or not os.path.isdir(self.pasta_raiz.get()):
             self.append_text_to_log_area(
@@ -2146,6 +6476,11 @@ class VotemapTab(ttk.Frame):
 
     def stop_log_monitoring(self, from_tab_closure=False):
         self._stop_event.set()
+        if from_tab_closure: self._restart_cancel_event.set()
+        if self._process_listener_service:
+            self.app.service_manager.process_backend.remove_line_listener(self._process_listener_service,
+                                                                         self._on_process_output_line)
+            self._process_listener_service = None
         if self.log_monitor_thread and self.log_monitor_thread.is_alive():
             if self.log_monitor_thread != threading.current_thread():
                 self.log_monitor_thread.join(timeout=1.5)
@@ -2181,7 +6516,10 @@ class VotemapTab(ttk.Frame):
                     novo_arquivo_log = os.path.join(subpasta_recente, log_filename)
                     if os.path.exists(novo_arquivo_log) and novo_arquivo_log != caminho_log_atual:
                         self.logger.info(f"Votemap [{self.nome}]: New log file detected: {novo_arquivo_log}")
-                        if file_handle: file_handle.close()
+                        if file_handle:
+                            file_handle.close()
+                            # Novo arquivo de log = servidor reiniciado; encerra as sessões abertas desta fonte.
+                            self.app.reset_player_sessions_for_source(pasta_raiz)
 
                         caminho_log_atual = novo_arquivo_log
                         self.append_text_to_log_area_threadsafe(
@@ -2220,9 +6558,24 @@ class VotemapTab(ttk.Frame):
             file_handle.close()
         self.logger.info(f"Votemap [{self.nome}]: Log processing worker stopped.")
 
+    def _on_process_output_line(self, linha):
+        """ Linha lida do pipe do processo filho (thread leitora do ChildProcessBackend). """
+        if self._paused: return  # o pipe não pode ser retido: em pausa as linhas são descartadas
+        if self._output_patterns is None:  # compilados uma vez; o trace dos campos de padrão os invalida
+            try:
+                self._output_patterns = (re.compile(self.vote_pattern_var.get()),
+                                         re.compile(self.winner_pattern_var.get()))
+            except re.error as e:
+                self._output_patterns = ()  # inválido: registrado uma vez, até o padrão ser editado
+                self.append_text_to_log_area_threadsafe(self.app.translator.get("log_regex_error", error=e) + "\n")
+                self.logger.error(f"Votemap [{self.nome}]: Regex compilation failed: {e}.")
+        if self._output_patterns:
+            self._process_log_line(linha, self.filtro_var.get().lower(), *self._output_patterns)
+
     def _process_log_line(self, linha, current_filter, vote_pattern, winner_pattern):
+        self.log_lines_seen += 1
         # Chama o processador de informações do jogador na app principal
-        self.app.process_player_info_from_log(linha)
+        self.app.process_player_info_from_log(linha, source=self.pasta_raiz.get())
 
         if not current_filter or current_filter in linha.lower():
             self.append_text_to_log_area(linha)
@@ -2308,11 +6661,13 @@ class VotemapTab(ttk.Frame):
             self._display_json_in_widget(self.json_text_area_server, server_data)
             self.append_text_to_log_area(_("log_server_json_updated", map=nome_mapa) + "\n")
             self.logger.info(f"JSON do servidor atualizado para: {nome_mapa} ({novo_scenario_id})")
+            self.app.notify_event("winner", self.nome, _("log_winner_map", map=nome_mapa))
 
             if self.auto_restart_var.get() and self.nome_servico.get():
                 self.append_text_to_log_area(_("log_auto_restart_starting") + "\n")
                 self.logger.info("Iniciando reinício automático do servidor após troca de mapa.")
-                threading.Thread(target=self.reiniciar_servidor_worker, daemon=True).start()
+                self.solicitar_reinicio(RestartOrchestrator.PRIORITY_TRIGGER, warn=True,
+                                        kind=RestartHistoryDB.KIND_VOTEMAP)
         except (json.JSONDecodeError, FileNotFoundError) as e:
             self.append_text_to_log_area(_("log_error_map_change", error=e) + "\n")
             self.logger.error(f"Erro de arquivo ou JSON na troca de mapa: {e}", exc_info=True)
@@ -2320,14 +6675,27 @@ class VotemapTab(ttk.Frame):
             self.append_text_to_log_area(_("log_error_map_change", error=e) + "\n")
             self.logger.error(f"Erro inesperado na troca de mapa: {e}", exc_info=True)
 
-    def reiniciar_servidor_worker(self):
+    def _executar_reinicio(self, priority, kind=None):
+        """ Tarefa enfileirada por ServerTabMixin._enfileirar_reinicio. """
+        self.reiniciar_servidor_worker(kind or RestartHistoryDB.KIND_BY_PRIORITY[priority])
+
+    def reiniciar_servidor_worker(self, kind=RestartHistoryDB.KIND_VOTEMAP):
         _ = self.app.translator.get
         nome_servico = self.nome_servico.get()
         if not nome_servico: self.append_text_to_log_area_threadsafe(
             _("log_error_service_not_configured") + "\n"); return
         self.logger.info(f"Iniciando reinício de '{nome_servico}'.")
-        success = self._executar_logica_reinicio_servico(nome_servico)
+        self._restart_timeline = RestartTimeline(self.nome, nome_servico, kind)
+        try:
+            success = self._executar_logica_reinicio_servico(nome_servico)
+        except Exception:
+            self._registrar_historico_reinicio(False)
+            raise
+        self._registrar_historico_reinicio(success)
         if self.app.root.winfo_exists():
+            self.app.notify_event("restart" if success else "restart_failed", self.nome,
+                                  _("dialog_restart_complete_msg" if success else "dialog_restart_failed_votemap_msg",
+                                    service=nome_servico))
             if success:
                 self.app.show_messagebox_from_thread("success", _("dialog_restart_complete_title", server=self.nome),
                                                      _("dialog_restart_complete_msg", service=nome_servico))
@@ -2379,61 +6747,21 @@ class VotemapTab(ttk.Frame):
                                                  _("error_service_start_failed_msg", service=service_name))
         self.update_service_status_display()
 
-    def _stop_service(self, service_name):
-        _ = self.app.translator.get
-        os_system = platform.system()
-        try:
-            if os_system == "Windows":
-                self.append_text_to_log_area_threadsafe(_("log_executing_sc_stop", service=service_name) + "\n")
-                startupinfo = subprocess.STARTUPINFO();
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                subprocess.run(["sc", "stop", service_name], check=True, startupinfo=startupinfo, timeout=30)
-            elif os_system == "Linux":
-                nome_servico_systemd = f"{service_name}.service" if not service_name.endswith(
-                    ".service") else service_name
-                cmd_prefix = ['sudo'] if os.geteuid() != 0 else []
-                self.append_text_to_log_area_threadsafe(
-                    _("log_executing_sysd_stop", service=nome_servico_systemd) + "\n")
-                subprocess.run(cmd_prefix + ['systemctl', 'stop', nome_servico_systemd], check=True,
-                               capture_output=True, timeout=30)
-            else:
-                return False
-            return True
-        except Exception as e:
-            self.append_text_to_log_area_threadsafe(_("log_stop_error", service=service_name, error=e) + "\n")
-            self.logger.error(f"Erro ao parar serviço '{service_name}': {e}", exc_info=True)
-            return False
-
-    def _start_service(self, service_name):
-        _ = self.app.translator.get
-        os_system = platform.system()
-        try:
-            if os_system == "Windows":
-                self.append_text_to_log_area_threadsafe(_("log_executing_sc_start", service=service_name) + "\n")
-                startupinfo = subprocess.STARTUPINFO();
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                subprocess.run(["sc", "start", service_name], check=True, startupinfo=startupinfo, timeout=30)
-            elif os_system == "Linux":
-                nome_servico_systemd = f"{service_name}.service" if not service_name.endswith(
-                    ".service") else service_name
-                cmd_prefix = ['sudo'] if os.geteuid() != 0 else []
-                self.append_text_to_log_area_threadsafe(
-                    _("log_executing_sysd_start", service=nome_servico_systemd) + "\n")
-                subprocess.run(cmd_prefix + ['systemctl', 'start', nome_servico_systemd], check=True,
-                               capture_output=True, timeout=30)
-            else:
-                return False
-            return True
-        except Exception as e:
-            self.append_text_to_log_area_threadsafe(_("log_start_error", service=service_name, error=e) + "\n")
-            self.logger.error(f"Erro ao iniciar serviço '{service_name}': {e}", exc_info=True)
-            return False
-
     def _executar_logica_reinicio_servico(self, nome_servico):
+        _status, main_pid = self.app.service_manager.get_status_and_pid(nome_servico)
+        self._marcar_fase_reinicio("stop_issued")
         if self._stop_service(nome_servico):
-            time.sleep(self.stop_delay_var.get())
+            stopped = self._aguardar_parada_servico(nome_servico, main_pid)
+            if stopped is None:
+                self.append_text_to_log_area_threadsafe(self.app.translator.get("log_restart_cancelled") + "\n")
+                return False
+            if stopped: self._marcar_fase_reinicio("stopped")
+            probe = self._criar_sonda_prontidao()
+            self._marcar_fase_reinicio("start_issued")
             if self._start_service(nome_servico):
-                time.sleep(self.start_delay_var.get())
+                start_delay = self._aguardar_servico_ativo(nome_servico, self.start_delay_var.get())
+                if self._aguardar_prontidao_servidor(probe, start_delay):
+                    self._marcar_fase_reinicio("ready")
                 self._restaurar_json_para_votemap()
                 return True
         return False
@@ -2555,9 +6883,22 @@ class UnifiedMultiToolApp:
 
         # --- NOVO: Regex para captura de informações do jogador ---
         self.player_info_regex = re.compile(r"Name=([^,]+),\s+IdentityId=([0-9a-fA-F\-]{36})")
+        # Linhas de desconexão (NETWORK "Disconnecting player" ou BattlEye "Player #N Nome disconnected")
+        self.player_leave_regex = re.compile(self.config.get(
+            "player_leave_pattern",
+            r"(?:Disconnecting player:.*?Name=([^,\r\n]+)|Player #\d+ (.+?) disconnected)"))
 
         # --- NOVO: Gerenciador do Banco de Dados de Jogadores ---
         self.player_db_manager = PlayerDBManager()  # Cria a instância do DB manager
+        self.player_session_tracker = PlayerSessionTracker(self.player_db_manager)
+        self.restart_history = RestartHistoryDB()
+        self.service_manager = ServiceManager(self.translator, status_ttl=self.config.get("service_status_ttl", 2.0))
+        if self.config.get("service_helper_enabled", True) and PrivilegedServiceHelper.is_needed():
+            self.service_manager.privileged_helper = PrivilegedServiceHelper()
+        self.service_manager.process_backend.on_exit = self._on_service_status_event
+        self.service_list_cache = ServiceListCache(self.service_manager.list_services,
+                                                   ttl=self.config.get("service_list_ttl", 300.0))
+        self.player_watchlist = PlayerWatchList(self.config.get("player_watchlist_file", "player_watchlist.txt"))
 
         # --- NOVO: Variável para controlar o coletor de informações ---
         self.player_info_collector_enabled = tk.BooleanVar(
@@ -2585,6 +6926,16 @@ class UnifiedMultiToolApp:
         self.votemap_servidores = []
         self.config_changed = False
         self._app_stop_event = threading.Event()
+        self.restart_orchestrator = RestartOrchestrator(self.config.get("restart_max_concurrent", 2),
+                                                        self.config.get("restart_stagger_seconds", 15.0),
+                                                        stop_event=self._app_stop_event,
+                                                        cooldown_seconds=self.config.get("restart_cooldown_seconds", 120.0))
+        self.restart_scheduler = RestartScheduler(stop_event=self._app_stop_event)
+        self.rcon_pool = RConPool()
+        self.webhook_notifier = WebhookNotifier(self.config.get("webhook_url", ""),
+                                                debounce=self.config.get("webhook_debounce_seconds", 5.0),
+                                                max_window=self.config.get("webhook_max_window_seconds", 60.0),
+                                                stop_event=self._app_stop_event)
         self.tray_icon = None
         self.app_icon_tk = None
         self.original_pil_bg_image = None
@@ -2602,6 +6953,22 @@ class UnifiedMultiToolApp:
         if self.bg_label and self.bg_label.winfo_exists(): self.bg_label.lower()
 
         self.atualizar_logs_sistema_periodicamente()
+        self.service_status_watcher = None
+        self.fleet_status_poller = FleetStatusPoller(self, self.config.get("service_status_poll_interval", 15.0))
+        if self.config.get("service_status_backend", "poll") == "dbus" and SystemdDBusWatcher.is_available():
+            watcher = SystemdDBusWatcher(self.service_manager, self._nomes_servicos_configurados,
+                                         self._on_service_status_event,
+                                         on_failure=self._on_service_status_watcher_failed)
+            if watcher.start(): self.service_status_watcher = watcher
+        if not self.service_status_watcher: self.fleet_status_poller.start()
+        if self.service_manager.can_manage_services: self.service_list_cache.refresh_async()  # pré-carrega a lista
+        self.resource_sampler = ProcessResourceSampler(self, self.config.get("resource_sample_interval", 5.0))
+        self.resource_sampler.start()
+        self.a2s_prober = A2SProber(self, self.config.get("a2s_probe_interval", 10.0),
+                                    self.config.get("a2s_probe_timeout", 2.0))
+        self.a2s_prober.start()
+        self.log_silence_watchdog = LogSilenceWatchdog(self, self.config.get("log_silence_check_interval", 30.0))
+        self.log_silence_watchdog.start()
         self.root.bind("<Configure>", self._on_root_configure)
         self.root.protocol("WM_DELETE_WINDOW", self.minimize_to_tray_on_close)
 
@@ -2745,7 +7112,7 @@ class UnifiedMultiToolApp:
                                parent=self.root,
                                alert=True) == "OK":
             current_tab.stop_log_monitoring(from_tab_closure=True)
-            if isinstance(current_tab, RestarterTab): current_tab.stop_scheduler_thread(from_tab_closure=True)
+            if isinstance(current_tab, RestarterTab): self.restart_scheduler.remove(current_tab)
             notebook.forget(current_tab)
             if current_tab in servidores: servidores.remove(current_tab)
             current_tab.destroy()
@@ -2753,6 +7120,28 @@ class UnifiedMultiToolApp:
             self.set_status_from_thread(
                 _("status_server_removed", server=nome_servidor, tool=tool_name))
 
+    def mostrar_estatisticas_servicos(self):
+        """ Mostra os contadores de tempo das operações de cada backend de serviço. """
+        _ = self.translator.get
+        lines = []
+        for backend_name, ops in self.service_manager.timing_stats().items():
+            lines.append(_("service_stats_backend", backend=backend_name))
+            for op, st in sorted(ops.items()):
+                lines.append(_("service_stats_line", op=op, calls=st["calls"], avg=f"{st['avg_ms']:.1f}",
+                               max=f"{st['max_ms']:.1f}", total=f"{st['total_ms']:.0f}"))
+            if not ops: lines.append(_("service_stats_empty"))
+        Messagebox.show_info(title=_("service_stats_title"), message="\n".join(lines), parent=self.root)
+
+    def reiniciar_servidor_atual(self):
+        """ Reinício manual da aba ativa, com a maior prioridade na fila de reinícios. """
+        _ = self.translator.get
+        _notebook, _servidores, current_tab = self._get_active_tab_info()
+        if not current_tab or not current_tab.nome_servico.get():
+            self.show_messagebox_from_thread("warning", _("warn_no_service_selected_title"),
+                                             _("warn_no_service_to_restart"))
+            return
+        current_tab.solicitar_reinicio(RestartOrchestrator.PRIORITY_MANUAL)
+
     def rename_current_server(self):
         _ = self.translator.get
         notebook, servidores, current_tab = self._get_active_tab_info()
@@ -2807,7 +7196,10 @@ class UnifiedMultiToolApp:
                                              _("dialog_rename_error_duplicate_msg", name=new_name))
             return
 
-        tab_to_rename.nome = new_name
+        if isinstance(tab_to_rename, RestarterTab):
+            self.restart_scheduler.rename(tab_to_rename, new_name)
+        else:
+            tab_to_rename.nome = new_name
         notebook.tab(tab_to_rename, text=new_name)
         self.mark_config_changed()
         self.set_status_from_thread(_("status_server_renamed", name=new_name))
@@ -2829,7 +7221,24 @@ class UnifiedMultiToolApp:
             "language": self.translator.language,
             "restarter_servers": [s.get_current_config() for s in self.restarter_servidores],
             "votemap_servers": [s.get_current_config() for s in self.votemap_servidores],
-            "player_collector_enabled": self.player_info_collector_enabled.get() # NOVO
+            "player_collector_enabled": self.player_info_collector_enabled.get(), # NOVO
+            "player_leave_pattern": self.player_leave_regex.pattern,
+            "player_watchlist_file": self.player_watchlist.file_path,
+            "service_status_ttl": self.service_manager.status_ttl,
+            "service_status_poll_interval": self.fleet_status_poller.interval,
+            "service_status_backend": self.config.get("service_status_backend", "poll"),
+            "service_helper_enabled": self.config.get("service_helper_enabled", True),
+            "restart_max_concurrent": self.restart_orchestrator.max_concurrent,
+            "restart_stagger_seconds": self.restart_orchestrator.stagger_seconds,
+            "restart_cooldown_seconds": self.restart_orchestrator.cooldown_seconds,
+            "service_list_ttl": self.service_list_cache.ttl,
+            "resource_sample_interval": self.resource_sampler.interval,
+            "a2s_probe_interval": self.a2s_prober.interval,
+            "a2s_probe_timeout": self.a2s_prober.timeout,
+            "log_silence_check_interval": self.log_silence_watchdog.interval,
+            "webhook_url": self.webhook_notifier.url,
+            "webhook_debounce_seconds": self.webhook_notifier.debounce,
+            "webhook_max_window_seconds": self.webhook_notifier.max_window,
         }
         try:
             with open(self.config_file, 'w', encoding='utf-8') as f:
@@ -2866,6 +7275,7 @@ class UnifiedMultiToolApp:
         self.restarter_menu.add_command(label=_("menu_add_server"),
                                         command=lambda: self.adicionar_restarter_tab(focus_new_tab=True))
         self.restarter_menu.add_command(label=_("menu_rename_server"), command=self.rename_current_server)
+        self.restarter_menu.add_command(label=_("menu_restart_current_server"), command=self.reiniciar_servidor_atual)
         self.restarter_menu.add_command(label=_("menu_remove_current_server"), command=self.remover_servidor_atual)
 
         self.votemap_menu = ttk.Menu(self.menubar, tearoff=0)
@@ -2873,6 +7283,7 @@ class UnifiedMultiToolApp:
         self.votemap_menu.add_command(label=_("menu_add_server"),
                                       command=lambda: self.adicionar_votemap_tab(focus_new_tab=True))
         self.votemap_menu.add_command(label=_("menu_rename_server"), command=self.rename_current_server)
+        self.votemap_menu.add_command(label=_("menu_restart_current_server"), command=self.reiniciar_servidor_atual)
         self.votemap_menu.add_command(label=_("menu_remove_current_server"), command=self.remover_servidor_atual)
 
         tools_menu = ttk.Menu(self.menubar, tearoff=0)
@@ -2891,6 +7302,20 @@ class UnifiedMultiToolApp:
             variable=self.player_info_collector_enabled,
             command=self.mark_config_changed  # Marca que a config mudou para poder salvar
         )
+        tools_menu.add_command(label=_("menu_restart_queue"), command=lambda: RestartQueueWindow(self))
+        tools_menu.add_command(label=_("menu_restart_history_export"), command=self.exportar_historico_reinicios)
+        tools_menu.add_command(label=_("menu_webhook"), command=self.configurar_webhook)
+        tools_menu.add_command(label=_("menu_service_backend_stats"), command=self.mostrar_estatisticas_servicos)
+        tools_menu.add_command(label=_("menu_player_search"), command=self.show_player_search)
+        tools_menu.add_command(label=_("menu_player_backfill"), command=self.iniciar_backfill_jogadores)
+        tools_menu.add_command(label=_("menu_player_watchlist_reload"), command=self.recarregar_lista_observacao)
+        player_db_menu = ttk.Menu(tools_menu, tearoff=0)
+        tools_menu.add_cascade(label=_("menu_player_db_transfer"), menu=player_db_menu)
+        for table in ("players", "identities", "sessions"):
+            player_db_menu.add_command(label=_(f"menu_player_export_{table}"),
+                                       command=lambda t=table: self.exportar_tabela_jogadores(t))
+        player_db_menu.add_separator()
+        player_db_menu.add_command(label=_("menu_player_import"), command=self.importar_arquivos_jogadores)
 
         lang_menu = ttk.Menu(self.menubar, tearoff=0)
         self.menubar.add_cascade(label=_("menu_language"), menu=lang_menu)
@@ -2947,10 +7372,25 @@ class UnifiedMultiToolApp:
         self._shutting_down = True
         app_logger.info("Iniciando processo de encerramento...")
         self._app_stop_event.set()
+        if getattr(self, 'fleet_status_poller', None): self.fleet_status_poller.poll_now()
+        if getattr(self, 'restart_orchestrator', None): self.restart_orchestrator.shutdown()
+        if getattr(self, 'restart_scheduler', None): self.restart_scheduler.shutdown()
+        if getattr(self, 'rcon_pool', None): self.rcon_pool.close_all()
+        if getattr(self, 'webhook_notifier', None): self.webhook_notifier.shutdown()
+        if getattr(self, 'service_status_watcher', None): self.service_status_watcher.stop()
+        if self.service_manager.privileged_helper: self.service_manager.privileged_helper.close()
+        self.service_manager.process_backend.shutdown()
+        if getattr(self, 'player_backfill_job', None): self.player_backfill_job.cancel()
+        if getattr(self, 'player_transfer_cancel', None): self.player_transfer_cancel.set()
         for tab in self.restarter_servidores + self.votemap_servidores:
             tab.stop_log_monitoring(from_tab_closure=True)
-            if isinstance(tab, RestarterTab): tab.stop_scheduler_thread(from_tab_closure=True)
+            if isinstance(tab, RestarterTab): self.restart_scheduler.remove(tab)
         if self.config_changed: self._save_app_config_to_file()
+        self.player_watchlist.shutdown()
+        try:
+            self.player_session_tracker.shutdown()
+        except Exception as e:
+            app_logger.error(f"Erro ao gravar sessões de jogadores no encerramento: {e}", exc_info=True)
         if self.tray_icon:
             try:
                 self.tray_icon.stop()
@@ -2987,6 +7427,27 @@ class UnifiedMultiToolApp:
         except (tk.TclError, Exception):
             pass
 
+    def _nomes_servicos_configurados(self):
+        """ Unidades do SO configuradas nas abas (serviços de processo filho ficam de fora). """
+        return [tab.nome_servico.get() for tab in self.restarter_servidores + self.votemap_servidores
+                if not ServiceManager.is_process_service(tab.nome_servico.get())]
+
+    def _on_service_status_event(self, service_name, status):
+        """ Chamado pelo backend D-Bus ou de processo filho (fora da thread da GUI) quando um serviço muda de estado. """
+        if self._shutting_down: return
+        for tab in self.restarter_servidores + self.votemap_servidores:
+            if tab.nome_servico.get() == service_name:
+                tab.display_service_status(status)
+
+    def _on_service_status_watcher_failed(self):
+        """ Chamado pela thread do D-Bus ao cair: as abas voltam a ser atualizadas pela consulta periódica. """
+        self.service_status_watcher = None
+        if self._shutting_down:
+            return
+        app_logger.warning("Status dos serviços voltou para a consulta periódica em lote.")
+        self.fleet_status_poller.start()
+        self.fleet_status_poller.poll_now()
+
     def iniciar_selecao_servico_para_aba(self, tab_instance, os_type):
         _ = self.translator.get
         worker = None
@@ -3004,18 +7465,19 @@ class UnifiedMultiToolApp:
             worker = self._obter_servicos_worker_linux
         else:
             return
+        # Lista em cache: o diálogo abre na hora (e recarrega em segundo plano se a lista estiver velha)
+        if self.service_list_cache.index is not None:
+            self._mostrar_dialogo_selecao_servico(self.service_list_cache.index, None, tab_instance,
+                                                  os_type.capitalize())
+            return
         progress_win, _ = self._show_progress_dialog(_("dialog_loading_services_title", os=os_type.capitalize()),
                                                      _("dialog_loading_services_msg"))
         threading.Thread(target=worker, args=(progress_win, tab_instance), daemon=True).start()
 
     def _obter_servicos_worker_win(self, progress_win, tab_instance):
         _ = self.translator.get
-        initialized_com = False
         try:
-            pythoncom.CoInitialize()
-            initialized_com = True
-            wmi = win32com.client.GetObject('winmgmts:')
-            services = sorted([s.Name for s in wmi.InstancesOf('Win32_Service') if s.Name and s.AcceptStop])
+            services = self.service_list_cache.refresh()
             if not self._shutting_down and self.root.winfo_exists():
                 self.root.after(0, self._mostrar_dialogo_selecao_servico, services, progress_win, tab_instance,
                                 "Windows")
@@ -3026,16 +7488,11 @@ class UnifiedMultiToolApp:
                                                  _("dialog_wmi_error_msg", error=e))
         finally:
             if progress_win.winfo_exists(): self.root.after(0, progress_win.destroy)
-            if initialized_com: pythoncom.CoUninitialize()
 
     def _obter_servicos_worker_linux(self, progress_win, tab_instance):
         _ = self.translator.get
         try:
-            cmd_prefix = ['sudo'] if os.geteuid() != 0 else []
-            cmd = cmd_prefix + ['systemctl', 'list-units', '--type=service', '--all', '--no-legend', '--no-pager']
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=15)
-            services_raw = [line.split()[0] for line in result.stdout.strip().split('\n') if line]
-            services = sorted(list(set([s.replace('.service', '') for s in services_raw])))
+            services = self.service_list_cache.refresh()
             if not self._shutting_down and self.root.winfo_exists():
                 self.root.after(0, self._mostrar_dialogo_selecao_servico, services, progress_win, tab_instance, "Linux")
         except Exception as e:
@@ -3047,10 +7504,10 @@ class UnifiedMultiToolApp:
         finally:
             if progress_win.winfo_exists(): self.root.after(0, progress_win.destroy)
 
-    def _mostrar_dialogo_selecao_servico(self, service_list, progress_win, tab_instance, os_type):
+    def _mostrar_dialogo_selecao_servico(self, service_index, progress_win, tab_instance, os_type):
         _ = self.translator.get
-        if progress_win.winfo_exists(): progress_win.destroy()
-        if not service_list:
+        if progress_win is not None and progress_win.winfo_exists(): progress_win.destroy()
+        if not len(service_index):
             self.show_messagebox_from_thread("info", _("dialog_no_services_found_title"),
                                              _("dialog_no_services_found_msg", os=os_type))
             return
@@ -3065,14 +7522,37 @@ class UnifiedMultiToolApp:
         treeview = ttk.Treeview(dialog, columns=("name",), show="headings", selectmode="browse")
         treeview.heading("name", text=_("dialog_service_name_header", os=os_type))
         treeview.pack(fill='both', expand=True, padx=10, pady=5)
+        count_var = tk.StringVar()
+        ttk.Label(dialog, textvariable=count_var, anchor='w').pack(fill='x', padx=10)
+        # Estado da busca incremental: o resultado do termo anterior restringe a busca do termo atual
+        state = {"index": service_index, "query": "", "matches": None}
 
         def _populate(query=""):
+            index = state["index"]
+            query = query.strip().lower()
+            candidates = state["matches"] if state["matches"] is not None and state["query"] and query.startswith(
+                state["query"]) else None
+            matches = index.search(query, candidates)
+            state["query"], state["matches"] = query, matches
+            # Só as linhas que aparecem são inseridas no Treeview
             treeview.delete(*treeview.get_children())
-            for name in (s for s in service_list if query.lower() in s.lower()): treeview.insert("", "end",
-                                                                                                 values=(name,))
+            for pos in matches[:SERVICE_DIALOG_MAX_ROWS]:
+                treeview.insert("", "end", values=(index.names[pos],))
+            count_var.set(_("dialog_service_filter_count", shown=min(len(matches), SERVICE_DIALOG_MAX_ROWS),
+                            matches=len(matches), total=len(index)))
+
+        def _on_list_refreshed(new_index):
+            def _apply():
+                if not dialog.winfo_exists(): return
+                state["index"], state["matches"] = new_index, None
+                _populate(search_var.get())
+            if not self._shutting_down: self.root.after(0, _apply)
 
         _populate()
         search_entry.bind("<KeyRelease>", lambda e: _populate(search_var.get()))
+        search_entry.focus_set()
+        if self.service_list_cache.is_stale():
+            self.service_list_cache.refresh_async(on_done=_on_list_refreshed)
 
         def on_confirm():
             if treeview.selection():
@@ -3243,11 +7723,13 @@ class UnifiedMultiToolApp:
         center_win.wait_window()
 
 
-    def process_player_info_from_log(self, log_line):
+    def process_player_info_from_log(self, log_line, source=None):
         """
         Processa uma linha de log para extrair e salvar informações do jogador, se o coletor estiver ativo.
+        'source' identifica a origem da linha (pasta de logs do servidor) para o rastreio de sessões.
         """
-        if not self.player_info_collector_enabled.get():
+        collector_enabled = self.player_info_collector_enabled.get()
+        if not collector_enabled and not len(self.player_watchlist):
             return
 
         match = self.player_info_regex.search(log_line)
@@ -3255,6 +7737,14 @@ class UnifiedMultiToolApp:
             nickname = match.group(1).strip()
             bohemia_id = match.group(2).strip()
 
+            # A lista de observação é verificada antes de qualquer gravação no DB, para o alerta sair na hora.
+            reason = self.player_watchlist.match(bohemia_id)
+            if reason is not None:
+                self._alertar_jogador_observado(nickname, bohemia_id, reason, source)
+            if not collector_enabled:
+                return
+
+            self.player_session_tracker.player_joined(source, nickname, bohemia_id)
             # Tenta adicionar o jogador ao DB
             was_added = self.player_db_manager.add_player(nickname, bohemia_id)
             # Se o jogador era novo e foi adicionado, loga a informação
@@ -3263,6 +7753,208 @@ class UnifiedMultiToolApp:
                 app_logger.info(log_msg)
                 # Opcional: Adicionar ao log da aba específica também
                 # self.append_text_to_log_area_threadsafe(log_msg + "\n")
+            return
+
+        leave_match = collector_enabled and self.player_leave_regex.search(log_line)
+        if leave_match:
+            nickname = next((g for g in leave_match.groups() if g), "").strip()
+            if nickname:
+                self.player_session_tracker.player_left(source, nickname)
+
+    def _alertar_jogador_observado(self, nickname, bohemia_id, reason, source):
+        _ = self.translator.get
+        server = os.path.basename(os.path.normpath(source)) if source else "?"
+        message = _("watchlist_hit_msg", nickname=nickname, bohemia_id=bohemia_id, server=server,
+                    reason=reason or "-")
+        app_logger.warning(f"Jogador da lista de observação entrou: {nickname} ({bohemia_id}) em '{source}'. "
+                           f"Motivo: {reason or '-'}")
+        self.show_messagebox_from_thread("warning", _("watchlist_hit_title"), message)
+
+    def recarregar_lista_observacao(self):
+        _ = self.translator.get
+        count = self.player_watchlist.reload()
+        if count is None:
+            self.show_messagebox_from_thread("warning", _("watchlist_title"),
+                                             _("watchlist_not_found", file=self.player_watchlist.file_path))
+        else:
+            self.show_messagebox_from_thread("info", _("watchlist_title"), _("watchlist_reloaded", count=count))
+
+    def show_player_search(self):
+        PlayerSearchWindow(self)
+
+    def iniciar_backfill_jogadores(self):
+        """ Importa jogadores de todas as pastas logs_* já existentes, sem bloquear a interface. """
+        _ = self.translator.get
+        if getattr(self, 'player_backfill_job', None) and self.player_backfill_job.thread.is_alive():
+            self.show_messagebox_from_thread("info", _("backfill_title"), _("backfill_already_running"))
+            return
+        log_roots, seen = [], set()
+        for tab in self.restarter_servidores + self.votemap_servidores:
+            root_dir, log_filename = tab.pasta_raiz.get(), tab.log_filename_var.get() or "console.log"
+            if root_dir and os.path.isdir(root_dir) and (root_dir, log_filename) not in seen:
+                seen.add((root_dir, log_filename))
+                log_roots.append((root_dir, log_filename))
+        if not log_roots:
+            self.show_messagebox_from_thread("warning", _("backfill_title"), _("backfill_no_folders"))
+            return
+
+        win = ttk.Toplevel(self.root)
+        win.title(_("backfill_title"))
+        win.geometry("420x140")
+        win.resizable(False, False)
+        win.transient(self.root)
+        status_var = tk.StringVar(value=_("backfill_scanning"))
+        ttk.Label(win, textvariable=status_var).pack(pady=(15, 5), padx=10, anchor='w')
+        progress = ttk.Progressbar(win, mode='determinate', length=400, maximum=1)
+        progress.pack(pady=5, padx=10)
+        cancel_btn = ttk.Button(win, text=_("btn_cancel"), bootstyle=DANGER)
+        cancel_btn.pack(pady=5)
+
+        def on_progress(done, total, new_players):
+            def update():
+                if not win.winfo_exists(): return
+                progress.config(maximum=max(total, 1), value=done)
+                status_var.set(_("backfill_progress", done=done, total=total, new=new_players))
+            if not self._shutting_down: self.root.after(0, update)
+
+        def on_done(done, total, new_players, cancelled):
+            msg_key = "backfill_cancelled" if cancelled else "backfill_done"
+            self.show_messagebox_from_thread("info", _("backfill_title"),
+                                             _(msg_key, done=done, total=total, new=new_players))
+            if not self._shutting_down: self.root.after(0, lambda: win.winfo_exists() and win.destroy())
+
+        self.player_backfill_job = PlayerBackfillJob(self.player_db_manager, log_roots,
+                                                     self.player_info_regex.pattern, on_progress, on_done)
+        cancel_btn.config(command=self.player_backfill_job.cancel)
+        win.protocol("WM_DELETE_WINDOW", self.player_backfill_job.cancel)
+        self.player_backfill_job.start()
+
+    def notify_event(self, kind, server, message):
+        """ Repassa um evento ao webhook de notificações (não bloqueia; ignorado sem URL configurada). """
+        self.webhook_notifier.notify(kind, server, message)
+
+    def configurar_webhook(self):
+        _ = self.translator.get
+        url = simpledialog.askstring(_("menu_webhook"), _("dialog_webhook_url_prompt"),
+                                     initialvalue=self.webhook_notifier.url, parent=self.root)
+        if url is None: return
+        url = url.strip()
+        if url and not url.lower().startswith(("http://", "https://")):
+            self.show_messagebox_from_thread("error", _("menu_webhook"), _("dialog_webhook_url_invalid"))
+            return
+        if url != self.webhook_notifier.url:
+            self.webhook_notifier.url = url
+            self.mark_config_changed()
+        if url: self.notify_event("info", "PQDT_Toolbox", _("webhook_test_message"))
+
+    def exportar_historico_reinicios(self):
+        """ Exporta o histórico de reinícios (fases e indisponibilidade) para CSV em segundo plano. """
+        _ = self.translator.get
+        path = filedialog.asksaveasfilename(
+            parent=self.root, title=_("menu_restart_history_export"), initialfile="restart_history.csv",
+            defaultextension=".csv", filetypes=[("CSV", "*.csv"), ("All files", "*.*")])
+        if not path: return
+
+        def worker():
+            try:
+                rows = self.restart_history.export_csv(path)
+                self.show_messagebox_from_thread("success", _("menu_restart_history_export"),
+                                                 _("restart_history_export_done", rows=rows,
+                                                   file=os.path.basename(path)))
+            except (OSError, sqlite3.Error) as e:
+                app_logger.error(f"Erro ao exportar histórico de reinícios: {e}", exc_info=True)
+                self.show_messagebox_from_thread("error", _("menu_restart_history_export"),
+                                                 _("restart_history_export_error", error=e))
+
+        threading.Thread(target=worker, daemon=True, name="RestartHistoryExport").start()
+
+    def exportar_tabela_jogadores(self, table):
+        """ Exporta uma tabela do banco de jogadores para CSV/JSONL em segundo plano. """
+        _ = self.translator.get
+        path = filedialog.asksaveasfilename(
+            parent=self.root, title=_("player_transfer_title"), initialfile=f"{table}.csv", defaultextension=".csv",
+            filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl"), ("All files", "*.*")])
+        if not path: return
+
+        def work(cancel_event, on_rows):
+            rows = self.player_db_manager.export_table(table, path, progress_callback=on_rows,
+                                                       cancel_event=cancel_event)
+            if rows is None: return None
+            return _("player_export_done", rows=rows, table=table, file=os.path.basename(path))
+
+        self._executar_transferencia_jogadores(work)
+
+    def importar_arquivos_jogadores(self):
+        """ Importa (mescla) um ou mais arquivos CSV/JSONL no banco de jogadores em segundo plano. """
+        _ = self.translator.get
+        paths = filedialog.askopenfilenames(
+            parent=self.root, title=_("player_transfer_title"),
+            filetypes=[("CSV / JSON Lines", "*.csv *.jsonl *.ndjson"), ("All files", "*.*")])
+        if not paths: return
+
+        def work(cancel_event, on_rows):
+            db = self.player_db_manager
+            # Identidades antes das sessões: o recálculo feito após as sessões prevalece sobre os totais importados.
+            order = {"players": 0, "identities": 1, "sessions": 2}
+            jobs = sorted(((db.detect_import_table(p), p) for p in paths), key=lambda job: order[job[0]])
+            total_read = total_skipped = 0
+            for table, path in jobs:
+                _table, read, skipped, cancelled = db.import_file(
+                    path, table=table, cancel_event=cancel_event,
+                    progress_callback=lambda n, base=total_read: on_rows(base + n))
+                total_read += read
+                total_skipped += skipped
+                if cancelled: return None
+            return _("player_import_done", files=len(jobs), rows=total_read, skipped=total_skipped)
+
+        self._executar_transferencia_jogadores(work)
+
+    def _executar_transferencia_jogadores(self, work):
+        """ Executa work(cancel_event, on_rows) em uma thread, com uma janela de progresso não modal. """
+        _ = self.translator.get
+        if getattr(self, 'player_transfer_thread', None) and self.player_transfer_thread.is_alive():
+            self.show_messagebox_from_thread("info", _("player_transfer_title"), _("player_transfer_running"))
+            return
+        self.player_transfer_cancel = threading.Event()
+        win = ttk.Toplevel(self.root)
+        win.title(_("player_transfer_title"))
+        win.geometry("420x120")
+        win.resizable(False, False)
+        win.transient(self.root)
+        status_var = tk.StringVar(value=_("player_transfer_progress", rows=0))
+        ttk.Label(win, textvariable=status_var).pack(pady=(15, 5), padx=10, anchor='w')
+        progress = ttk.Progressbar(win, mode='indeterminate', length=400)
+        progress.pack(pady=5, padx=10)
+        progress.start(15)
+        ttk.Button(win, text=_("btn_cancel"), bootstyle=DANGER, command=self.player_transfer_cancel.set).pack(pady=5)
+        win.protocol("WM_DELETE_WINDOW", self.player_transfer_cancel.set)
+        last_update = [0.0]
+
+        def on_rows(rows):
+            now = time.monotonic()
+            if now - last_update[0] < 0.25 or self._shutting_down: return
+            last_update[0] = now
+            self.root.after(0, lambda: win.winfo_exists() and status_var.set(_("player_transfer_progress", rows=rows)))
+
+        def runner():
+            try:
+                message = work(self.player_transfer_cancel, on_rows)
+                self.show_messagebox_from_thread("info", _("player_transfer_title"),
+                                                 message or _("player_transfer_cancelled"))
+            except Exception as e:
+                app_logger.error(f"Erro na transferência do banco de jogadores: {e}", exc_info=True)
+                self.show_messagebox_from_thread("error", _("player_transfer_title"),
+                                                 _("player_transfer_error", error=e))
+            finally:
+                if not self._shutting_down: self.root.after(0, lambda: win.winfo_exists() and win.destroy())
+
+        self.player_transfer_thread = threading.Thread(target=runner, daemon=True, name="PlayerDBTransfer")
+        self.player_transfer_thread.start()
+
+    def reset_player_sessions_for_source(self, source):
+        """ Chamado quando uma aba passa a monitorar um novo arquivo de log (servidor reiniciado). """
+        if self.player_info_collector_enabled.get():
+            self.player_session_tracker.source_reset(source)
 
     def set_application_icon(self):
         if not os.path.exists(ICON_PATH):
@@ -3407,6 +8099,8 @@ def handle_unhandled_thread_exception(args):
 
 
 def main():
+    # Necessário para o ProcessPoolExecutor do backfill em executáveis PyInstaller/Nuitka no Windows.
+    multiprocessing.freeze_support()
     threading.excepthook = handle_unhandled_thread_exception
     if platform.system() == "Linux" and os.geteuid() != 0:
         print(
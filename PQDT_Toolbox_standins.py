@@ -0,0 +1,262 @@
+# ==============================================================================
+# Predadores Multi-Tool - Substitutos locais para testes manuais
+# Servidores e backends falsos que imitam os serviços externos usados pelo PQDT_Toolbox, para exercitar
+# a sondagem A2S, o RCon, o webhook e o controle de serviços sem servidores de jogo reais.
+# Não faz parte do executável: o PyInstaller/Nuitka empacota só o PQDT_Toolbox.py e este módulo
+# não é importado por ele.
+# ==============================================================================
+
+import json
+import queue
+import socket
+import struct
+import threading
+import http.server
+from collections import deque
+
+from PQDT_Toolbox import (
+    A2S_HEADER, A2S_INFO_REQUEST, app_logger, BattlEyeRConClient, ServiceBackend, systemd_unit_object_path)
+
+
+# ==============================================================================
+# CLASSE FakeServiceBackend - BACKEND DE SERVIÇOS EM MEMÓRIA
+# ==============================================================================
+class FakeServiceBackend(ServiceBackend):
+    """ Backend em memória (mesma ideia do FakeSystemdBus) para testar abas e reinícios sem serviços reais. """
+    name = "fake"
+    available = True
+    log_key = "fake"
+
+    def __init__(self, services=None, logger=app_logger):
+        super().__init__(logger)
+        self.states = dict(services or {})  # nome -> status
+        self.pids = {}
+        self._next_pid = 1000
+
+    def set_state(self, service_name, status):
+        self.states[service_name] = status
+        if status != "RUNNING": self.pids.pop(service_name, None)
+
+    def _query_status(self, service_name):
+        return self.states.get(service_name, "NOT_FOUND")
+
+    def _query_status_many(self, service_names):
+        return ({name: self._query_status(name) for name in service_names},
+                {name: self.pids.get(name) for name in service_names})
+
+    def _control(self, action, service_name):
+        if service_name not in self.states:
+            raise RuntimeError(f"Serviço '{service_name}' não existe.")
+        if action == "start":
+            self._next_pid += 1
+            self.states[service_name], self.pids[service_name] = "RUNNING", self._next_pid
+        else:
+            self.set_state(service_name, "STOPPED")
+
+    def _list_services(self):
+        return sorted(self.states)
+
+
+# ==============================================================================
+# CLASSE FakeSystemdBus - BARRAMENTO D-Bus DO systemd EM MEMÓRIA
+# ==============================================================================
+class FakeSystemdBus:
+    """
+    Barramento em memória com a mesma interface de JeepneySystemdBus, para testar o SystemdDBusWatcher
+    sem systemd: set_unit_state() altera uma unidade e enfileira o PropertiesChanged correspondente.
+    """
+
+    def __init__(self, units=None):
+        self.units = {}  # unidade -> [LoadState, ActiveState]
+        self._signals = queue.Queue()
+        for unit, active_state in (units or {}).items():
+            self.units[unit] = ["loaded", active_state]
+
+    def load_unit(self, unit):
+        load_state, active_state = self.units.get(unit, ["not-found", "inactive"])
+        return systemd_unit_object_path(unit), load_state, active_state
+
+    def set_unit_state(self, unit, active_state, sub_state=""):
+        self.units.setdefault(unit, ["loaded", active_state])[1] = active_state
+        self._signals.put((systemd_unit_object_path(unit), {"ActiveState": active_state, "SubState": sub_state}))
+
+    def receive(self, timeout):
+        try:
+            return self._signals.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def close(self):
+        pass
+
+
+# ==============================================================================
+# CLASSE A2SStandInServer - SERVIDOR A2S LOCAL
+# ==============================================================================
+class A2SStandInServer:
+    """
+    Servidor UDP local que responde A2S_INFO como um servidor de jogo (com desafio opcional), para testar
+    a sondagem sem um servidor real. 'frozen = True' simula um servidor travado (para de responder).
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, name="Stand-in", map_name="Everon", players=0,
+                 max_players=64, use_challenge=False):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((host, port))
+        self.sock.settimeout(0.2)
+        self.address = self.sock.getsockname()
+        self.name, self.map_name = name, map_name
+        self.players, self.max_players = players, max_players
+        self.use_challenge = use_challenge
+        self.frozen = False
+        self.queries = 0
+        self._challenge = b"\x01\x02\x03\x04"
+        self._stop = threading.Event()
+        self.thread = threading.Thread(target=self._serve, daemon=True, name="A2SStandInServer")
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self.thread.join(timeout=1)
+        self.sock.close()
+
+    def _info_payload(self):
+        strings = b"".join(s.encode("utf-8") + b"\x00" for s in (self.name, self.map_name, "reforger", "Arma Reforger"))
+        return (A2S_HEADER + b"I\x11" + strings
+                + struct.pack("<hBBBcc?", 0, self.players, self.max_players, 0, b"d", b"l", False))
+
+    def _serve(self):
+        while not self._stop.is_set():
+            try:
+                data, addr = self.sock.recvfrom(1400)
+            except (socket.timeout, OSError):
+                continue
+            if self.frozen or not data.startswith(A2S_INFO_REQUEST):
+                continue
+            self.queries += 1
+            if self.use_challenge and data[len(A2S_INFO_REQUEST):] != self._challenge:
+                self.sock.sendto(A2S_HEADER + b"A" + self._challenge, addr)
+            else:
+                self.sock.sendto(self._info_payload(), addr)
+
+
+# ==============================================================================
+# CLASSE BattlEyeRConStandIn - SERVIDOR BattlEye RCon LOCAL
+# ==============================================================================
+class BattlEyeRConStandIn:
+    """
+    Servidor RCon BattlEye local (UDP) para testar o cliente sem um servidor de jogo: valida a senha,
+    registra os comandos recebidos ('commands'), responde em várias partes quando a resposta é longa e
+    pode enviar mensagens de servidor ('broadcast'), contando as confirmações ('acks').
+    """
+    MAX_PART = 1000
+
+    def __init__(self, password, host="127.0.0.1", port=0, responses=None):
+        self.password = password
+        self.responses = responses or {}  # comando -> texto da resposta
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind((host, port))
+        self.sock.settimeout(0.2)
+        self.address = self.sock.getsockname()
+        self.commands = []
+        self.logins = 0
+        self.acks = 0
+        self.keepalives = 0
+        self.frozen = False
+        self._client = None
+        self._message_seq = 0
+        self._stop = threading.Event()
+        self.thread = threading.Thread(target=self._serve, daemon=True, name="BattlEyeRConStandIn")
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self.thread.join(timeout=1)
+        self.sock.close()
+
+    def broadcast(self, message):
+        if self._client:
+            seq, self._message_seq = self._message_seq, (self._message_seq + 1) % 256
+            self.sock.sendto(BattlEyeRConClient.packet(2, bytes([seq]) + message.encode("utf-8")), self._client)
+
+    def _serve(self):
+        packet = BattlEyeRConClient.packet
+        while not self._stop.is_set():
+            try:
+                data, addr = self.sock.recvfrom(65535)
+            except (socket.timeout, OSError):
+                continue
+            parsed = BattlEyeRConClient.parse_packet(data)
+            if parsed is None or self.frozen:
+                continue
+            kind, payload = parsed
+            if kind == 0:
+                ok = payload.decode("latin-1") == self.password
+                self.logins += 1
+                if ok: self._client = addr
+                self.sock.sendto(packet(0, b"\x01" if ok else b"\x00"), addr)
+            elif kind == 1 and addr == self._client:
+                seq, command = payload[0], payload[1:].decode("utf-8")
+                if not command:
+                    self.keepalives += 1
+                else:
+                    self.commands.append(command)
+                reply = self.responses.get(command, "").encode("utf-8")
+                chunks = [reply[i:i + self.MAX_PART] for i in range(0, len(reply), self.MAX_PART)] or [b""]
+                if len(chunks) == 1:
+                    self.sock.sendto(packet(1, bytes([seq]) + chunks[0]), addr)
+                else:
+                    for index in reversed(range(len(chunks))):  # fora de ordem, como pode ocorrer em UDP
+                        self.sock.sendto(packet(1, bytes([seq, 0, len(chunks), index]) + chunks[index]), addr)
+            elif kind == 2:
+                self.acks += 1
+
+
+# ==============================================================================
+# CLASSE WebhookStandInServer - RECEPTOR DE WEBHOOK LOCAL
+# ==============================================================================
+class WebhookStandInServer:
+    """
+    Servidor HTTP local que imita um webhook, para testar o WebhookNotifier: grava o JSON recebido em
+    'posts' e responde com os status de 'responses' (na ordem; depois 204), ex.: [503, (429, {"Retry-After": "1"})].
+    """
+
+    def __init__(self, responses=None):
+        self.posts = []
+        self.responses = deque(responses or [])
+        stand_in = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                status, headers = 204, {}
+                if stand_in.responses:
+                    reply = stand_in.responses.popleft()
+                    status, headers = reply if isinstance(reply, tuple) else (reply, {})
+                if status < 300: stand_in.posts.append(json.loads(body))
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/webhook"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True, name="WebhookStandInServer")
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()